@@ -0,0 +1,62 @@
+"""Binary encoding against pickle for caching decoded objects.
+
+Writes and reads back a list of rentals with pickle (as one list, and one object at a time) and with
+`BinaryWriter`/`BinaryReader`, reporting bytes per object and throughput of each. Pickling a whole list
+shares repeated strings through its memo, which per-object pickles and binary records cannot.
+
+Usage (from the repository root): python -m benchmarks.bench_binary [count]
+"""
+
+import io
+import json
+import pickle
+import sys
+import time
+
+from textverified.binary import BinaryReader, BinaryWriter
+from textverified.data import RenewableRentalExpanded
+
+from .bench_interning import inventory_json
+
+
+def rentals(count: int) -> list:
+    items = json.loads(inventory_json(count))
+    for item in items:
+        item.update(renewedThrough=item["createdAt"], refund={"canRefund": False})
+    return RenewableRentalExpanded.from_api_many(items)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(count: int = 100_000) -> None:
+    objects = rentals(count)
+
+    pickled, pickle_dump = timed(lambda: pickle.dumps(objects, protocol=pickle.HIGHEST_PROTOCOL))
+    _, pickle_load = timed(lambda: pickle.loads(pickled))
+    # Pickling objects one by one, as a per-object cache or message queue would
+    pickled_each, each_dump = timed(lambda: [pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL) for obj in objects])
+    _, each_load = timed(lambda: [pickle.loads(data) for data in pickled_each])
+    each_size = sum(map(len, pickled_each))
+
+    def write() -> bytes:
+        stream = io.BytesIO()
+        BinaryWriter(stream, RenewableRentalExpanded).write_all(objects)
+        return stream.getvalue()
+
+    encoded, binary_dump = timed(write)
+    decoded, binary_load = timed(lambda: list(BinaryReader(io.BytesIO(encoded), RenewableRentalExpanded)))
+    assert decoded == objects
+
+    print(f"{count:,} RenewableRentalExpanded")
+    print(f"{'':<14}{'B/object':>10}{'write (obj/s)':>16}{'read (obj/s)':>16}")
+    print(f"{'pickle':<14}{len(pickled) / count:>10.1f}{count / pickle_dump:>16,.0f}{count / pickle_load:>16,.0f}")
+    print(f"{'pickle/object':<14}{each_size / count:>10.1f}{count / each_dump:>16,.0f}{count / each_load:>16,.0f}")
+    print(f"{'binary':<14}{len(encoded) / count:>10.1f}{count / binary_dump:>16,.0f}{count / binary_load:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
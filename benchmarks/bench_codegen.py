@@ -0,0 +1,53 @@
+"""Objects per second of every generated `from_api`, `from_api_many` and `to_api`.
+
+Sample payloads are built from swagger.json with the generator's own API examples, so every
+generated dataclass is covered.
+
+Usage (from the repository root): python -m benchmarks.bench_codegen [name filter]
+"""
+
+import json
+import sys
+import timeit
+
+import networkx as nx
+
+from generate_enums import ObjectNode, create_dependency_graph
+from textverified import data
+
+
+def samples(swagger_path: str = "swagger.json") -> dict:
+    """Map each generated dataclass to an example API payload."""
+    with open(swagger_path, "r") as f:
+        swagger = json.load(f)
+
+    graph = create_dependency_graph(swagger.get("components", {}).get("schemas", {}))
+    result = dict()
+    for node_name in nx.topological_sort(graph):
+        node = graph.nodes[node_name]["node"]
+        cls = getattr(data, node.type_name, None) if isinstance(node, ObjectNode) else None
+        if cls is not None and hasattr(cls, "from_api"):
+            result[cls] = node.api_example
+    return result
+
+
+def rate(func, number: int) -> float:
+    """Calls per second, best of 3."""
+    return number / min(timeit.repeat(func, number=number, repeat=3))
+
+
+def main(name_filter: str = "") -> None:
+    print(f"{'class':<40}{'from_api (obj/s)':>18}{'from_api_many':>16}{'to_api (obj/s)':>18}")
+    for cls, payload in samples().items():
+        if name_filter.lower() not in cls.__name__.lower():
+            continue
+        instance = cls.from_api(payload)
+        page = [payload] * 100
+        decode = rate(lambda: cls.from_api(payload), 20_000)
+        decode_many = rate(lambda: cls.from_api_many(page), 200) * len(page)
+        encode = rate(instance.to_api, 20_000)
+        print(f"{cls.__name__:<40}{decode:>18,.0f}{decode_many:>16,.0f}{encode:>18,.0f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else "")
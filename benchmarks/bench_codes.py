@@ -0,0 +1,79 @@
+"""Messages per second of verification code extraction on a large corpus.
+
+Compares a naive loop (every regex tried on every message, compiled through the `re` cache) with
+`CodeExtractor.extract` and the batch `CodeExtractor.extract_many`, per service and on a mixed corpus.
+
+Usage (from the repository root): python -m benchmarks.bench_codes [corpus size]
+"""
+
+import datetime
+import random
+import re
+import sys
+import timeit
+
+from textverified.codes import DEFAULT_FALLBACK_PATTERNS, DEFAULT_PATTERNS, SERVICE_PATTERNS, CodeExtractor
+from textverified.data import Sms
+
+TEMPLATES = {
+    "google": ["G-{code} is your Google verification code.", "Your Google verification code is {code}"],
+    "whatsapp": ["Your WhatsApp code: {dashed}. Don't share this code with others"],
+    "other": [
+        "Your verification code is {code}. Do not share it.",
+        "{code} is your one-time passcode",
+        "Use PIN {code} to sign in. Ref 88123409",
+        "Welcome! Reply STOP to unsubscribe.",
+    ],
+}
+
+
+def corpus(size: int, service_name: str = None, seed: int = 0) -> list:
+    """Random SMS of a service (or of all services), without API parsed codes."""
+    rng = random.Random(seed)
+    created_at = datetime.datetime(2024, 5, 1, tzinfo=datetime.timezone.utc)
+    templates = TEMPLATES[service_name] if service_name else [t for group in TEMPLATES.values() for t in group]
+    messages = []
+    for i in range(size):
+        code = f"{rng.randrange(1_000_000):06d}"
+        text = rng.choice(templates).format(code=code, dashed=f"{code[:3]}-{code[3:]}")
+        messages.append(
+            Sms(id=f"sms_{i}", to_value="+12223334444", created_at=created_at, encrypted=False, sms_content=text)
+        )
+    return messages
+
+
+def naive_extract(messages: list, service_name: str = None) -> list:
+    """What callers did before: try every pattern on every message, in a fixed order."""
+    patterns = SERVICE_PATTERNS.get(service_name, []) + DEFAULT_PATTERNS + DEFAULT_FALLBACK_PATTERNS
+    codes = []
+    for msg in messages:
+        for pattern in patterns:
+            match = re.search(pattern, msg.sms_content)
+            if match:
+                codes.append("".join(group for group in match.groups() if group))
+                break
+        else:
+            codes.append(None)
+    return codes
+
+
+def rate(func, count: int) -> float:
+    """Messages per second, best of 3."""
+    return count / min(timeit.repeat(func, number=1, repeat=3))
+
+
+def main(size: int = 100_000) -> None:
+    print(f"{'corpus':<12}{'naive (msg/s)':>16}{'extract':>14}{'extract_many':>16}")
+    for service_name in ["google", "whatsapp", None]:
+        messages = corpus(size, service_name)
+        extractor = CodeExtractor()
+        assert extractor.extract_many(messages, service_name) == naive_extract(messages, service_name)
+
+        naive = rate(lambda: naive_extract(messages, service_name), size)
+        single = rate(lambda: [extractor.extract(msg, service_name) for msg in messages], size)
+        batch = rate(lambda: extractor.extract_many(messages, service_name), size)
+        print(f"{service_name or 'mixed':<12}{naive:>16,.0f}{single:>14,.0f}{batch:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,61 @@
+"""Decode throughput of timestamps and SMS pages.
+
+Compares dateutil against the generated `_parse_datetime` fast path, on the timestamp formats
+the API sends, then measures `Sms.from_api` and `Sms.from_api_many` on a realistic page of messages.
+
+Usage (from the repository root): python -m benchmarks.bench_datetime [repeat]
+"""
+
+import datetime
+import sys
+import timeit
+
+import dateutil.parser
+
+from textverified.data import Sms
+from textverified.data._base import _parse_datetime
+
+TIMESTAMPS = [
+    "2024-05-01T12:30:45.1234567Z",  # .NET precision
+    "2024-05-01T12:30:45.123456+00:00",
+    "2024-05-01T12:30:45Z",
+]
+
+
+def sms_page(size: int = 100) -> list:
+    """A page of SMS as returned by /api/pub/v2/sms."""
+    start = datetime.datetime(2024, 5, 1, tzinfo=datetime.timezone.utc)
+    return [
+        {
+            "id": f"sms_{i}",
+            "from": "+15556667777",
+            "to": "+12223334444",
+            "createdAt": (start + datetime.timedelta(seconds=i, microseconds=i)).isoformat().replace("+00:00", "Z"),
+            "smsContent": f"Your verification code is {100000 + i}",
+            "parsedCode": str(100000 + i),
+            "encrypted": False,
+        }
+        for i in range(size)
+    ]
+
+
+def rate(func, repeat: int) -> float:
+    """Calls per second, best of 5."""
+    return repeat / min(timeit.repeat(func, number=repeat, repeat=5))
+
+
+def main(repeat: int = 2_000) -> None:
+    for timestamp in TIMESTAMPS:
+        slow = rate(lambda: dateutil.parser.parse(timestamp), repeat)
+        fast = rate(lambda: _parse_datetime(timestamp), repeat)
+        print(f"{timestamp:<36}dateutil {slow:>11,.0f}/s   fast path {fast:>11,.0f}/s   x{fast / slow:.1f}")
+
+    page = sms_page()
+    pages_per_second = rate(lambda: [Sms.from_api(item) for item in page], max(repeat // 100, 1))
+    print(f"Sms.from_api: {pages_per_second * len(page):,.0f} messages/s ({len(page)}-item pages)")
+    pages_per_second = rate(lambda: Sms.from_api_many(page), max(repeat // 100, 1))
+    print(f"Sms.from_api_many: {pages_per_second * len(page):,.0f} messages/s ({len(page)}-item pages)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
@@ -0,0 +1,64 @@
+"""Memory saved by interning repeated string fields.
+
+Decodes a rental inventory from JSON (so every string occurrence is a separate object, as in real
+responses), with and without interning, and reports the retained memory of each.
+
+Usage (from the repository root): python -m benchmarks.bench_interning [count]
+"""
+
+import json
+import sys
+import tracemalloc
+
+from textverified.data import RenewableRentalCompact
+from textverified.interning import InternTable, interning
+
+
+def inventory_json(count: int) -> str:
+    """A JSON page of renewable rentals spread over a few services and billing cycles."""
+    services = ["yahoo", "google", "microsoft", "allservices", "discord"]
+    return json.dumps(
+        [
+            {
+                "createdAt": "2024-05-01T12:30:45.1234567Z",
+                "id": f"rental_{i}",
+                "saleId": f"sale_{i % 50}",
+                "serviceName": services[i % len(services)],
+                "state": "renewableActive",
+                "billingCycleId": f"billing_cycle_{i % 20}",
+                "isIncludedForNextRenewal": True,
+                "number": f"222333{i % 1000:04d}",
+                "alwaysOn": False,
+            }
+            for i in range(count)
+        ]
+    )
+
+
+def retained_bytes(raw: str, table: InternTable) -> int:
+    tracemalloc.start()
+    with interning(table):
+        rentals = RenewableRentalCompact.from_api_many(json.loads(raw))
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rentals
+    return retained
+
+
+def main(count: int = 100_000) -> None:
+    raw = inventory_json(count)
+    # A table that never admits a value leaves every string as decoded
+    plain = retained_bytes(raw, InternTable(max_size=1))
+    table = InternTable()
+    interned = retained_bytes(raw, table)
+    stats = table.stats()
+
+    print(f"{count:,} RenewableRentalCompact")
+    print(f"without interning: {plain / count:8.1f} B/object")
+    print(f"with interning:    {interned / count:8.1f} B/object ({1 - interned / plain:.0%} less)")
+    print(f"table: {stats.unique_values:,} unique values, {stats.references:,} references, ", end="")
+    print(f"{stats.bytes_saved / 2**20:.1f} MiB saved")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
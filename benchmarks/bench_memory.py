@@ -0,0 +1,65 @@
+"""Memory cost of the generated dataclasses.
+
+Compares bytes per object of the generated (slotted) classes against an equivalent plain
+`@dataclass(frozen=True)` class with a per-instance `__dict__`. Field values are shared between
+all instances, so only the per-object overhead is measured.
+
+Usage (from the repository root): python -m benchmarks.bench_memory [count]
+"""
+
+from dataclasses import fields, make_dataclass
+import datetime
+import sys
+import tracemalloc
+
+from textverified.data import RenewableRentalCompact, ReservationState, Sms
+
+SAMPLES = {
+    Sms: dict(
+        id="sms_id",
+        to_value="+12223334444",
+        created_at=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        encrypted=False,
+        from_value="+15556667777",
+        sms_content="Your code is 123456",
+        parsed_code="123456",
+    ),
+    RenewableRentalCompact: dict(
+        created_at=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        id="rental_id",
+        service_name="yahoo",
+        state=ReservationState.RENEWABLE_ACTIVE,
+        billing_cycle_id="billing_cycle_id",
+        is_included_for_next_renewal=True,
+        number="2223334444",
+        always_on=True,
+        sale_id="sale_id",
+    ),
+}
+
+
+def unslotted_equivalent(cls: type) -> type:
+    """Build a plain frozen dataclass with the same fields as `cls`."""
+    return make_dataclass(f"Unslotted{cls.__name__}", [(f.name, f.type) for f in fields(cls)], frozen=True)
+
+
+def bytes_per_object(cls: type, kwargs: dict, count: int) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [cls(**kwargs) for _ in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Do not count the list holding the objects
+    return (after - before - sys.getsizeof(objects)) / count
+
+
+def main(count: int = 100_000) -> None:
+    print(f"{'class':<24}{'dict (B/obj)':>14}{'slots (B/obj)':>15}{'saved':>8}")
+    for cls, kwargs in SAMPLES.items():
+        unslotted = bytes_per_object(unslotted_equivalent(cls), kwargs, count)
+        slotted = bytes_per_object(cls, kwargs, count)
+        print(f"{cls.__name__:<24}{unslotted:>14.1f}{slotted:>15.1f}{1 - slotted / unslotted:>8.0%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
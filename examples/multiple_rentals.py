@@ -1,22 +1,22 @@
-import pickle
-from textverified import TextVerified, NumberType, ReservationCapability, RentalDuration
+from textverified import TextVerified, NumberType, ReservationCapability, RentalDuration, RenewableRentalExpanded
+from textverified import BinaryReader, BinaryWriter
 
 # Data structure to store reservations
 reservations = list()
 
 
 # Save rentals to disk
-def save_rentals_to_disk(file_path="rentals.pkl"):
+def save_rentals_to_disk(file_path="rentals.bin"):
     with open(file_path, "wb") as file:
-        pickle.dump(reservations, file)
+        BinaryWriter(file, RenewableRentalExpanded).write_all(reservations)
 
 
 # Load rentals from disk
-def load_rentals_from_disk(file_path="rentals.pkl"):
+def load_rentals_from_disk(file_path="rentals.bin"):
     global reservations
     try:
         with open(file_path, "rb") as file:
-            reservations = pickle.load(file)
+            reservations = list(BinaryReader(file, RenewableRentalExpanded))
     except FileNotFoundError:
         print("No existing reservations file found. Starting fresh.")
 
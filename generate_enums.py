@@ -6,6 +6,7 @@ from enum import Enum
 from dataclasses import dataclass, field
 from itertools import chain
 import os
+import zlib
 import networkx as nx
 
 # String helper method to convert forms of strings between each other
@@ -84,8 +85,9 @@ class CompilerNode:
         """Snippet for converting this node to an API-compatible format."""
         return f"{instance_reference}.to_api()"
 
-    def get_from_api_method(self, args) -> str:
-        """Snippet for converting this node from an API-compatible format."""
+    def get_from_api_method(self, args, batch=False) -> str:
+        """Snippet for converting this node from an API-compatible format.
+        Batch snippets run inside `from_api_many`, where a memoized `parse_datetime` is in scope."""
         return f"{self.type_name}.from_api({args})"
 
     @property
@@ -115,8 +117,11 @@ class DtypeNode(CompilerNode):
     def get_to_api_method(self, instance_reference) -> str:
         return f"{instance_reference}"
 
-    def get_from_api_method(self, args) -> str:
-        return f"{self.type_name}({args})"
+    def get_from_api_method(self, args, batch=False) -> str:
+        # JSON already decodes str, int and bool; numbers may arrive as int and are converted to float
+        if self.dtype is float:
+            return f"float({args})"
+        return f"{args}"
 
     @property
     def api_example(self):
@@ -149,8 +154,10 @@ class DateTimeNode(CompilerNode):
     def get_to_api_method(self, instance_reference) -> str:
         return f"{instance_reference}.isoformat()"
 
-    def get_from_api_method(self, args) -> str:
-        return f"dateutil.parser.parse({args})"
+    def get_from_api_method(self, args, batch=False) -> str:
+        if batch:
+            return f"parse_datetime({args})"
+        return f"_parse_datetime({args})"
 
     @property
     def api_example(self):
@@ -194,17 +201,23 @@ class EnumNode(CompilerNode):
         enum_class += "\n"
         enum_class += f"    @classmethod\n"
         enum_class += f"    def from_api(cls, value: str) -> '{self.annotation_name}':\n"
-        enum_class += f"        for member in cls:\n"
-        enum_class += f"            if member.value.lower() == value.lower():\n"
-        enum_class += f"                return member\n"
-        enum_class += f"        raise ValueError(f'Unknown {self.name} value: {value}')\n"
+        enum_class += f"        try:\n"
+        enum_class += f"            return cls._api_lookup[value.casefold()]\n"
+        enum_class += f"        except KeyError:\n"
+        enum_class += f"            raise ValueError(f'Unknown {self.name} value: {{value}}') from None\n"
+        enum_class += "\n\n"
+
+        # Case-folded value lookup, attached after the class body so it is not turned into a member
+        enum_class += (
+            f"{self.type_name}._api_lookup = {{member.value.casefold(): member for member in {self.type_name}}}\n"
+        )
 
         return enum_class
 
     def get_to_api_method(self, instance_reference) -> str:
         return f"{instance_reference}.to_api()"
 
-    def get_from_api_method(self, args) -> str:
+    def get_from_api_method(self, args, batch=False) -> str:
         return f"{self.type_name}.from_api({args})"
 
     @property
@@ -216,6 +229,14 @@ class EnumNode(CompilerNode):
 class ObjectNode(CompilerNode):
     name: str = None
     properties: Dict[str, CompilerNode] = None
+    lazy_nested: bool = False
+    """If set, nested objects (and lists of objects) are kept as raw API data and decoded on first access."""
+    interned_fields: Set[str] = field(default_factory=set)
+    """API names of string properties whose values are shared through the current intern table."""
+    opt_in_interned_fields: Set[str] = field(default_factory=set)
+    """API names of string properties shared only through an intern table activated by the caller."""
+    memoized_json: bool = False
+    """If set, the class caches its encoded JSON body per instance, see `_MemoizedJson.to_json`."""
 
     def __post_init__(self):
         if self.name is None:
@@ -231,14 +252,27 @@ class ObjectNode(CompilerNode):
     def is_useful(self) -> bool:
         return len(self.properties) > 0
 
+    @property
+    def lazy_properties(self) -> Dict[str, CompilerNode]:
+        """Properties decoded on first access, if `lazy_nested` is set."""
+        if not self.lazy_nested:
+            return dict()
+        return {name: prop for name, prop in self.properties.items() if is_nested_object(prop)}
+
     def compile(self) -> str:
         # Move Optional properties to the bottom of the class
         optional_properties = {k: v for k, v in self.properties.items() if isinstance(v, OptionalNode)}
         self.properties = {k: v for k, v in self.properties.items() if not isinstance(v, OptionalNode)}
         self.properties.update(optional_properties)
 
-        obj_class = f"@dataclass(frozen=True)\n"
-        obj_class += f"class {self.type_name}:\n"
+        obj_class = str()
+        if self.lazy_properties:
+            obj_class += f"@_lazy_fields(\n"
+            for name, prop in self.lazy_properties.items():
+                obj_class += f"    {to_var_name(name)}=lambda value: {prop.get_from_api_method('value', batch=True)},\n"
+            obj_class += f")\n"
+        obj_class += f"@_frozen_dataclass\n"
+        obj_class += f"class {self.type_name}{'(_MemoizedJson)' if self.memoized_json else ''}:\n"
 
         # Docstring
         if self.description:
@@ -267,28 +301,112 @@ class ObjectNode(CompilerNode):
                 obj_class += f'"""\n\n'
         obj_class += "\n"
 
-        # Add to_api method
+        # Map of API keys to attribute names, for consumers working on raw API data
+        api_fields = ", ".join(f"{repr(name)}: {repr(to_var_name(name))}" for name in self.properties)
+        obj_class += f"    _api_fields = {{{api_fields}}}\n"
+        # Checked by the binary encoding, changes whenever the fields (or those of nested objects) change
+        obj_class += f"    _schema_version = {zlib.crc32(self.schema_signature.encode()):#010x}\n"
+        obj_class += "\n"
+
+        # Add to_api method, as a dict literal so the key tuple is a prebuilt constant
         obj_class += f"    def to_api(self) -> Dict[str, Any]:\n"
-        obj_class += f"        api_dict = dict()\n"
+        obj_class += f"        return {{\n"
         for name, prop in self.properties.items():
-            obj_class += f"        api_dict['{name}'] = {prop.get_to_api_method(f'self.{to_var_name(name)}')}\n"
-        obj_class += f"        return api_dict\n"
+            obj_class += f"            '{name}': {prop.get_to_api_method(f'self.{to_var_name(name)}')},\n"
+        obj_class += f"        }}\n"
         obj_class += "\n"
 
         # Add from_api method
+        assignments, arguments = self.get_from_api_arguments()
         obj_class += f"    @classmethod\n"
         obj_class += f"    def from_api(cls, data: Dict[str, Any]) -> '{self.annotation_name}':\n"
+        for assignment in assignments:
+            obj_class += f"        {assignment}\n"
         obj_class += f"        return cls(\n"
-        for name, prop in self.properties.items():
-            obj_class += f"            {to_var_name(name)}={prop.get_from_api_method(f'data.get({chr(34)}{name}{chr(34)}, None)')},\n"
+        for attribute, method in arguments.items():
+            obj_class += f"            {attribute}={method},\n"
         obj_class += f"        )\n"
+        obj_class += "\n"
+
+        # Add binary encoding methods
+        obj_class += f"    def to_bytes(self) -> bytes:\n"
+        obj_class += f"        return _binary_dumps(self)\n"
+        obj_class += "\n"
+        obj_class += f"    @classmethod\n"
+        obj_class += f"    def from_bytes(cls, data: bytes) -> '{self.annotation_name}':\n"
+        obj_class += f"        return _binary_loads(cls, data)\n"
+        obj_class += "\n"
+
+        # Add from_api_many method, decoding a whole page in one loop with memoized timestamps.
+        # Instances are filled through the slot setters, skipping the frozen __init__ for each item
+        assignments, arguments = self.get_from_api_arguments(batch=True)
+        setters = [f"set_{attribute}" for attribute in arguments]
+        obj_class += f"    @classmethod\n"
+        obj_class += f"    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['{self.annotation_name}']:\n"
+        if any("parse_datetime(" in line for line in chain(assignments, arguments.values())):
+            obj_class += f"        parse_datetime = _batch_datetime_parser()\n"
+        if any(method.startswith("intern(") for method in arguments.values()):
+            obj_class += f"        intern = _current_intern_table().intern\n"
+        if any(method.startswith("intern_opt_in(") for method in arguments.values()):
+            obj_class += f"        intern_opt_in = _opt_in_interner()\n"
+        obj_class += f"        {', '.join(setters)}, = cls._slot_setters\n"
+        obj_class += f"        new = object.__new__\n"
+        obj_class += f"        result = []\n"
+        obj_class += f"        append = result.append\n"
+        obj_class += f"        for data in items:\n"
+        for assignment in assignments:
+            obj_class += f"            {assignment}\n"
+        obj_class += f"            obj = new(cls)\n"
+        for setter, method in zip(setters, arguments.values()):
+            obj_class += f"            {setter}(obj, {method})\n"
+        obj_class += f"            append(obj)\n"
+        obj_class += f"        return result\n"
+        obj_class += "\n\n"
+        obj_class += f"{self.type_name}._slot_setters = _slot_setters({self.type_name})\n"
 
         return obj_class
 
+    @property
+    def schema_signature(self) -> str:
+        """Field names and types, including the signatures of nested objects."""
+        signatures = []
+        for name, prop in self.properties.items():
+            inner = prop.item_type if isinstance(prop, OptionalNode) else prop
+            inner = inner.item_type if isinstance(inner, ArrayNode) else inner
+            nested = inner.schema_signature if isinstance(inner, ObjectNode) else ""
+            signatures.append(f"{to_var_name(name)}:{prop.annotation_name}{nested}")
+        return f"{self.type_name}({','.join(signatures)})"
+
+    def get_from_api_arguments(self, batch=False) -> Tuple[List[str], Dict[str, str]]:
+        """Local assignments, and the value snippet of each attribute, of the from_api body.
+        Values used more than once (optional fields with a conversion) are read into a local first,
+        every other value is read inline, so each key is looked up exactly once."""
+        assignments, arguments = [], dict()
+        lazy_properties = self.lazy_properties
+        for name, prop in self.properties.items():
+            local = f"_{to_var_name(name)}"
+            method = prop.get_from_api_method(local, batch)
+            lookup = f"data.get({chr(34)}{name}{chr(34)})"
+            inner = prop.item_type if isinstance(prop, OptionalNode) else prop
+            if name in lazy_properties:
+                # Raw objects are stored as the dict itself, raw lists need a marker to tell them from parsed lists
+                method = f"_Unparsed({lookup})" if isinstance(inner, ArrayNode) else lookup
+            elif name in self.interned_fields and isinstance(inner, DtypeNode) and inner.dtype is str:
+                # Interning handles None, so optional and required strings are read the same way
+                method = f"intern({lookup})" if batch else f"_intern({lookup})"
+            elif name in self.opt_in_interned_fields and isinstance(inner, DtypeNode) and inner.dtype is str:
+                method = f"intern_opt_in({lookup})" if batch else f"_intern_opt_in({lookup})"
+            elif len(re.findall(rf"\b{local}\b", method)) > 1:
+                assignments.append(f"{local} = {lookup}")
+            else:
+                method = re.sub(rf"\b{local}\b", lambda _: lookup, method)
+            arguments[to_var_name(name)] = method
+        return assignments, arguments
+
     def get_to_api_method(self, instance_reference) -> str:
         return f"{instance_reference}.to_api()"
 
-    def get_from_api_method(self, args) -> str:
+    def get_from_api_method(self, args, batch=False) -> str:
         return f"{self.type_name}.from_api({args})"
 
     @property
@@ -324,12 +442,20 @@ class ArrayNode(CompilerNode):
 
     def get_to_api_method(self, instance_reference) -> str:
         # To convert an array to API format, we need to convert each item to its API format
-        return f"[{self.item_type.get_to_api_method(f'item')} for item in {instance_reference}]"
+        item_method = self.item_type.get_to_api_method("item")
+        if item_method == "item":
+            return f"list({instance_reference})"
+        return f"[{item_method} for item in {instance_reference}]"
 
-    def get_from_api_method(self, args):
+    def get_from_api_method(self, args, batch=False):
         # Create a list comprehension of the from api methods
         # Assumes that args is a list of items
-        return f"[{self.item_type.get_from_api_method(f'item')} for item in {args}]"
+        if batch and isinstance(self.item_type, ObjectNode):
+            return f"{self.item_type.type_name}.from_api_many({args})"
+        item_method = self.item_type.get_from_api_method("item", batch)
+        if item_method == "item":
+            return f"list({args})"
+        return f"[{item_method} for item in {args}]"
 
     @property
     def api_example(self):
@@ -361,16 +487,31 @@ class OptionalNode(CompilerNode):
         return str()
 
     def get_to_api_method(self, instance_reference) -> str:
-        return f"({self.item_type.get_to_api_method(instance_reference)} if {instance_reference} is not None else None)"
+        item_method = self.item_type.get_to_api_method(instance_reference)
+        if item_method == instance_reference:
+            return item_method
+        return f"({item_method} if {instance_reference} is not None else None)"
 
-    def get_from_api_method(self, args):
-        return f"({self.item_type.get_from_api_method(args)} if {args} is not None else None)"
+    def get_from_api_method(self, args, batch=False):
+        item_method = self.item_type.get_from_api_method(args, batch)
+        if item_method == args:
+            return item_method
+        return f"({item_method} if {args} is not None else None)"
 
     @property
     def api_example(self):
         return None
 
 
+def is_nested_object(node: CompilerNode) -> bool:
+    """Whether a node is an object, or a list of objects, possibly optional."""
+    if isinstance(node, OptionalNode):
+        node = node.item_type
+    if isinstance(node, ArrayNode):
+        node = node.item_type
+    return isinstance(node, ObjectNode)
+
+
 def create_dependency_graph(swagger_schema: dict, patterns_to_ignore=[r"^Link$", r"^PaginatedData\."]) -> nx.DiGraph:
     """Creates a graph representation of swagger schema nodes, with edges based on $ref links
     Nodes are either base nodes, with no properties, or object nodes with named properties.
@@ -623,6 +764,87 @@ def render_mock_call(graph, path: str, path_data: dict) -> str:
     return mock_call_json
 
 
+# Domain module of each generated class, first match wins; enums and unmatched classes go to "common"
+DOMAIN_MODULE_PATTERNS = [
+    ("webhooks", r"Webhook"),
+    ("sms", r"^Sms"),
+    ("calls", r"Call|Twilio"),
+    ("verifications", r"Verification"),
+    ("billing", r"BillingCycle"),
+    ("wake", r"Wake|UsageWindow"),
+    ("rentals", r"Rental|Reservation|BackOrder|LineHealth|AddOnSnapshot"),
+    ("services", r"^(Service|AreaCode)$"),
+]
+
+
+def domain_module(node: CompilerNode) -> str:
+    """Name of the generated module holding a class."""
+    if isinstance(node, ObjectNode):
+        for module, pattern in DOMAIN_MODULE_PATTERNS:
+            if re.search(pattern, node.type_name):
+                return module
+    return "common"
+
+
+def referenced_types(node: CompilerNode) -> Set[str]:
+    """Names of the generated classes used by the properties of an object."""
+    names = set()
+    for prop in getattr(node, "properties", {}).values():
+        while isinstance(prop, (OptionalNode, ArrayNode)):
+            prop = prop.item_type
+        if isinstance(prop, (ObjectNode, EnumNode)):
+            names.add(prop.type_name)
+    return names
+
+
+# Names every domain module imports from the shared helpers
+BASE_IMPORTS = """from enum import Enum
+from typing import Optional, Dict, List, Any
+import datetime
+from ._base import (
+    _Unparsed,
+    _batch_datetime_parser,
+    _binary_dumps,
+    _binary_loads,
+    _current_intern_table,
+    _frozen_dataclass,
+    _intern,
+    _intern_opt_in,
+    _lazy_fields,
+    _MemoizedJson,
+    _opt_in_interner,
+    _parse_datetime,
+    _slot_setters,
+)
+"""
+
+# PEP 562 module __getattr__, importing the domain module of a type on first access
+LAZY_MODULE_GETATTR = """def __getattr__(name):
+    module_name = _TYPE_MODULES.get(name, None)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+"""
+
+# Dataclasses whose nested objects are decoded on first access rather than in from_api
+LAZY_NESTED_PATTERNS = [r"Expanded$"]
+
+# String fields ("ClassName.apiName") that take few distinct values, decoded through the current intern table
+INTERNED_FIELD_PATTERNS = [r"\.serviceName$"]
+
+# String fields repeated within a listing but unbounded across an account (numbers, ids), decoded through an
+# intern table only when the caller activated one, so the process-wide table never accumulates them
+OPT_IN_INTERNED_FIELD_PATTERNS = [r"\.(number|to|from|billingCycleId|saleId)$"]
+
+# Request dataclasses reused across many calls, whose encoded JSON body is cached per instance
+MEMOIZED_JSON_PATTERNS = [r"^(NewVerification|NewRental|RentalPriceCheck|VerificationPriceCheck)Request$"]
+
 if __name__ == "__main__":
     import json
 
@@ -639,29 +861,230 @@ if __name__ == "__main__":
             compile_list.append(node)
 
     # Compile all nodes into Python classes
+    for node in compile_list:
+        if isinstance(node, ObjectNode):
+            node.lazy_nested = any(re.search(pattern, node.type_name) for pattern in LAZY_NESTED_PATTERNS)
+            node.memoized_json = any(re.search(pattern, node.type_name) for pattern in MEMOIZED_JSON_PATTERNS)
+            node.interned_fields = {
+                name
+                for name in node.properties
+                if any(re.search(pattern, f"{node.type_name}.{name}") for pattern in INTERNED_FIELD_PATTERNS)
+            }
+            node.opt_in_interned_fields = {
+                name
+                for name in node.properties
+                if any(re.search(pattern, f"{node.type_name}.{name}") for pattern in OPT_IN_INTERNED_FIELD_PATTERNS)
+            }
+
     os.makedirs("./textverified/data/", exist_ok=True)
-    with open("./textverified/data/dtypes.py", "w") as f:
+    with open("./textverified/data/_base.py", "w") as f:
         f.write(
             """
 \"\"\"
-Generated enums and dataclasses from Swagger schema
+Helpers shared by the generated enums and dataclasses
 This file is auto-generated. Do not edit manually.
 \"\"\"
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
 from typing import Optional, Dict, List, Any
 import datetime
 import dateutil.parser
+import json
+import re
+import sys
+from ..binary import dumps as _binary_dumps, loads as _binary_loads
+from ..interning import _intern, _intern_opt_in, _opt_in_interner, current_intern_table as _current_intern_table
+
+# ISO-8601 timestamps, as sent by the API: optional fraction of any precision, optional Z or +HH:MM offset
+_ISO_DATETIME = re.compile(r"(\\d{4}-\\d{2}-\\d{2}[T ]\\d{2}:\\d{2}:\\d{2})(?:\\.(\\d+))?(Z|[+-]\\d{2}:?\\d{2})?$")
+
+
+def _parse_datetime(value: str) -> datetime.datetime:
+    \"\"\"Parse an API timestamp. ISO-8601 goes through fromisoformat, anything else through dateutil.\"\"\"
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        pass
+
+    # Before 3.11, fromisoformat rejects Z, offsets without a colon, and fractions other than 3 or 6 digits
+    match = _ISO_DATETIME.match(value)
+    if match is not None:
+        base, fraction, offset = match.groups()
+        if fraction:
+            base += "." + fraction[:6].ljust(6, "0")
+        if offset == "Z":
+            offset = "+00:00"
+        elif offset and len(offset) == 5:
+            offset = offset[:3] + ":" + offset[3:]
+        try:
+            return datetime.datetime.fromisoformat(base + (offset or ""))
+        except ValueError:
+            pass
+    return dateutil.parser.parse(value)
+
+
+def _batch_datetime_parser():
+    \"\"\"Memoized _parse_datetime for one batch, so timestamps repeated across a page are parsed once.\"\"\"
+    cache = dict()
+
+    def parse_datetime(value: str) -> datetime.datetime:
+        parsed = cache.get(value)
+        if parsed is None:
+            parsed = cache[value] = _parse_datetime(value)
+        return parsed
+
+    return parse_datetime
+
+
+def _slots_getstate(self):
+    return tuple(getattr(self, f.name) for f in fields(self))
+
+
+def _slots_setstate(self, state):
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
+
+
+class _Unparsed:
+    \"\"\"Raw API list of a lazily decoded field. Raw objects are stored as plain dicts.\"\"\"
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+
+class _MemoizedJson:
+    \"\"\"Base of request dataclasses reused across many calls, caching their encoded JSON body per instance.\"\"\"
+
+    __slots__ = ("_json",)
+
+    def to_json(self) -> bytes:
+        \"\"\"Encode `to_api()` as JSON, once per instance.
+
+        The result is cached on first call, so list fields must not be modified in place afterwards.
+        \"\"\"
+        try:
+            return self._json
+        except AttributeError:
+            encoded = json.dumps(self.to_api(), separators=(",", ":"), allow_nan=False).encode("utf-8")
+            object.__setattr__(self, "_json", encoded)
+            return encoded
+
+
+class _LazyField:
+    \"\"\"Wraps the slot of a field, decoding a raw value on first access and caching it in the slot.\"\"\"
+
+    def __init__(self, slot, parse):
+        self.slot = slot
+        self.parse = parse
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, owner)
+        value_type = type(value)
+        if value_type is dict or value_type is _Unparsed:
+            value = self.parse(value if value_type is dict else value.data)
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+
+
+def _lazy_fields(**parsers):
+    \"\"\"Decode the given fields of a slotted dataclass lazily, each with its parser.\"\"\"
+
+    def decorate(cls):
+        for name, parse in parsers.items():
+            setattr(cls, name, _LazyField(cls.__dict__[name], parse))
+        return cls
+
+    return decorate
+
+
+def _slot_setters(cls) -> tuple:
+    \"\"\"Setters of each field's slot, in field order, used by batch decoders to fill instances directly.\"\"\"
+    return tuple(cls.__dict__[f.name].__set__ for f in fields(cls))
+
+
+def _frozen_dataclass(cls):
+    \"\"\"Frozen dataclass whose instances use __slots__ instead of a per-instance __dict__.\"\"\"
+    if sys.version_info >= (3, 11):
+        # 3.10 also has slots=True, but cannot unpickle frozen slotted classes
+        return dataclass(frozen=True, slots=True)(cls)
+
+    cls = dataclass(frozen=True)(cls)
+    names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value for key, value in cls.__dict__.items() if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+    namespace["__qualname__"] = cls.__qualname__
+    namespace["__getstate__"] = _slots_getstate
+    namespace["__setstate__"] = _slots_setstate
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
         """.strip()
         )
-        f.write("\n\n")
-        for node in compile_list:
-            compiled_code = node.compile()
-            if compiled_code.strip():
+        f.write("\n")
+
+    # Group the compiled classes into domain modules, each importing the classes it uses from the others
+    modules: Dict[str, List[Tuple[CompilerNode, str]]] = dict()
+    for node in compile_list:
+        compiled_code = node.compile()
+        if compiled_code.strip():
+            modules.setdefault(domain_module(node), []).append((node, compiled_code))
+
+    module_of = {node.type_name: module for module, nodes in modules.items() for node, _ in nodes}
+    imports = {module: dict() for module in modules}
+    for module, nodes in modules.items():
+        for node, _ in nodes:
+            for type_name in sorted(referenced_types(node)):
+                if module_of[type_name] != module:
+                    imports[module].setdefault(module_of[type_name], set()).add(type_name)
+
+    module_graph = nx.DiGraph([(module, other) for module in imports for other in imports[module]])
+    if not nx.is_directed_acyclic_graph(module_graph):
+        raise ValueError(f"Domain modules import each other in a cycle: {nx.find_cycle(module_graph)}")
+
+    for module, nodes in modules.items():
+        with open(f"./textverified/data/{module}.py", "w") as f:
+            f.write(f'"""\nGenerated {module} enums and dataclasses from Swagger schema\n')
+            f.write('This file is auto-generated. Do not edit manually.\n"""\n')
+            f.write(BASE_IMPORTS)
+            for other, type_names in sorted(imports[module].items()):
+                f.write(f"from .{other} import {', '.join(sorted(type_names))}\n")
+            f.write(f"\n__all__ = {[node.type_name for node, _ in nodes]}\n\n\n")
+            for _, compiled_code in nodes:
                 f.write(compiled_code)
                 f.write("\n\n")
-    print("Generating dtypes.py...")
+
+    # Every type, loaded on first access
+    with open("./textverified/data/__init__.py", "w") as f:
+        f.write('"""\nGenerated enums and dataclasses from Swagger schema, split into domain modules\n')
+        f.write("that are only imported when one of their types is first accessed.\n")
+        f.write('This file is auto-generated. Do not edit manually.\n"""\n')
+        f.write("import importlib\n\n")
+        f.write("_TYPE_MODULES = {\n")
+        for type_name, module in module_of.items():
+            f.write(f"    {type_name!r}: {module!r},\n")
+        f.write("}\n\n")
+        f.write("__all__ = list(_TYPE_MODULES)\n\n\n")
+        f.write(LAZY_MODULE_GETATTR)
+
+    # Former single module, kept for existing imports; loads every domain module
+    with open("./textverified/data/dtypes.py", "w") as f:
+        f.write('"""\nAll generated enums and dataclasses, for backwards compatibility.\n')
+        f.write("Importing this module loads every domain module; prefer importing from textverified.data.\n")
+        f.write('This file is auto-generated. Do not edit manually.\n"""\n')
+        f.write(BASE_IMPORTS)
+        for module in modules:
+            f.write(f"from .{module} import *\n")
+
+    print("Generating dtypes...")
     print("===============================")
+    print(f"Modules: {', '.join(modules)}")
     print(f"Total nodes: {len(compile_list)}")
     print(f"Total properties: {len(raw_graph.edges())}")
 
@@ -349,7 +349,8 @@ def mock_http_from_disk():
         mock.last_path_params = mock_file_data.get("path_params", {})
         mock.last_query_params = mock_file_data.get("query_params", {})
         mock.last_header_params = extracted_header_params
-        mock.last_body_params = kwargs.get("json", {})
+        body = kwargs.get("data", None)
+        mock.last_body_params = json.loads(body) if isinstance(body, bytes) else kwargs.get("json", {})
         mock.last_response = response_data.get("response", {})
 
         return _create_mock_response(response_data)
@@ -0,0 +1,55 @@
+import pytest
+from .fixtures import renewable_rental_expanded, verification_expanded, renewable_rental_compact
+from textverified.binary import BinaryReader, BinaryWriter
+from textverified.data import RenewableRentalCompact, RenewableRentalExpanded, Sms, VerificationExpanded
+import datetime
+import io
+import json
+
+
+def test_to_bytes_round_trip(renewable_rental_expanded, verification_expanded):
+    assert RenewableRentalExpanded.from_bytes(renewable_rental_expanded.to_bytes()) == renewable_rental_expanded
+    assert VerificationExpanded.from_bytes(verification_expanded.to_bytes()) == verification_expanded
+
+
+def test_to_bytes_preserves_timezones():
+    offset = datetime.timezone(datetime.timedelta(hours=-5))
+    for created_at in [datetime.datetime(2024, 5, 1, 12, 30, 45, 123456, tzinfo=offset), datetime.datetime(2024, 5, 1)]:
+        sms = Sms(id="sms_id", to_value="+1234567890", created_at=created_at, encrypted=False, sms_content="é" * 40)
+        restored = Sms.from_bytes(sms.to_bytes())
+        assert restored == sms
+        assert restored.created_at.utcoffset() == created_at.utcoffset()
+
+
+def test_to_bytes_is_smaller_than_to_api_json(renewable_rental_expanded):
+    assert len(renewable_rental_expanded.to_bytes()) < len(json.dumps(renewable_rental_expanded.to_api()))
+
+
+def test_from_bytes_rejects_other_schema(renewable_rental_compact):
+    with pytest.raises(ValueError):
+        RenewableRentalExpanded.from_bytes(renewable_rental_compact.to_bytes())
+    with pytest.raises(ValueError):
+        RenewableRentalCompact.from_bytes(b"not binary data")
+
+
+def test_stream_round_trip(renewable_rental_compact):
+    rentals = [renewable_rental_compact] * 3
+    stream = io.BytesIO()
+    writer = BinaryWriter(stream, RenewableRentalCompact)
+    writer.write_all(rentals)
+    with pytest.raises(ValueError):
+        writer.write(
+            Sms(id="sms_id", to_value="+1234567890", created_at=datetime.datetime(2024, 5, 1), encrypted=False)
+        )
+
+    stream.seek(0)
+    assert list(BinaryReader(stream, RenewableRentalCompact)) == rentals
+
+
+def test_stream_truncated(renewable_rental_compact):
+    stream = io.BytesIO()
+    BinaryWriter(stream, RenewableRentalCompact).write(renewable_rental_compact)
+
+    truncated = io.BytesIO(stream.getvalue()[:-1])
+    with pytest.raises(ValueError):
+        list(BinaryReader(truncated, RenewableRentalCompact))
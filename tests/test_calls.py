@@ -24,8 +24,12 @@ from textverified.data import (
     VerificationExpanded,
     ReservationType,
     Reservation,
+    Sms,
+    KeysetPaginationDirectionality,
 )
+from textverified.sms_api import SMSApi
 import datetime
+import threading
 from unittest.mock import patch
 
 
@@ -277,3 +281,101 @@ def test_open_call_session_invalid_reservation_non_string(tv):
     """Test that providing non-string reservation raises ValueError."""
     with pytest.raises(ValueError, match="reservation_id must be a valid ID or instance of Reservation/Verification"):
         tv.calls.open_call_session(123)
+
+
+def make_call(id: str, created_at: datetime.datetime, to_value: str = "+0987654321") -> Call:
+    return Call(id=id, from_value="+1234567890", to_value=to_value, created_at=created_at)
+
+
+def test_list_calls_reverse_direction(tv, mock_http_from_disk):
+    calls_list = tv.calls.list(to_number="+1234567890", direction=KeysetPaginationDirectionality.REVERSE)
+
+    assert mock_http_from_disk.call_args.kwargs["params"]["direction"] == "reverse"
+    assert len(list(calls_list)) == len(mock_http_from_disk.last_response["data"])
+
+
+@patch("time.sleep")
+def test_incoming_calls_stop_paging_at_seen_calls_and_resume(mock_sleep, tv):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    feed = [make_call(f"old_{i}", now - datetime.timedelta(hours=i + 1)) for i in range(100)]
+    consumed = 0
+
+    def mock_list_calls(*args, **kwargs):
+        nonlocal consumed
+        assert kwargs["direction"] == KeysetPaginationDirectionality.REVERSE
+        for call in feed:
+            consumed += 1
+            yield call
+
+    feed[:0] = [make_call("new_2", now + datetime.timedelta(seconds=2)), make_call("new_1", now)]
+    calls = tv.calls
+    calls.list = mock_list_calls
+    assert [call.id for call in calls.incoming(to_number="+0987654321", timeout=5.0, since=now)] == ["new_1", "new_2"]
+    assert consumed == 3
+
+    # A new CallAPI object of the same client picks up where the last call stopped
+    feed.insert(0, make_call("new_3", now + datetime.timedelta(seconds=3)))
+    calls = tv.calls
+    calls.list = mock_list_calls
+    assert [call.id for call in calls.incoming(to_number="+0987654321", timeout=5.0)] == ["new_3"]
+
+
+def test_call_watcher_routes_calls_with_one_request(tv, mock_http_from_disk):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    feed = [
+        make_call("call_2", now + datetime.timedelta(seconds=2), to_value="+12223334444"),
+        make_call("call_1", now + datetime.timedelta(seconds=1), to_value="+15556667777"),
+    ]
+    mock_http_from_disk.add_hook(
+        lambda response, method, url, **kwargs: {**response, "data": [x.to_api() for x in feed]}
+    )
+
+    watcher = tv.calls.watcher(since=now)
+    first = watcher.watch("+12223334444")
+    received = []
+    watcher.watch("15556667777", callback=received.append)
+
+    assert watcher.poll() == 2
+    assert mock_http_from_disk.call_count == 1
+    assert mock_http_from_disk.call_args.kwargs["url"].endswith("/api/pub/v2/calls")
+    assert first.get_nowait().id == "call_2"
+    assert [call.id for call in received] == ["call_1"]
+    assert watcher.poll() == 0
+
+    # The watcher's position is kept on the client, apart from the one of SMS watchers
+    assert tv.checkpoints.get(("call_watcher", None)).created_at == now + datetime.timedelta(seconds=2)
+    assert tv.checkpoints.get(("sms_watcher", None)) is None
+
+
+def test_inbound_merges_sms_and_calls_by_creation_time(tv):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    sms_polls = [
+        [
+            Sms(id="sms_3", to_value="+0987654321", created_at=now + datetime.timedelta(seconds=3), encrypted=False),
+            Sms(id="sms_1", to_value="+0987654321", created_at=now + datetime.timedelta(seconds=1), encrypted=False),
+        ],
+        [],
+    ]
+    call_polls = [
+        [make_call("call_2", now + datetime.timedelta(seconds=2))],
+        [
+            make_call("call_4", now + datetime.timedelta(seconds=4)),
+            make_call("call_2", now + datetime.timedelta(seconds=2)),
+        ],
+    ]
+    stop = threading.Event()
+
+    def mock_list_calls(*args, **kwargs):
+        if len(call_polls) == 1:
+            stop.set()
+        return call_polls.pop(0)
+
+    calls = tv.calls
+    calls.list = mock_list_calls
+    with patch.object(SMSApi, "list", side_effect=lambda *args, **kwargs: sms_polls.pop(0)):
+        items = list(calls.inbound(to_number="+0987654321", polling_interval=0, stop=stop, since=now))
+
+    assert [item.id for item in items] == ["sms_1", "call_2", "sms_3", "call_4"]
+    # Positions are shared with SMSApi.incoming and CallAPI.incoming of the same filters
+    assert tv.checkpoints.get(("sms", (("to", "+0987654321"),))).created_at == now + datetime.timedelta(seconds=3)
+    assert tv.checkpoints.get(("calls", (("to", "+0987654321"),))).created_at == now + datetime.timedelta(seconds=4)
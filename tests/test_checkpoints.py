@@ -0,0 +1,87 @@
+import pytest
+from textverified.textverified import TextVerified
+from textverified.checkpoints import CheckpointStore, FileCheckpointStore, SqliteCheckpointStore
+from textverified.high_water_mark import HighWaterMark
+from textverified.sms_api import SMSApi
+from textverified.data import Sms
+import datetime
+from unittest.mock import patch
+
+START = datetime.datetime(2024, 5, 1, 12, tzinfo=datetime.timezone.utc)
+
+
+def mark(seconds: int, *ids: str) -> HighWaterMark:
+    return HighWaterMark(created_at=START + datetime.timedelta(seconds=seconds), ids=frozenset(ids))
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def open_store(request, tmp_path):
+    if request.param == "file":
+        return lambda: FileCheckpointStore(str(tmp_path / "checkpoints.json"))
+    return lambda: SqliteCheckpointStore(str(tmp_path / "checkpoints.db"))
+
+
+def test_checkpoints_survive_reopening(open_store):
+    store = open_store()
+    store.put(("sms", (("to", "+12223334444"),)), mark(1, "sms_1"))
+    store.put(("sms", ()), mark(2, "sms_2"))
+    store.put(("sms", ()), mark(2, "sms_3"))
+
+    reopened = open_store()
+    assert len(reopened) == 2
+    assert reopened.get(("sms", (("to", "+12223334444"),))) == mark(1, "sms_1")
+    assert reopened.get(("sms", ())) == mark(2, "sms_2", "sms_3")
+
+    reopened.clear()
+    assert open_store().get(("sms", ())) is None
+
+
+def test_checkpoints_never_move_back():
+    store = CheckpointStore()
+    store.put("stream", mark(5, "sms_5"))
+    store.put("stream", mark(1, "sms_1"))
+
+    assert store.get("stream") == mark(5, "sms_5")
+
+
+def test_incoming_resumes_after_restart(tmp_path):
+    path = str(tmp_path / "checkpoints.json")
+    now = datetime.datetime.now(datetime.timezone.utc)
+    messages = [Sms(id="sms_1", to_value="+12223334444", created_at=now, encrypted=False)]
+
+    def restart() -> TextVerified:
+        return TextVerified(api_key="test-key", api_username="test-user", checkpoints=FileCheckpointStore(path))
+
+    with patch.object(SMSApi, "list", side_effect=lambda *args, **kwargs: list(reversed(messages))), patch(
+        "time.sleep"
+    ):
+        assert [msg.id for msg in restart().sms.incoming(to_number="+12223334444")] == ["sms_1"]
+
+        # Arrived while the consumer was down, at the same time as the message it already handled
+        messages.append(Sms(id="sms_2", to_value="+12223334444", created_at=now, encrypted=False))
+        sms_messages = list(restart().sms.incoming(to_number="+12223334444", timeout=0.5))
+
+    assert [msg.id for msg in sms_messages] == ["sms_2"]
+
+
+def test_stream_redelivers_message_interrupted_by_consumer_error(open_store):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    messages = [
+        Sms(id="sms_2", to_value="+12223334444", created_at=now + datetime.timedelta(seconds=2), encrypted=False),
+        Sms(id="sms_1", to_value="+12223334444", created_at=now + datetime.timedelta(seconds=1), encrypted=False),
+    ]
+
+    def restart() -> TextVerified:
+        return TextVerified(api_key="test-key", api_username="test-user", checkpoints=open_store())
+
+    with patch.object(SMSApi, "list", side_effect=lambda *args, **kwargs: messages):
+        handled = []
+        with pytest.raises(RuntimeError):
+            for msg in restart().sms.stream(polling_interval=0, timeout=5.0, since=now):
+                if msg.id == "sms_2":
+                    raise RuntimeError("consumer crashed")
+                handled.append(msg.id)
+
+        # The message being handled when the consumer failed is delivered again, the ones before it are not
+        resumed = restart().sms.incoming(polling_interval=0, timeout=5.0)
+        assert handled + [msg.id for msg in resumed] == ["sms_1", "sms_2"]
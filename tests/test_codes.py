@@ -0,0 +1,70 @@
+import pytest
+from textverified.codes import CodeExtractor
+from textverified.data import Sms
+import datetime
+
+
+def make_sms(content: str, parsed_code: str = None) -> Sms:
+    return Sms(
+        id="sms_1",
+        to_value="+12223334444",
+        created_at=datetime.datetime(2024, 5, 1, tzinfo=datetime.timezone.utc),
+        encrypted=False,
+        sms_content=content,
+        parsed_code=parsed_code,
+    )
+
+
+@pytest.mark.parametrize(
+    "text, code",
+    [
+        ("Your verification code is 482913. Do not share it.", "482913"),
+        ("Ref 99887766: your PIN: 1234", "1234"),
+        ("G-551234 is your Google verification code.", "551234"),
+        ("Your WhatsApp code: 123-456", "123456"),
+        ("Use 7781 to sign in to Example", "7781"),
+        ("Call +15556667777 for help", None),
+        ("Welcome aboard!", None),
+    ],
+)
+def test_extract_default_patterns(text, code):
+    assert CodeExtractor().extract(text) == code
+
+
+def test_parsed_code_is_used_unless_missing_from_text():
+    extractor = CodeExtractor()
+
+    assert extractor.extract(make_sms("Your code is 482913", parsed_code="482913")) == "482913"
+    assert extractor.extract(make_sms("Your code is 482913", parsed_code="777777")) == "482913"
+    assert extractor.extract(make_sms("Your code is 482913", parsed_code="482913"), use_parsed_code=False) == "482913"
+    assert extractor.extract(make_sms(None)) is None
+
+
+def test_service_patterns_are_tried_first():
+    extractor = CodeExtractor()
+    extractor.register("MyService", [r"token ([A-Z0-9]{6})"])
+    text = "Your token ABC123 expires in 10 minutes. Code 9999"
+
+    assert extractor.extract(text, service_name="myservice") == "ABC123"
+    assert extractor.extract(text, service_name="otherservice") == "9999"
+
+
+def test_extract_many_matches_extract():
+    extractor = CodeExtractor()
+    page = [make_sms(f"Your code is {100000 + i}") for i in range(50)] + [make_sms("G-123456 is your code")]
+
+    assert extractor.extract_many(page, service_name="google") == [
+        extractor.extract(msg, service_name="google") for msg in page
+    ]
+
+
+def test_extraction_does_not_depend_on_earlier_messages():
+    extractor = CodeExtractor()
+    first = extractor.extract("Your code is 482913 (order 1234)")
+    google = extractor.extract("G-551234 is your Google verification code.", service_name="google")
+
+    extractor.extract_many([f"Order B-{5555 + i} shipped" for i in range(10)])
+    extractor.extract_many([f"your pin {1000 + i}" for i in range(10)], service_name="google")
+
+    assert extractor.extract("Your code is 482913 (order 1234)") == first == "482913"
+    assert extractor.extract("G-551234 is your Google verification code.", service_name="google") == google == "551234"
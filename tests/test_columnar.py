@@ -0,0 +1,123 @@
+import pytest
+from .fixtures import tv, mock_http_from_disk
+from textverified.paginated_list import PaginatedList
+from textverified.columnar import to_columns
+from textverified.data import Sms, VerificationCompact
+from unittest.mock import Mock
+import datetime
+
+numpy = pytest.importorskip("numpy")
+
+sms_page = {
+    "data": [
+        {
+            "id": "sms_1",
+            "from": "+1111111111",
+            "to": "+1234567890",
+            "createdAt": "2024-01-01T00:00:00+00:00",
+            "smsContent": "Your code is 1234",
+            "parsedCode": "1234",
+            "encrypted": False,
+        },
+        {
+            "id": "sms_2",
+            "from": None,
+            "to": "+1234567890",
+            "createdAt": "2024-01-01T00:00:01.5Z",
+            "smsContent": None,
+            "parsedCode": None,
+            "encrypted": True,
+        },
+    ],
+    "hasNext": False,
+    "links": {},
+}
+
+
+def test_to_columns_does_not_parse_items(tv):
+    parse_item = Mock(side_effect=AssertionError("items should not be parsed"))
+    list_instance = PaginatedList(request_json=sms_page, parse_item=parse_item, api_context=tv)
+
+    table = to_columns(list_instance, item_type=Sms)
+
+    assert len(table) == 2
+    assert parse_item.call_count == 0
+    assert table["id"].tolist() == ["sms_1", "sms_2"]
+    assert table["encrypted"].dtype == bool
+    assert table["encrypted"].tolist() == [False, True]
+    assert table["created_at"].dtype == numpy.dtype("datetime64[us]")
+    assert table["created_at"][1] == numpy.datetime64("2024-01-01T00:00:01.500000")
+    assert table["from_value"].tolist() == ["+1111111111", None]
+
+
+def test_to_columns_interns_strings(tv):
+    list_instance = PaginatedList(request_json=sms_page, parse_item=Sms.from_api, api_context=tv)
+
+    table = list_instance.to_columns(["to_value"])
+
+    assert list(table.columns) == ["to_value"]
+    assert table["to_value"][0] is table["to_value"][1]
+
+
+def test_to_columns_streams_remaining_pages(tv, mock_http_from_disk):
+    sms_list = tv.sms.list()
+    first_page_size = len(mock_http_from_disk.last_response["data"])
+
+    table = sms_list.to_columns(["id", "created_at"])
+
+    assert len(table) == first_page_size
+    assert table["created_at"][0] == numpy.datetime64("1970-01-01T00:00:00")
+
+
+def test_to_columns_includes_parsed_items(tv):
+    list_instance = PaginatedList(request_json=sms_page, parse_item=Sms.from_api, api_context=tv)
+    assert next(list_instance).id == "sms_1"
+
+    table = list_instance.to_columns(["id", "parsed_code"])
+    assert table["id"].tolist() == ["sms_1", "sms_2"]
+    assert table["parsed_code"].tolist() == ["1234", None]
+
+
+def test_to_columns_unknown_column(tv):
+    list_instance = PaginatedList(request_json=sms_page, parse_item=Sms.from_api, api_context=tv)
+
+    with pytest.raises(ValueError):
+        list_instance.to_columns(["not_a_field"])
+
+
+def test_to_columns_enum_and_float(tv):
+    verification_page = {
+        "data": [
+            {
+                "id": "v1",
+                "createdAt": "2024-01-01T00:00:00+00:00",
+                "serviceName": "service",
+                "state": "verificationPending",
+                "totalCost": 1.5,
+                "number": "+1234567890",
+            }
+        ],
+        "hasNext": False,
+    }
+    list_instance = PaginatedList(
+        request_json=verification_page, parse_item=VerificationCompact.from_api, api_context=tv
+    )
+
+    table = list_instance.to_columns(["state", "total_cost"])
+    assert table["state"].tolist() == ["verificationPending"]
+    assert table["total_cost"].dtype == numpy.float64
+
+
+def test_to_pandas_and_arrow(tv):
+    list_instance = PaginatedList(request_json=sms_page, parse_item=Sms.from_api, api_context=tv)
+    table = list_instance.to_columns(["id", "created_at", "encrypted"])
+
+    pandas = pytest.importorskip("pandas")
+    frame = table.to_pandas()
+    assert str(frame["created_at"].dt.tz) == "UTC"
+    assert frame["id"].tolist() == ["sms_1", "sms_2"]
+
+    pytest.importorskip("pyarrow")
+    arrow_table = table.to_arrow()
+    assert arrow_table.num_rows == 2
+    assert arrow_table.schema.field("created_at").type.tz == "UTC"
@@ -0,0 +1,81 @@
+import pytest
+from .fixtures import tv
+from textverified.paginated_list import PaginatedList
+from textverified.interning import InternTable, interning, current_intern_table, process_intern_table
+from textverified.textverified import TextVerified
+from textverified.data import Sms, Service
+
+sms_json = {"to": "+1234567890", "createdAt": "2024-05-01T12:30:45Z", "encrypted": False, "from": "+1987654321"}
+
+
+def distinct_copy(value: str) -> str:
+    # Build an equal but separate str object, like json.loads does for every occurrence
+    return "".join(list(value))
+
+
+def test_intern_table_shares_equal_values():
+    table = InternTable()
+    first, second = distinct_copy("yahoo"), distinct_copy("yahoo")
+    assert first is not second
+
+    assert table.intern(first) is first
+    assert table.intern(second) is first
+    assert table.intern(None) is None
+
+    stats = table.stats()
+    assert stats.unique_values == 1
+    assert stats.references == 2
+    assert stats.bytes_saved > 0
+
+
+def test_intern_table_is_bounded():
+    table = InternTable(max_size=1)
+    table.intern("a")
+    value = distinct_copy("b")
+    assert table.intern(value) is value
+    assert len(table) == 1
+
+
+def test_interning_context_selects_table():
+    table = InternTable()
+    with interning(table):
+        assert current_intern_table() is table
+        sms = Sms.from_api(dict(sms_json, id="1", to=distinct_copy("+1234567890")))
+    assert current_intern_table() is process_intern_table()
+
+    assert table.stats().unique_values == 2  # to and from
+    assert Sms.from_api_many([dict(sms_json, id="2")])[0].to_value == sms.to_value
+
+
+def test_paginated_list_interns_into_own_table(tv):
+    items = [dict(sms_json, id=str(i), to=distinct_copy("+1234567890")) for i in range(3)]
+    list_instance = PaginatedList(request_json={"data": items}, parse_item=Sms.from_api, api_context=tv)
+    list_instance.intern_table = InternTable()
+
+    parsed = list_instance.get_all_items()
+
+    assert parsed[0].to_value is parsed[1].to_value is parsed[2].to_value
+    assert list_instance.intern_table.stats().references == 6
+
+
+def test_process_table_only_interns_low_cardinality_fields():
+    process_intern_table().clear()
+    Sms.from_api_many([dict(sms_json, id="1")])
+    Sms.from_api(dict(sms_json, id="2"))
+    assert len(process_intern_table()) == 0
+
+    first = Service.from_api({"serviceName": distinct_copy("yahoo"), "capability": "sms"})
+    second = Service.from_api({"serviceName": distinct_copy("yahoo"), "capability": "sms"})
+    assert first.service_name is second.service_name
+    assert len(process_intern_table()) == 1
+    process_intern_table().clear()
+
+
+def test_client_intern_table_is_opt_in():
+    items = [dict(sms_json, id=str(i), to=distinct_copy("+1234567890")) for i in range(2)]
+    tv = TextVerified(api_key="test-key", api_username="test-user", intern_table=InternTable())
+
+    parsed = PaginatedList(request_json={"data": items}, parse_item=Sms.from_api, api_context=tv).get_all_items()
+
+    assert parsed[0].to_value is parsed[1].to_value
+    assert tv.intern_table.stats().unique_values == 2  # to and from
@@ -0,0 +1,121 @@
+import pytest
+from .fixtures import mock_http_from_disk
+from textverified.textverified import TextVerified, BearerToken
+from textverified.page_cache import PageCache
+from textverified.action import _Action
+from textverified.data import Sms
+from unittest.mock import patch
+import datetime
+
+
+@pytest.fixture
+def tv_cached() -> TextVerified:
+    tv = TextVerified(api_key="test-key", api_username="test-user", page_cache_ttl=30.0)
+    tv.bearer = BearerToken(
+        "valid-token", expires_at=datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(seconds=3600)
+    )
+    return tv
+
+
+def test_page_cache_expires():
+    cache = PageCache(ttl=5.0)
+    action = _Action(method="GET", href="/api/pub/v2/sms")
+
+    with patch("time.monotonic", return_value=100.0):
+        cache.put(action, {"data": []}, params={"to": "+1234567890"})
+        assert cache.get(action, params={"to": "+1234567890"}) == {"data": []}
+        assert cache.get(action) is None  # different params
+
+    with patch("time.monotonic", return_value=105.0):
+        assert cache.get(action, params={"to": "+1234567890"}) is None
+    assert len(cache) == 0
+
+
+def test_page_cache_evicts_least_recently_used():
+    cache = PageCache(ttl=5.0, max_pages=2)
+    first, second, third = (_Action(method="GET", href=f"/page{i}") for i in range(3))
+
+    cache.put(first, 1)
+    cache.put(second, 2)
+    assert cache.get(first) == 1
+    cache.put(third, 3)
+
+    assert cache.get(second) is None
+    assert cache.get(first) == 1
+    assert cache.get(third) == 3
+
+
+def test_page_cache_invalid_ttl():
+    with pytest.raises(ValueError):
+        PageCache(ttl=0)
+
+
+def test_client_without_cache_refetches(tv_cached, mock_http_from_disk):
+    tv = TextVerified(api_key="test-key", api_username="test-user")
+    tv.bearer = tv_cached.bearer
+    assert tv.page_cache is None
+
+    tv.billing_cycles.list().get_all_items()
+    tv.billing_cycles.list().get_all_items()
+    assert mock_http_from_disk.call_count == 2
+
+
+def test_listings_share_cached_pages(tv_cached, mock_http_from_disk):
+    first = tv_cached.reservations.list_renewable().get_all_items()
+    second = tv_cached.reservations.list_renewable().get_all_items()
+
+    assert mock_http_from_disk.call_count == 1
+    assert first == second
+
+
+def test_cached_next_pages_are_reused(tv_cached, mock_http_from_disk):
+    from textverified.paginated_list import PaginatedList
+
+    def link_to_page2(response, method, url, **kwargs):
+        if url.endswith("/page1"):
+            return dict(response, hasNext=True, links={"next": {"method": "GET", "href": "/api/pub/v2/list/page2"}})
+        return response
+
+    mock_http_from_disk.add_hook(link_to_page2)
+    page1 = _Action(method="GET", href="/api/pub/v2/list/page1")
+    first = PaginatedList.from_action(page1, parse_item=lambda item: item["name"], api_context=tv_cached)
+    assert list(first) == ["Item 1", "Item 2", "Item 3", "Item 4"]
+    assert mock_http_from_disk.call_count == 2
+
+    second = PaginatedList.from_action(page1, parse_item=lambda item: item["name"], api_context=tv_cached)
+    assert list(second) == ["Item 1", "Item 2", "Item 3", "Item 4"]
+    assert mock_http_from_disk.call_count == 2
+
+
+def test_write_actions_clear_cache(tv_cached, mock_http_from_disk):
+    tv_cached.billing_cycles.list()
+    assert len(tv_cached.page_cache) == 1
+
+    tv_cached.billing_cycles.renew("billing_cycle_id")
+    assert len(tv_cached.page_cache) == 0
+
+
+def test_polled_listings_bypass_cache(tv_cached, mock_http_from_disk):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    new = Sms(id="sms_1", to_value="+12223334444", created_at=now + datetime.timedelta(seconds=1), encrypted=False)
+
+    # The message arrives after the first poll, while that poll's page would still be fresh in the cache
+    def arrives_on_second_poll(response, method, url, **kwargs):
+        feed = [new] if mock_http_from_disk.call_count > 1 else []
+        return {**response, "data": [x.to_api() for x in feed], "hasNext": False}
+
+    mock_http_from_disk.add_hook(arrives_on_second_poll)
+    messages = tv_cached.sms.incoming(timeout=5.0, polling_interval=0.01, since=now)
+    assert next(messages).id == "sms_1"
+    assert mock_http_from_disk.call_count == 2
+
+    watcher = tv_cached.sms.watcher(since=now)
+    watcher.watch("+12223334444")
+    assert watcher.poll() == 1
+    assert mock_http_from_disk.call_count == 3
+    assert len(tv_cached.page_cache) == 0
+
+    # Browsing still goes through the cache
+    tv_cached.sms.list().get_all_items()
+    tv_cached.sms.list().get_all_items()
+    assert mock_http_from_disk.call_count == 4
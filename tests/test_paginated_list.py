@@ -1,8 +1,10 @@
 import pytest
-from .fixtures import tv, mock_http_from_disk
+from .fixtures import tv, mock_http_from_disk, renewable_rental_expanded
 from textverified.textverified import TextVerified, BearerToken
-from textverified.paginated_list import PaginatedList
+from textverified.paginated_list import PaginatedList, PaginationCursor
 from textverified.action import _Action
+from textverified.data import Sms, RenewableRentalExpanded
+from unittest.mock import patch
 import datetime
 import json
 
@@ -69,3 +71,150 @@ def test_paginated_list_get_all(tv, mock_http_from_disk):
     all_items = list_instance.get_all_items()
     assert all_items == ["Item 1", "Item 2", "Item 3", "Item 4"]
     assert mock_http_from_disk.call_count == 1
+
+
+def test_paginated_list_next_page_link(tv, mock_http_from_disk):
+    list_instance = PaginatedList(
+        request_json=list_initial_response, parse_item=lambda item: item["name"], api_context=tv
+    )
+
+    assert list_instance.next_page == _Action(method="GET", href="/api/pub/v2/list/page2")
+    list_instance.get_all_items()
+    assert list_instance.next_page is None
+
+
+def test_paginated_list_from_action(tv, mock_http_from_disk):
+    list_instance = PaginatedList.from_action(
+        _Action(method="GET", href="/api/pub/v2/list/page2"), parse_item=lambda item: item["name"], api_context=tv
+    )
+
+    assert mock_http_from_disk.call_count == 1
+    assert list(list_instance) == ["Item 3", "Item 4"]
+
+
+def test_paginated_list_cursor_at_page_boundary(tv, mock_http_from_disk):
+    list_instance = PaginatedList(
+        request_json=list_initial_response, parse_item=lambda item: item["name"], api_context=tv
+    )
+
+    assert next(list_instance) == "Item 1"
+    assert next(list_instance) == "Item 2"
+
+    cursor = list_instance.cursor
+    assert cursor == PaginationCursor(next_page=_Action(method="GET", href="/api/pub/v2/list/page2"), position=2)
+    assert mock_http_from_disk.call_count == 0
+
+
+def test_paginated_list_cursor_mid_page_without_link(tv, mock_http_from_disk):
+    list_instance = PaginatedList(
+        request_json=list_initial_response, parse_item=lambda item: item["name"], api_context=tv
+    )
+
+    next(list_instance)
+    with pytest.raises(ValueError):
+        _ = list_instance.cursor
+
+
+def test_paginated_list_resume_from_cursor(tv, mock_http_from_disk):
+    list_instance = PaginatedList(
+        request_json=list_initial_response, parse_item=lambda item: item["name"], api_context=tv
+    )
+
+    # Consume into the second page, then checkpoint through a JSON round trip
+    assert [next(list_instance) for _ in range(3)] == ["Item 1", "Item 2", "Item 3"]
+    saved = json.dumps(list_instance.cursor.to_api())
+
+    cursor = PaginationCursor.from_api(json.loads(saved))
+    assert cursor.position == 3
+    assert cursor.skip == 1
+
+    resumed = PaginatedList.from_cursor(cursor, parse_item=lambda item: item["name"], api_context=tv)
+    assert list(resumed) == ["Item 4"]
+    assert resumed.cursor == PaginationCursor(next_page=None, position=4)
+
+
+def test_paginated_list_resume_from_exhausted_cursor(tv, mock_http_from_disk):
+    resumed = PaginatedList.from_cursor(
+        PaginationCursor(next_page=None, position=4), parse_item=lambda item: item["name"], api_context=tv
+    )
+
+    assert list(resumed) == []
+    assert mock_http_from_disk.call_count == 0
+
+
+def test_paginated_list_take_while_stops_fetching(tv, mock_http_from_disk):
+    list_instance = PaginatedList(
+        request_json=list_initial_response, parse_item=lambda item: item["name"], api_context=tv
+    )
+
+    assert list(list_instance.take_while(lambda item: item != "Item 2")) == ["Item 1"]
+    assert mock_http_from_disk.call_count == 0
+
+
+def test_paginated_list_created_since(tv, mock_http_from_disk):
+    start = datetime.datetime(2024, 5, 1, tzinfo=datetime.timezone.utc)
+
+    def sms_page(*seconds):
+        return {
+            "data": [
+                Sms(
+                    id=str(s), to_value="+1", created_at=start + datetime.timedelta(seconds=s), encrypted=False
+                ).to_api()
+                for s in seconds
+            ],
+            "hasNext": True,
+            "links": {"next": {"method": "GET", "href": "/api/pub/v2/list/page2"}},
+        }
+
+    # Newest first: stops within the first page
+    newest_first = PaginatedList(request_json=sms_page(5, 4, 1, 0), parse_item=Sms.from_api, api_context=tv)
+    assert [sms.id for sms in newest_first.created_since(start + datetime.timedelta(seconds=3))] == ["5", "4"]
+    assert mock_http_from_disk.call_count == 0
+
+    # Oldest first, as when the server ignores direction: filters the whole listing instead
+    mock_http_from_disk.add_hook(lambda response, method, url, **kwargs: {**sms_page(6, 7), "hasNext": False})
+    oldest_first = PaginatedList(request_json=sms_page(0, 1, 4, 5), parse_item=Sms.from_api, api_context=tv)
+    assert [sms.id for sms in oldest_first.created_since(start + datetime.timedelta(seconds=3))] == ["4", "5", "6", "7"]
+    assert mock_http_from_disk.call_count == 1
+
+    # Oldest first, starting with stale items that share a timestamp: ties prove no order
+    tied = PaginatedList(request_json=sms_page(0, 0, 1, 4), parse_item=Sms.from_api, api_context=tv)
+    assert [sms.id for sms in tied.created_since(start + datetime.timedelta(seconds=3))] == ["4", "6", "7"]
+
+
+def test_paginated_list_where(tv, mock_http_from_disk):
+    list_instance = PaginatedList(
+        request_json=list_initial_response, parse_item=lambda item: item["name"], api_context=tv
+    )
+
+    assert list(list_instance.where(lambda item: item.endswith(("1", "3")))) == ["Item 1", "Item 3"]
+    assert mock_http_from_disk.call_count == 1
+
+
+def test_paginated_list_where_ordered_stops_fetching(tv, mock_http_from_disk):
+    list_instance = PaginatedList(
+        request_json=list_initial_response, parse_item=lambda item: item["name"], api_context=tv
+    )
+
+    # Matches form one contiguous run, so the second page is never needed
+    assert list(list_instance.where(lambda item: item == "Item 1", ordered=True)) == ["Item 1"]
+    assert mock_http_from_disk.call_count == 0
+
+
+def test_paginated_list_uses_batch_decoder(tv):
+    sms_json = [
+        {"id": str(i), "to": "+1234567890", "createdAt": "2024-05-01T12:30:45.1234567Z", "encrypted": False}
+        for i in range(3)
+    ]
+    list_instance = PaginatedList(request_json={"data": sms_json}, parse_item=Sms.from_api, api_context=tv)
+
+    with patch.object(Sms, "from_api_many", wraps=Sms.from_api_many) as from_api_many:
+        items = list_instance.get_all_items()
+
+    from_api_many.assert_called_once()
+    assert items == [Sms.from_api(item) for item in sms_json]
+
+
+def test_batch_decoder_matches_from_api(renewable_rental_expanded):
+    api_json = renewable_rental_expanded.to_api()
+    assert RenewableRentalExpanded.from_api_many([api_json, api_json]) == [renewable_rental_expanded] * 2
@@ -0,0 +1,44 @@
+import pytest
+from textverified.polling import PollingPolicy
+
+
+def test_default_policy_polls_immediately_then_at_fixed_interval():
+    schedule = PollingPolicy(interval=2.0).schedule()
+
+    assert [schedule.next_delay(elapsed) for elapsed in (0, 0, 2, 4)] == [0.0, 2.0, 2.0, 2.0]
+
+
+def test_backoff_when_idle_is_capped_and_reset_by_activity():
+    schedule = PollingPolicy(interval=1.0, backoff=2.0, max_interval=5.0).schedule()
+
+    delays = [schedule.next_delay(0) for _ in range(6)]
+    assert delays == [0.0, 1.0, 2.0, 4.0, 5.0, 5.0]
+    assert schedule.next_delay(0, found=True) == 1.0
+
+
+def test_arrival_window_polls_faster_and_is_not_overslept():
+    schedule = PollingPolicy(interval=4.0, arrival_window=(5.0, 60.0), arrival_interval=0.5).schedule()
+
+    assert schedule.next_delay(0) == 0.0
+    assert schedule.next_delay(0) == 4.0
+    assert schedule.next_delay(4.0) == 1.0  # up to the window start
+    assert schedule.next_delay(5.0) == 0.5
+    assert schedule.next_delay(60.0) == 4.0
+
+
+def test_jitter_stays_within_bounds():
+    schedule = PollingPolicy(interval=10.0, jitter=0.2).schedule()
+    schedule.next_delay(0)
+
+    delays = [schedule.next_delay(0) for _ in range(200)]
+    assert all(8.0 <= delay <= 12.0 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"interval": -1}, {"backoff": 0.5}, {"jitter": 1.0}, {"arrival_window": (10, 5)}, {"max_interval": 0.5}],
+)
+def test_invalid_policy_raises(kwargs):
+    with pytest.raises(ValueError):
+        PollingPolicy(**kwargs)
@@ -1,5 +1,5 @@
 import pytest
-from .fixtures import tv, mock_http_from_disk, mock_http, dict_subset
+from .fixtures import tv, mock_http_from_disk, mock_http, dict_subset, renewable_rental_compact
 from textverified.textverified import TextVerified, BearerToken
 from textverified.action import _Action
 from textverified.data import (
@@ -20,8 +20,10 @@ from textverified.data import (
     ReservationSaleExpanded,
     RenewableRentalUpdateRequest,
     NonrenewableRentalUpdateRequest,
+    ReservationState,
 )
 import datetime
+import pickle
 
 
 def create_move_action_hook(nmethod, href):
@@ -101,6 +103,14 @@ def test_get_renewable_reservations(tv, mock_http_from_disk):
     )
 
 
+def test_get_renewable_reservations_by_billing_cycle(tv, mock_http_from_disk):
+    reservations = tv.reservations.list_renewable()
+    matches = list(reservations.where(billing_cycle_id="billing_cycle_id"))
+
+    assert mock_http_from_disk.call_args.kwargs["params"] == {"billingCycleId": "billing_cycle_id"}
+    assert len(matches) == len(mock_http_from_disk.last_response["data"])
+
+
 def test_get_nonrenewable_reservations(tv, mock_http_from_disk):
     reservations = tv.reservations.list_nonrenewable()
 
@@ -242,3 +252,19 @@ def test_extend_nonrenewable_reservation(tv, mock_http_from_disk):
     assert result is True
     assert mock_http_from_disk.last_body_params["extensionDuration"] == RentalDuration.THIRTY_DAY.value
     assert mock_http_from_disk.last_body_params["rentalId"] == rental_id
+
+
+def test_reservation_dataclass_is_slotted_and_picklable(renewable_rental_compact):
+    assert not hasattr(renewable_rental_compact, "__dict__")
+
+    restored = pickle.loads(pickle.dumps(renewable_rental_compact))
+    assert restored == renewable_rental_compact
+    assert restored is not renewable_rental_compact
+    assert hash(restored) == hash(renewable_rental_compact)
+
+
+def test_reservation_state_from_api_is_case_insensitive():
+    assert ReservationState.from_api("renewableActive") is ReservationState.RENEWABLE_ACTIVE
+    assert ReservationState.from_api("RENEWABLEACTIVE") is ReservationState.RENEWABLE_ACTIVE
+    with pytest.raises(ValueError, match="notAState"):
+        ReservationState.from_api("notAState")
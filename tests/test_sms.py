@@ -22,8 +22,13 @@ from textverified.data import (
     VerificationCompact,
     VerificationExpanded,
     ReservationType,
+    KeysetPaginationDirectionality,
 )
+from textverified.high_water_mark import HighWaterMark, SeenWindow
+from textverified.polling import PollingPolicy
+import asyncio
 import datetime
+import threading
 import time
 from unittest.mock import patch
 
@@ -108,6 +113,60 @@ def test_list_sms_by_verification_expanded(tv, mock_http_from_disk, verification
     )
 
 
+def test_list_sms_reverse_direction(tv, mock_http_from_disk):
+    sms_list = tv.sms.list(to_number="+1234567890", direction=KeysetPaginationDirectionality.REVERSE)
+
+    assert mock_http_from_disk.call_args.kwargs["params"]["direction"] == "reverse"
+    assert len(list(sms_list)) == len(mock_http_from_disk.last_response["data"])
+
+
+def test_list_sms_from_cursor(tv, mock_http_from_disk):
+    cursor = _Action(method="GET", href="/api/pub/v2/sms?cursor=abc")
+    sms_list = tv.sms.list(cursor=cursor)
+
+    assert mock_http_from_disk.call_args.kwargs["url"].endswith("/api/pub/v2/sms?cursor=abc")
+    assert all(isinstance(x, Sms) for x in sms_list)
+
+
+def test_list_sms_where_pushes_filters_to_server(tv, mock_http_from_disk):
+    sms_list = tv.sms.list(reservation_type=ReservationType.RENEWABLE)
+    matches = list(sms_list.where(to_value="+1234567890", reservation_id="reservation_123"))
+
+    params = mock_http_from_disk.call_args.kwargs["params"]
+    assert params == {"reservationType": "renewable", "to": "+1234567890", "reservationId": "reservation_123"}
+    assert len(matches) == len(mock_http_from_disk.last_response["data"])
+
+
+def test_list_sms_where_filters_locally(tv, mock_http_from_disk):
+    sms_list = tv.sms.list()
+    matches = list(sms_list.where(lambda msg: msg.encrypted, parsed_code="string"))
+
+    assert mock_http_from_disk.call_count == 1
+    assert matches == []
+
+
+def test_list_sms_cursor_with_filters_raises(tv):
+    cursor = _Action(method="GET", href="/api/pub/v2/sms?cursor=abc")
+    with pytest.raises(ValueError):
+        tv.sms.list(to_number="+1234567890", cursor=cursor)
+
+
+def test_sms_from_api_timestamps_match_dateutil():
+    import dateutil.parser
+
+    for timestamp in [
+        "2024-05-01T12:30:45.1234567Z",
+        "2024-05-01T12:30:45Z",
+        "2024-05-01T12:30:45.123+02:00",
+        "2024-05-01T12:30:45-0500",
+        "May 1 2024 12:30PM",
+    ]:
+        sms = Sms.from_api({"id": "sms_id", "to": "+1234567890", "createdAt": timestamp, "encrypted": False})
+        expected = dateutil.parser.parse(timestamp)
+        assert sms.created_at == expected
+        assert sms.created_at.utcoffset() == expected.utcoffset()
+
+
 @patch("time.sleep")
 @patch("time.monotonic")
 def test_incoming_sms_timeout(mock_monotonic, mock_sleep, tv, mock_http_from_disk):
@@ -160,3 +219,264 @@ def test_incoming_sms_with_messages(mock_sleep, tv, mock_http_from_disk):
     finally:
         # Restore original method
         tv.sms.list_sms = original_list_sms
+
+
+def make_sms(id: str, created_at: datetime.datetime) -> Sms:
+    return Sms(
+        id=id,
+        from_value="+1234567890",
+        to_value="+0987654321",
+        created_at=created_at,
+        sms_content="Test message",
+        parsed_code=None,
+        encrypted=False,
+    )
+
+
+@patch("time.sleep")
+def test_incoming_sms_stops_paging_at_seen_messages(mock_sleep, tv):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    history = [make_sms(f"old_{i}", now - datetime.timedelta(hours=i + 1)) for i in range(100)]
+    consumed = 0
+
+    def mock_list_sms(*args, **kwargs):
+        nonlocal consumed
+        assert kwargs["direction"] == KeysetPaginationDirectionality.REVERSE
+        for msg in [make_sms("new_2", now + datetime.timedelta(seconds=2)), make_sms("new_1", now)] + history:
+            consumed += 1
+            yield msg
+
+    sms = tv.sms
+    sms.list = mock_list_sms
+    sms_messages = list(sms.incoming(timeout=5.0, polling_interval=1.0, since=now))
+
+    assert [msg.id for msg in sms_messages] == ["new_1", "new_2"]
+    assert consumed == 3
+
+
+@patch("time.sleep")
+def test_incoming_sms_resumes_from_high_water_mark(mock_sleep, tv):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    messages = [make_sms("sms_1", now + datetime.timedelta(seconds=1))]
+
+    def mock_list_sms(*args, **kwargs):
+        return list(reversed(messages))
+
+    sms = tv.sms
+    sms.list = mock_list_sms
+    assert [msg.id for msg in sms.incoming(to_number="+0987654321", timeout=5.0)] == ["sms_1"]
+
+    # A new SMSApi object of the same client picks up where the last call stopped
+    messages.append(make_sms("sms_2", now + datetime.timedelta(seconds=2)))
+    sms = tv.sms
+    sms.list = mock_list_sms
+    assert [msg.id for msg in sms.incoming(to_number="+0987654321", timeout=5.0)] == ["sms_2"]
+
+
+def test_unseen_does_not_rely_on_listing_order():
+    now = datetime.datetime.now(datetime.timezone.utc)
+    oldest_first = [make_sms(f"sms_{i}", now + datetime.timedelta(seconds=i)) for i in range(-3, 3)]
+    mark = HighWaterMark(created_at=now)
+    window = SeenWindow(datetime.timedelta(seconds=60), mark)
+
+    assert [msg.id for msg in mark.unseen(oldest_first)] == ["sms_0", "sms_1", "sms_2"]
+    assert [msg.id for msg in window.unseen(oldest_first)] == ["sms_0", "sms_1", "sms_2"]
+    assert [msg.id for msg in mark.unseen(reversed(oldest_first))] == ["sms_0", "sms_1", "sms_2"]
+
+
+@patch("time.sleep")
+def test_incoming_sms_when_server_ignores_direction(mock_sleep, tv, mock_http_from_disk):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    # Oldest first, whatever direction was asked for
+    feed = [make_sms("old", now - datetime.timedelta(hours=1)), make_sms("new", now + datetime.timedelta(seconds=1))]
+    mock_http_from_disk.add_hook(
+        lambda response, method, url, **kwargs: {**response, "data": [x.to_api() for x in feed], "hasNext": False}
+    )
+
+    assert [msg.id for msg in tv.sms.incoming(timeout=5.0, since=now)] == ["new"]
+
+
+def test_sms_watcher_routes_messages_with_one_request(tv, mock_http_from_disk):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    feed = [
+        Sms(id="sms_2", to_value="+12223334444", created_at=now + datetime.timedelta(seconds=2), encrypted=False),
+        Sms(id="sms_1", to_value="+15556667777", created_at=now + datetime.timedelta(seconds=1), encrypted=False),
+        Sms(id="sms_0", to_value="+19998887777", created_at=now + datetime.timedelta(seconds=1), encrypted=False),
+    ]
+    mock_http_from_disk.add_hook(
+        lambda response, method, url, **kwargs: {**response, "data": [x.to_api() for x in feed]}
+    )
+
+    watcher = tv.sms.watcher(since=now)
+    first = watcher.watch("12223334444")
+    received = []
+    watcher.watch("+1 (555) 666-7777", callback=received.append)
+
+    assert watcher.poll() == 2
+    assert mock_http_from_disk.call_count == 1
+    assert mock_http_from_disk.call_args.kwargs["params"]["direction"] == "reverse"
+    assert first.get_nowait().id == "sms_2"
+    assert [msg.id for msg in received] == ["sms_1"]
+
+    # Already delivered messages are not delivered again, and unwatched numbers get nothing
+    watcher.unwatch("+12223334444")
+    assert watcher.poll() == 0
+    assert first.empty()
+    assert watcher.watched == ["15556667777"]
+
+
+def test_sms_watcher_background_thread(tv, mock_http_from_disk):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    sms = Sms(id="sms_1", to_value="+12223334444", created_at=now + datetime.timedelta(seconds=1), encrypted=False)
+    mock_http_from_disk.add_hook(lambda response, method, url, **kwargs: {**response, "data": [sms.to_api()]})
+
+    # Subscribe before the thread starts, or its first tick can pass the message while nobody watches its number
+    watcher = tv.sms.watcher(polling_interval=0.01, since=now)
+    messages = watcher.watch("+12223334444")
+    with watcher:
+        assert messages.get(timeout=5).id == "sms_1"
+
+    assert watcher.last_error is None
+
+
+def test_sms_watcher_failing_callback_does_not_block_other_subscribers(tv, mock_http_from_disk):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    feed = [
+        Sms(id="sms_2", to_value="+15556667777", created_at=now + datetime.timedelta(seconds=2), encrypted=False),
+        Sms(id="sms_1", to_value="+12223334444", created_at=now + datetime.timedelta(seconds=1), encrypted=False),
+    ]
+    mock_http_from_disk.add_hook(
+        lambda response, method, url, **kwargs: {**response, "data": [x.to_api() for x in feed]}
+    )
+    failed, received, other = [], [], []
+
+    def fail(msg):
+        failed.append(msg.id)
+        raise RuntimeError("handler failed")
+
+    watcher = tv.sms.watcher(since=now)
+    watcher.watch("+12223334444", callback=fail)
+    watcher.watch("+12223334444", callback=received.append)
+    watcher.watch("+15556667777", callback=other.append)
+
+    # Messages are counted once, however many subscribers they have
+    assert watcher.poll() == 2
+    assert isinstance(watcher.last_error, RuntimeError)
+    assert [msg.id for msg in received] == ["sms_1"]
+    assert [msg.id for msg in other] == ["sms_2"]
+
+    # The failed message is not retried, and does not hold back the checkpoint
+    assert watcher.poll() == 0
+    assert failed == ["sms_1"]
+    assert tv.checkpoints.get(("sms_watcher", None)).created_at == feed[0].created_at
+
+
+def test_stream_sms_until_stopped(tv):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    polls = [
+        [make_sms("sms_1", now + datetime.timedelta(seconds=1))],
+        [
+            make_sms("sms_2", now + datetime.timedelta(seconds=3)),
+            make_sms("sms_1", now + datetime.timedelta(seconds=1)),
+        ],
+        # Late arrival, older than the newest message but within the dedup window
+        [
+            make_sms("sms_2", now + datetime.timedelta(seconds=3)),
+            make_sms("sms_late", now + datetime.timedelta(seconds=2)),
+            make_sms("sms_1", now + datetime.timedelta(seconds=1)),
+        ],
+    ]
+    stop = threading.Event()
+
+    def mock_list_sms(*args, **kwargs):
+        if len(polls) == 1:
+            stop.set()
+        return polls.pop(0)
+
+    sms = tv.sms
+    sms.list = mock_list_sms
+    sms_messages = list(sms.stream(polling_interval=0, stop=stop, since=now))
+
+    assert [msg.id for msg in sms_messages] == ["sms_1", "sms_2", "sms_late"]
+
+
+def test_stream_sms_dedup_memory_is_bounded():
+    now = datetime.datetime.now(datetime.timezone.utc)
+    seen = SeenWindow(datetime.timedelta(seconds=60), HighWaterMark(created_at=now))
+
+    for i in range(10_000):
+        seen.add(now + datetime.timedelta(seconds=i), f"sms_{i}")
+
+    assert len(seen) == 61
+    assert seen.is_seen(now + datetime.timedelta(seconds=5), "sms_5")
+    assert not seen.is_seen(now + datetime.timedelta(seconds=9_999), "sms_new")
+
+
+@patch("time.sleep")
+def test_incoming_sms_polls_immediately_with_policy(mock_sleep, tv):
+    now = datetime.datetime.now(datetime.timezone.utc)
+
+    sms = tv.sms
+    sms.list = lambda *args, **kwargs: [make_sms("sms_1", now + datetime.timedelta(seconds=1))]
+    policy = PollingPolicy(interval=5.0, backoff=2.0)
+    sms_messages = list(sms.incoming(timeout=30.0, since=now, policy=policy))
+
+    assert [msg.id for msg in sms_messages] == ["sms_1"]
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.0]
+
+
+def test_aincoming_sms_does_not_block_the_event_loop(tv):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    polls = [[], [make_sms("sms_1", now + datetime.timedelta(seconds=1))]]
+
+    sms = tv.sms
+    sms.list = lambda *args, **kwargs: polls.pop(0)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    async def main():
+        ticking = asyncio.ensure_future(ticker())
+        sms_messages = [msg async for msg in sms.aincoming(timeout=5.0, polling_interval=0.05, since=now)]
+        ticking.cancel()
+        return sms_messages
+
+    sms_messages = asyncio.run(main())
+
+    assert [msg.id for msg in sms_messages] == ["sms_1"]
+    assert ticks > 1
+
+
+def test_aincoming_sms_polls_are_bounded_by_the_client_executor():
+    tv = TextVerified(api_key="test-key", api_username="test-user", async_workers=2)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    lock = threading.Lock()
+    running, most, threads = 0, 0, set()
+
+    def slow_list(*args, **kwargs):
+        nonlocal running, most
+        with lock:
+            running += 1
+            most = max(most, running)
+            threads.add(threading.current_thread().name)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return [make_sms(f"sms_{kwargs['to_number']}", now + datetime.timedelta(seconds=1))]
+
+    async def wait(to_number):
+        sms = tv.sms
+        sms.list = slow_list
+        return [msg.id async for msg in sms.aincoming(to_number=to_number, timeout=5.0, since=now)]
+
+    async def main():
+        return await asyncio.gather(*(wait(str(i)) for i in range(8)))
+
+    with tv:
+        assert asyncio.run(main()) == [[f"sms_{i}"] for i in range(8)]
+    assert most <= 2
+    assert all(name.startswith("textverified-async") for name in threads)
@@ -0,0 +1,91 @@
+import pytest
+from .fixtures import tv, renewable_rental_compact
+from textverified.data import Sms, KeysetPaginationDirectionality
+from textverified.sms_api import SMSApi
+import datetime
+from unittest.mock import patch
+
+START = datetime.datetime(2024, 5, 1, 12, tzinfo=datetime.timezone.utc)
+
+
+def make_sms(id: str, seconds: int, to_value: str = "+12223334444", parsed_code: str = None) -> Sms:
+    return Sms(
+        id=id,
+        to_value=to_value,
+        created_at=START + datetime.timedelta(seconds=seconds),
+        encrypted=False,
+        from_value="+15556667777",
+        sms_content=f"Your code is {parsed_code}",
+        parsed_code=parsed_code,
+    )
+
+
+@pytest.fixture
+def feed():
+    """SMS of the account, oldest first. Listings return them newest first, recording the ids walked in `listed`."""
+    messages = [
+        make_sms("sms_0", 0, to_value="+19998887777"),
+        make_sms("sms_1", 1, parsed_code="111111"),
+        make_sms("sms_2", 2, to_value="+19998887777"),
+    ]
+    listed = []
+
+    def mock_list_sms(*args, **kwargs):
+        assert kwargs["direction"] == KeysetPaginationDirectionality.REVERSE
+        for msg in reversed(messages):
+            listed.append(msg.id)
+            yield msg
+
+    with patch.object(SMSApi, "list", side_effect=mock_list_sms):
+        yield messages, listed
+
+
+@pytest.fixture
+def store(tv):
+    store = tv.sms.store()
+    yield store
+    store.close()
+
+
+def test_sync_stores_only_new_messages(store, feed):
+    messages, listed = feed
+    assert store.sync() == 3
+    listed.clear()
+
+    messages.append(make_sms("sms_3", 3, parsed_code="333333"))
+    assert store.sync() == 1
+    assert listed == ["sms_3", "sms_2", "sms_1"]  # stopped at the first message older than the previous sync
+    assert len(store) == 4
+    assert store.sync() == 0
+
+
+def test_query_by_number_time_and_code(store, feed):
+    messages, _ = feed
+    messages.append(make_sms("sms_3", 3, parsed_code="333333"))
+    store.sync()
+
+    assert [msg.id for msg in store.messages(to_number="+12223334444")] == ["sms_1", "sms_3"]
+    assert [msg.id for msg in store.messages(since=START + datetime.timedelta(seconds=2))] == ["sms_2", "sms_3"]
+    assert [msg.id for msg in store.messages(limit=1)] == ["sms_3"]
+    assert [msg.id for msg in store.messages(parsed_code="111111")] == ["sms_1"]
+    assert store.latest_code(to_number="+12223334444") == messages[3]
+
+
+def test_sync_through_reservation_records_it(store, feed, renewable_rental_compact):
+    messages, _ = feed
+    store.sync()
+    assert store.latest_code(reservation_id=renewable_rental_compact.id) is None
+
+    store.sync(renewable_rental_compact)
+    assert store.latest_code(reservation_id=renewable_rental_compact.id) == messages[1]
+
+
+def test_store_persists_to_disk(tmp_path, tv, feed):
+    messages, _ = feed
+    path = str(tmp_path / "sms.db")
+    with tv.sms.store(path) as on_disk:
+        on_disk.sync()
+
+    with tv.sms.store(path) as reopened:
+        assert reopened.messages() == messages
+        assert reopened.sync() == 0
@@ -4,6 +4,7 @@ from textverified.textverified import TextVerified, BearerToken
 from textverified.action import _Action
 from textverified.exceptions import TextVerifiedError
 import datetime
+import threading
 
 
 def test_bearer_get(tv_raw, mock_http_from_disk):
@@ -84,6 +85,46 @@ def test_no_leak_external_request(tv, mock_http):
     )
 
 
+def test_encoded_body_keeps_caller_headers(tv, mock_http):
+    mock_http.return_value.status_code = 200
+    action = _Action(method="POST", href="https://www.example.com/api/pub/v2/external-endpoint")
+
+    tv._perform_action(action, body=b'{"a":1}', headers={"X-Request-Id": "abc"})
+
+    mock_http.assert_called_once_with(
+        method="POST",
+        url="https://www.example.com/api/pub/v2/external-endpoint",
+        headers={"X-Request-Id": "abc", "Content-Type": "application/json", "User-Agent": tv.user_agent},
+        verify=True,
+        data=b'{"a":1}',
+    )
+
+
+def test_each_thread_has_its_own_session(tv):
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(tv.session))
+    thread.start()
+    thread.join()
+
+    assert tv.session is tv.session
+    assert sessions[0] is not tv.session
+    with pytest.raises(ValueError):
+        TextVerified(api_key="test-key", api_username="test-user", async_workers=0)
+
+
+def test_close_stops_executor_and_sessions():
+    with TextVerified(api_key="test-key", api_username="test-user", async_workers=1) as client:
+        session = client.session
+        executor = client.executor
+        assert client.executor is executor
+        executor.submit(lambda: client.session).result()
+
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+    assert client.session is not session
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("textverified-async")]
+
+
 def test_error_on_status_code_400(tv, mock_http):
     mock_http.return_value.status_code = 400
     mock_http.return_value.json.return_value = {
@@ -109,3 +150,39 @@ def test_error_on_status_code_400(tv, mock_http):
         headers={"Authorization": f"Bearer {tv.bearer.token}", "User-Agent": tv.user_agent},
         verify=True,
     )
+
+
+def test_data_types_load_their_module_on_first_access():
+    import subprocess
+    import sys
+
+    script = "; ".join(
+        [
+            "import sys, textverified",
+            "assert 'textverified.data.webhooks' not in sys.modules",
+            "from textverified import SmsWebhookEvent",
+            "assert SmsWebhookEvent.__module__ == 'textverified.data.webhooks'",
+            "assert 'textverified.data.webhooks' in sys.modules",
+            "from textverified.data.dtypes import SmsWebhookEvent as Legacy",
+            "assert Legacy is SmsWebhookEvent",
+        ]
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_import_loads_api_modules_on_first_access():
+    import subprocess
+    import sys
+
+    script = "; ".join(
+        [
+            "import sys, textverified",
+            "loaded = [m for m in sys.modules if m.startswith('textverified.') or m == 'requests']",
+            "assert loaded == ['textverified.interning', 'textverified.data'], loaded",
+            "from textverified import SMSApi, interning",
+            "assert SMSApi.__module__ == 'textverified.sms_api'",
+            "assert callable(interning)",
+            "assert 'textverified.data.sms' in sys.modules",
+        ]
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
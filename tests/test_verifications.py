@@ -1,5 +1,5 @@
 import pytest
-from .fixtures import tv, mock_http_from_disk, mock_http, dict_subset
+from .fixtures import tv, mock_http_from_disk, mock_http, dict_subset, verification_expanded
 from textverified.textverified import TextVerified, BearerToken
 from textverified.action import _Action
 from textverified.data import (
@@ -10,8 +10,11 @@ from textverified.data import (
     NumberType,
     VerificationCompact,
     VerificationExpanded,
+    CancelAction,
 )
 import datetime
+import pickle
+from unittest.mock import patch
 
 
 def create_move_action_hook(nmethod, href):
@@ -55,6 +58,30 @@ def test_get_verification_pricing(tv, mock_http_from_disk):
     assert dict_subset(pricing.to_api(), mock_http_from_disk.last_response) is None
 
 
+def test_reused_pricing_request_sends_cached_body(tv, mock_http_from_disk):
+    request = VerificationPriceCheckRequest(
+        service_name="test_service",
+        area_code=True,
+        carrier=True,
+        number_type=NumberType.MOBILE,
+        capability=ReservationCapability.SMS,
+    )
+
+    tv.verifications.pricing(request)
+    body = mock_http_from_disk.call_args.kwargs["data"]
+    tv.verifications.pricing(request)
+
+    assert mock_http_from_disk.call_args.kwargs["data"] is body
+    assert mock_http_from_disk.call_args.kwargs["headers"]["Content-Type"] == "application/json"
+    assert mock_http_from_disk.last_body_params == request.to_api()
+
+    # Unchanged requests are sent without building a copy to compare, overridden ones are rebuilt
+    with patch("textverified.verifications_api.VerificationPriceCheckRequest", side_effect=AssertionError):
+        tv.verifications.pricing(request)
+    tv.verifications.pricing(request, carrier=False)
+    assert mock_http_from_disk.last_body_params == {**request.to_api(), "carrier": False}
+
+
 def test_get_verification_details(tv, mock_http_from_disk):
     verification_id = "string"
     verification = tv.verifications.details(verification_id)
@@ -150,3 +177,19 @@ def test_report_verification_by_instance(tv, mock_http_from_disk):
     result = tv.verifications.report(verification)
 
     assert result is True
+
+
+def test_verification_expanded_decodes_nested_fields_lazily(verification_expanded):
+    api_json = verification_expanded.to_api()
+
+    with patch.object(CancelAction, "from_api", wraps=CancelAction.from_api) as cancel_from_api:
+        verification = VerificationExpanded.from_api(api_json)
+        assert verification.id == verification_expanded.id
+        cancel_from_api.assert_not_called()
+
+        assert verification.cancel == verification_expanded.cancel
+        assert verification.cancel is verification.cancel
+        cancel_from_api.assert_called_once()
+
+    assert verification == verification_expanded
+    assert pickle.loads(pickle.dumps(VerificationExpanded.from_api(api_json))) == verification_expanded
@@ -0,0 +1,269 @@
+import pytest
+from textverified.webhook_receiver import (
+    WebhookReceiver,
+    SMS_RECEIVED,
+    RESERVATION_CREATED,
+    BILLING_CYCLE_EXPIRED,
+)
+from textverified.data import (
+    LineReservationType,
+    WebhookEventSmsWebhookEvent,
+    WebhookEventReservationCreatedWebhookEvent,
+    WebhookEventBillingCycleWebhookEvent,
+)
+import asyncio
+import base64
+import hashlib
+import hmac
+import io
+import json
+import threading
+import urllib.error
+import urllib.request
+
+SECRET = "whsec_test"
+
+
+def sms_event(id: str = "evt_1", attempt: int = 1, content: str = "Your code is 123456") -> bytes:
+    return json.dumps(
+        {
+            "attempt": attempt,
+            "occurredAt": "2024-05-01T12:00:00Z",
+            "event": SMS_RECEIVED,
+            "id": id,
+            "data": {
+                "from": "+15550001111",
+                "to": "+12223334444",
+                "createdAt": "2024-05-01T12:00:00Z",
+                "smsContent": content,
+                "parsedCode": "123456",
+                "encrypted": False,
+                "reservationId": "rental_1",
+            },
+        }
+    ).encode()
+
+
+def sign(body: bytes, secret: str = SECRET) -> str:
+    return "HMAC-SHA512=" + base64.b64encode(hmac.new(secret.encode(), body, hashlib.sha512).digest()).decode()
+
+
+def collect(receiver: WebhookReceiver, event: str = "*") -> list:
+    events = []
+    receiver.on(event, events.append)
+    return events
+
+
+def test_parse_webhook_events():
+    sms = WebhookReceiver.parse(sms_event())
+    assert isinstance(sms, WebhookEventSmsWebhookEvent)
+    assert sms.data.to_value == "+12223334444"
+    assert sms.data.reservation_id == "rental_1"
+
+    created = WebhookReceiver.parse(
+        json.dumps(
+            {
+                "attempt": 1,
+                "occurredAt": "2024-05-01T12:00:00Z",
+                "event": RESERVATION_CREATED,
+                "id": "evt_2",
+                "data": {"id": "rental_2", "type": "rental"},
+            }
+        ).encode()
+    )
+    assert isinstance(created, WebhookEventReservationCreatedWebhookEvent)
+    assert created.data.type == LineReservationType.RENTAL
+
+    expired = WebhookReceiver.parse(
+        json.dumps(
+            {
+                "attempt": 1,
+                "occurredAt": "2024-05-01T12:00:00Z",
+                "event": BILLING_CYCLE_EXPIRED,
+                "id": "evt_3",
+                "data": {"billingCycleId": "cycle_1"},
+            }
+        ).encode()
+    )
+    assert isinstance(expired, WebhookEventBillingCycleWebhookEvent)
+
+    assert WebhookReceiver.parse(b'{"event": "v9.unknown", "id": "evt_4"}') is None
+    with pytest.raises(ValueError):
+        WebhookReceiver.parse(b"not json")
+    with pytest.raises(ValueError):
+        WebhookReceiver.parse(b'{"event": "v2.sms.received", "id": "evt_5"}')
+
+
+def test_signature_is_verified():
+    receiver = WebhookReceiver(secret=SECRET)
+    body = sms_event()
+    assert receiver.verify(body, sign(body))
+    assert not receiver.verify(body, sign(body, "whsec_other"))
+    assert not receiver.verify(body + b" ", sign(body))
+    assert not receiver.verify(body, None)
+
+    with receiver:
+        assert receiver.receive(body, sign(body, "whsec_other")) == 401
+        assert receiver.receive(b"not json", sign(b"not json")) == 400
+        assert receiver.receive(b'{"event": "v9.unknown"}', sign(b'{"event": "v9.unknown"}')) == 200
+
+
+def test_redeliveries_are_dispatched_once():
+    receiver = WebhookReceiver(secret=SECRET)
+    events = collect(receiver, SMS_RECEIVED)
+    everything = collect(receiver)
+    with receiver:
+        for body in [sms_event("evt_1"), sms_event("evt_1", attempt=2), sms_event("evt_2")]:
+            assert receiver.receive(body, sign(body)) == 200
+        receiver.join()
+
+    assert [event.id for event in events] == ["evt_1", "evt_2"]
+    assert everything == events
+
+
+def test_dedup_window_is_bounded():
+    receiver = WebhookReceiver(allow_unsigned=True, dedup_size=2)
+    events = collect(receiver)
+    with receiver:
+        for id in ["evt_1", "evt_2", "evt_3", "evt_1"]:
+            receiver.receive(sms_event(id), None)
+        receiver.join()
+
+    assert [event.id for event in events] == ["evt_1", "evt_2", "evt_3", "evt_1"]
+
+
+def test_saturated_workers_refuse_deliveries_until_drained():
+    release = threading.Event()
+    receiver = WebhookReceiver(allow_unsigned=True, workers=1, max_pending=1, submit_timeout=0)
+    events = []
+    receiver.on(SMS_RECEIVED, lambda event: (release.wait(5), events.append(event.id)))
+    with receiver:
+        assert receiver.receive(sms_event("evt_1"), None) == 200
+        # The worker holds evt_1, evt_2 fills the queue
+        while receiver.receive(sms_event("evt_2"), None) != 200:
+            pass
+        assert receiver.receive(sms_event("evt_3"), None) == 503
+
+        release.set()
+        receiver.join()
+        # The refused event is retried by TextVerified, and accepted once there is room
+        assert receiver.receive(sms_event("evt_3"), None) == 200
+        receiver.join()
+
+    assert events == ["evt_1", "evt_2", "evt_3"]
+
+
+def test_handler_errors_do_not_stop_workers():
+    receiver = WebhookReceiver(allow_unsigned=True, workers=1)
+    receiver.on(SMS_RECEIVED, lambda event: 1 / 0)
+    events = collect(receiver)
+    with receiver:
+        receiver.receive(sms_event("evt_1"), None)
+        receiver.receive(sms_event("evt_2"), None)
+        receiver.join()
+
+    assert isinstance(receiver.last_error, ZeroDivisionError)
+    assert [event.id for event in events] == ["evt_1", "evt_2"]
+
+
+def test_secret_is_required_unless_unsigned_allowed():
+    with pytest.raises(ValueError):
+        WebhookReceiver()
+    receiver = WebhookReceiver(allow_unsigned=True)
+    assert receiver.verify(sms_event(), None)
+
+
+def test_asgi_lifespan_stops_workers():
+    receiver = WebhookReceiver(secret=SECRET)
+    messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message["type"])
+
+    asyncio.run(receiver.asgi({"type": "lifespan"}, receive, send))
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("textverified-webhook-")]
+
+
+def test_unknown_event_handler_is_rejected():
+    with pytest.raises(ValueError):
+        WebhookReceiver(secret=SECRET).on("v2.sms.recieved", print)
+
+
+def test_wsgi_app():
+    receiver = WebhookReceiver(secret=SECRET)
+    events = collect(receiver)
+    body = sms_event()
+    statuses = []
+
+    def call(method: str, body: bytes, signature: str = None):
+        environ = {"REQUEST_METHOD": method, "CONTENT_LENGTH": str(len(body)), "wsgi.input": io.BytesIO(body)}
+        if signature is not None:
+            environ["HTTP_X_WEBHOOK_SIGNATURE"] = signature
+        receiver(environ, lambda status, headers: statuses.append(status))
+
+    with receiver:
+        call("POST", body, sign(body))
+        call("POST", body)
+        call("GET", b"")
+        receiver.join()
+
+    assert statuses == ["200 OK", "401 Unauthorized", "405 Method Not Allowed"]
+    assert [event.id for event in events] == ["evt_1"]
+
+
+def test_asgi_app():
+    receiver = WebhookReceiver(secret=SECRET)
+    events = collect(receiver)
+    body = sms_event()
+
+    async def call(chunks, signature):
+        messages = [
+            {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1} for i, chunk in enumerate(chunks)
+        ]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "method": "POST", "headers": [(b"x-webhook-signature", signature.encode())]}
+        await receiver.asgi(scope, receive, send)
+        return sent[0]["status"]
+
+    with receiver:
+        assert asyncio.run(call([body[:10], body[10:]], sign(body))) == 200
+        assert asyncio.run(call([body], sign(b"other"))) == 401
+        receiver.join()
+
+    assert [event.id for event in events] == ["evt_1"]
+
+
+def test_standalone_server():
+    receiver = WebhookReceiver(secret=SECRET)
+    events = collect(receiver)
+    body = sms_event()
+
+    def post(signature: str) -> int:
+        request = urllib.request.Request(
+            f"http://{host}:{port}/", data=body, headers={"X-Webhook-Signature": signature}, method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+
+    with receiver:
+        host, port = receiver.listen(port=0)
+        assert post(sign(body)) == 200
+        assert post(sign(body, "whsec_other")) == 401
+        receiver.join()
+
+    assert [event.id for event in events] == ["evt_1"]
@@ -12,32 +12,58 @@ Example usage:
     client = TextVerified(api_key="...", api_username="...")
 """
 
+import importlib
 import os
 import sys
-from typing import Optional
-
-# Import the main TextVerified class and API modules
-from .textverified import TextVerified, BearerToken
-from .account_api import AccountAPI
-from .billing_cycle_api import BillingCycleAPI
-from .reservations_api import ReservationsAPI
-from .sales_api import SalesAPI
-from .services_api import ServicesAPI
-from .sms_api import SMSApi
-from .verifications_api import VerificationsAPI
-from .wake_api import WakeAPI
-from .paginated_list import PaginatedList
-from .exceptions import TextVerifiedError
-
-# Import generated enums
-from .data import *
+from typing import Optional, TYPE_CHECKING
+
+# The main TextVerified class and API modules, imported from their module on first access
+_CLASS_MODULES = {
+    "TextVerified": "textverified",
+    "BearerToken": "textverified",
+    "AccountAPI": "account_api",
+    "BillingCycleAPI": "billing_cycle_api",
+    "ReservationsAPI": "reservations_api",
+    "SalesAPI": "sales_api",
+    "ServicesAPI": "services_api",
+    "SMSApi": "sms_api",
+    "SmsWatcher": "sms_watcher",
+    "CallWatcher": "call_watcher",
+    "SmsStore": "sms_store",
+    "CheckpointStore": "checkpoints",
+    "FileCheckpointStore": "checkpoints",
+    "SqliteCheckpointStore": "checkpoints",
+    "CodeExtractor": "codes",
+    "WebhookReceiver": "webhook_receiver",
+    "PollingPolicy": "polling",
+    "VerificationsAPI": "verifications_api",
+    "WakeAPI": "wake_api",
+    "PaginatedList": "paginated_list",
+    "PaginationCursor": "paginated_list",
+    "InternTable": "interning",
+    "InternStats": "interning",
+    "BinaryReader": "binary",
+    "BinaryWriter": "binary",
+    "TextVerifiedError": "exceptions",
+}
+
+# Shares its name with its (dependency-free) module, which would shadow it once imported
+from .interning import interning
+
+# Generated enums and dataclasses, imported from their domain module on first access
+from . import data
+
+if TYPE_CHECKING:
+    from .textverified import TextVerified
 
 # Configurable, lazy-initialized static instance
-_static_instance: Optional[TextVerified] = None
+_static_instance: Optional["TextVerified"] = None
 
 
-def _get_static_instance() -> TextVerified:
+def _get_static_instance() -> "TextVerified":
     """Get or create the static TextVerified instance."""
+    from .textverified import TextVerified
+
     global _static_instance
     if _static_instance is None:
         api_key = os.environ.get("TEXTVERIFIED_API_KEY")
@@ -65,12 +91,30 @@ def configure(
     user_agent: str = "TextVerified-Python-Client/0.1.0",
 ) -> None:
     """Configure the static TextVerified instance."""
+    from .textverified import TextVerified
+
     global _static_instance
     _static_instance = TextVerified(
         api_key=api_key, api_username=api_username, base_url=base_url, user_agent=user_agent
     )
 
 
+def __getattr__(name):
+    module_name = _CLASS_MODULES.get(name, None)
+    if module_name is not None:
+        value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    elif name in data.__all__:
+        value = getattr(data, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
 # Lazy property implementation using __getattr__ at module level
 class _LazyAPI:
     """
@@ -283,6 +327,21 @@ __all__ = [
     "TextVerified",
     "BearerToken",
     "PaginatedList",
+    "PaginationCursor",
+    "SmsWatcher",
+    "CallWatcher",
+    "SmsStore",
+    "CheckpointStore",
+    "FileCheckpointStore",
+    "SqliteCheckpointStore",
+    "CodeExtractor",
+    "WebhookReceiver",
+    "PollingPolicy",
+    "InternTable",
+    "InternStats",
+    "interning",
+    "BinaryReader",
+    "BinaryWriter",
     "TextVerifiedError",
     # Configuration
     "configure",
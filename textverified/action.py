@@ -14,15 +14,26 @@ class _ActionResponse:
 class _ActionPerformer:
     """Internal Protocol for objects that can perform API actions."""
 
-    def _perform_action(self, action: "_Action", **kwargs) -> _ActionResponse:
+    def _perform_action(self, action: "_Action", body: bytes = None, **kwargs) -> _ActionResponse:
         """
         Perform an API action and return the result.
         :param action: The action to perform
+        :param body: An already encoded JSON request body
         :return: Dictionary containing the API response
         """
         pass
 
 
+def _overrides_given(*values: Any) -> bool:
+    """Check whether any keyword argument overriding a caller's request object was given."""
+    return any(value is not None for value in values)
+
+
+def _reuse_request(data: Any, request: Any) -> Any:
+    """Keep the caller's request object when no keyword argument changed it, so its cached JSON body is reused."""
+    return data if data == request else request
+
+
 @dataclass(frozen=True)
 class _Action:
     """Single API action. Often returned by the API but also used internally."""
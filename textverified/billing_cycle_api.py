@@ -22,11 +22,8 @@ class BillingCycleAPI:
     def list(self) -> PaginatedList[BillingCycleCompact]:
         """Fetch all billing cycles associated with this account."""
         action = _Action(method="GET", href="/api/pub/v2/billing-cycles")
-        response = self.client._perform_action(action)
 
-        return PaginatedList(
-            request_json=response.data, parse_item=BillingCycleCompact.from_api, api_context=self.client
-        )
+        return PaginatedList.from_action(action, parse_item=BillingCycleCompact.from_api, api_context=self.client)
 
     def get(self, billing_cycle_id: str) -> BillingCycleExpanded:
         """Get the details of a billing cycle by ID.
@@ -115,10 +112,9 @@ class BillingCycleAPI:
             raise ValueError("billing_cycle_id must be a valid ID or instance of BillingCycleCompact/Expanded.")
 
         action = _Action(method="GET", href=f"/api/pub/v2/billing-cycles/{billing_cycle_id}/invoices")
-        response = self.client._perform_action(action)
 
-        return PaginatedList(
-            request_json=response.data, parse_item=BillingCycleRenewalInvoice.from_api, api_context=self.client
+        return PaginatedList.from_action(
+            action, parse_item=BillingCycleRenewalInvoice.from_api, api_context=self.client
         )
 
     def preview(
@@ -0,0 +1,336 @@
+"""Compact binary encoding of the generated dataclasses.
+
+Objects are encoded as MessagePack arrays of their field values, in field order, without field names.
+Timestamps use a MessagePack extension type holding microseconds since the epoch and the UTC offset,
+enums are stored as their API value and nested dataclasses as nested arrays.
+
+Every payload starts with a header naming the format version and the schema version of the class, so data
+written by a different version of the generated classes is rejected rather than decoded into wrong fields.
+
+Streams hold one header followed by length-prefixed records; use `BinaryWriter` and `BinaryReader` to cache
+large numbers of objects on disk or pass them between processes.
+"""
+
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any, BinaryIO, Callable, Dict, Generic, Iterable, Iterator, List, Optional, Type, TypeVar, Union
+import datetime
+import struct
+import typing
+
+T = TypeVar("T")
+
+MAGIC = b"TVB"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct(">3sBI")  # magic, format version, schema version
+_RECORD_LENGTH = struct.Struct(">I")
+_DATETIME_EXT = 1
+_DATETIME = struct.Struct(">qh")  # microseconds since the epoch (UTC), offset in minutes
+_NAIVE_OFFSET = -(2**15)  # offset marker for naive datetimes
+
+# (type code, struct format, lower bound, upper bound) of integers that do not fit a fixint, smallest first
+_INT_FORMATS = [
+    (0xCC, ">B", 0, 2**8),
+    (0xD0, ">b", -(2**7), 2**7),
+    (0xCD, ">H", 0, 2**16),
+    (0xD1, ">h", -(2**15), 2**15),
+    (0xCE, ">I", 0, 2**32),
+    (0xD2, ">i", -(2**31), 2**31),
+    (0xCF, ">Q", 0, 2**64),
+    (0xD3, ">q", -(2**63), 2**63),
+]
+_INT_SIZES = {code: size for code, size, _, _ in _INT_FORMATS}
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_NAIVE_EPOCH = datetime.datetime(1970, 1, 1)
+_ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+# MessagePack encoding
+
+
+def _pack_datetime(value: datetime.datetime) -> bytes:
+    if value.tzinfo is None:
+        return _DATETIME.pack((value - _NAIVE_EPOCH) // _ONE_MICROSECOND, _NAIVE_OFFSET)
+    offset = value.utcoffset() // datetime.timedelta(minutes=1)
+    return _DATETIME.pack((value - _EPOCH) // _ONE_MICROSECOND, offset)
+
+
+def _pack(value: Any, out: bytearray) -> None:
+    """Append the MessagePack encoding of a value to `out`."""
+    if value is None:
+        out.append(0xC0)
+    elif value is True:
+        out.append(0xC3)
+    elif value is False:
+        out.append(0xC2)
+    elif isinstance(value, Enum):
+        _pack(value.value, out)
+    elif isinstance(value, int):
+        if 0 <= value < 0x80:
+            out.append(value)
+        elif -0x20 <= value < 0:
+            out.append(value & 0xFF)
+        else:
+            for code, size, low, high in _INT_FORMATS:
+                if low <= value < high:
+                    out.append(code)
+                    out += struct.pack(size, value)
+                    break
+            else:
+                raise ValueError(f"Integer out of range for binary encoding: {value}")
+    elif isinstance(value, float):
+        out.append(0xCB)
+        out += struct.pack(">d", value)
+    elif isinstance(value, str):
+        encoded = value.encode("utf-8")
+        length = len(encoded)
+        if length < 32:
+            out.append(0xA0 | length)
+        elif length < 0x100:
+            out += bytes((0xD9, length))
+        elif length < 0x10000:
+            out.append(0xDA)
+            out += struct.pack(">H", length)
+        else:
+            out.append(0xDB)
+            out += struct.pack(">I", length)
+        out += encoded
+    elif isinstance(value, datetime.datetime):
+        out += bytes((0xC7, _DATETIME.size, _DATETIME_EXT))
+        out += _pack_datetime(value)
+    elif is_dataclass(value):
+        _pack_array([getattr(value, f.name) for f in fields(value)], out)
+    elif isinstance(value, (list, tuple)):
+        _pack_array(value, out)
+    else:
+        raise ValueError(f"Cannot encode value of type {type(value).__name__}")
+
+
+def _pack_array(values: List[Any], out: bytearray) -> None:
+    length = len(values)
+    if length < 16:
+        out.append(0x90 | length)
+    elif length < 0x10000:
+        out.append(0xDC)
+        out += struct.pack(">H", length)
+    else:
+        out.append(0xDD)
+        out += struct.pack(">I", length)
+    for item in values:
+        _pack(item, out)
+
+
+# MessagePack decoding
+
+
+def _unpack(data: bytes, offset: int):
+    """Decode the value at `offset`, returning it and the offset just past it."""
+    code = data[offset]
+    offset += 1
+    if code < 0x80:
+        return code, offset
+    elif code >= 0xE0:
+        return code - 0x100, offset
+    elif 0xA0 <= code <= 0xBF:
+        end = offset + (code & 0x1F)
+        return data[offset:end].decode("utf-8"), end
+    elif 0x90 <= code <= 0x9F:
+        return _unpack_array(data, offset, code & 0x0F)
+    elif code == 0xC0:
+        return None, offset
+    elif code == 0xC2:
+        return False, offset
+    elif code == 0xC3:
+        return True, offset
+    elif code in _INT_SIZES:
+        size = _INT_SIZES[code]
+        return struct.unpack_from(size, data, offset)[0], offset + struct.calcsize(size)
+    elif code == 0xCB:
+        return struct.unpack_from(">d", data, offset)[0], offset + 8
+    elif code in (0xD9, 0xDA, 0xDB):
+        size = {0xD9: ">B", 0xDA: ">H", 0xDB: ">I"}[code]
+        length = struct.unpack_from(size, data, offset)[0]
+        offset += struct.calcsize(size)
+        return data[offset : offset + length].decode("utf-8"), offset + length
+    elif code in (0xDC, 0xDD):
+        size = ">H" if code == 0xDC else ">I"
+        length = struct.unpack_from(size, data, offset)[0]
+        return _unpack_array(data, offset + struct.calcsize(size), length)
+    elif code == 0xC7:
+        length, ext_type = data[offset], data[offset + 1]
+        offset += 2
+        if ext_type != _DATETIME_EXT or length != _DATETIME.size:
+            raise ValueError(f"Unknown binary extension type: {ext_type}")
+        microseconds, minutes = _DATETIME.unpack_from(data, offset)
+        return _unpack_datetime(microseconds, minutes), offset + length
+    raise ValueError(f"Unsupported binary type code: {code:#x}")
+
+
+def _unpack_array(data: bytes, offset: int, length: int):
+    values = []
+    for _ in range(length):
+        value, offset = _unpack(data, offset)
+        values.append(value)
+    return values, offset
+
+
+def _unpack_datetime(microseconds: int, minutes: int) -> datetime.datetime:
+    if minutes == _NAIVE_OFFSET:
+        return _NAIVE_EPOCH + datetime.timedelta(microseconds=microseconds)
+    value = _EPOCH + datetime.timedelta(microseconds=microseconds)
+    if minutes == 0:
+        return value
+    return value.astimezone(datetime.timezone(datetime.timedelta(minutes=minutes)))
+
+
+# Rebuilding dataclasses from decoded arrays
+
+_builders: Dict[type, Callable[[list], Any]] = dict()
+
+
+def _converter(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """Function turning a decoded value back into `annotation`, or None if the decoded value is already right."""
+    origin = getattr(annotation, "__origin__", None)
+    if origin is Union:
+        inner = next(arg for arg in annotation.__args__ if arg is not type(None))
+        convert = _converter(inner)
+        if convert is None:
+            return None
+        return lambda value: convert(value) if value is not None else None
+    elif origin in (list, List):
+        convert = _converter(annotation.__args__[0])
+        if convert is None:
+            return None
+        return lambda values: [convert(value) for value in values]
+    elif isinstance(annotation, type) and issubclass(annotation, Enum):
+        return annotation
+    elif annotation is float:
+        return float
+    elif is_dataclass(annotation):
+        return _builder(annotation)
+    return None
+
+
+def _builder(cls: Type[T]) -> Callable[[list], T]:
+    """Function building an instance of `cls` from its decoded field array."""
+    build = _builders.get(cls, None)
+    if build is None:
+        hints = typing.get_type_hints(cls)
+        converters = [_converter(hints[f.name]) for f in fields(cls)]
+
+        def build(values: list) -> T:
+            return cls(*[value if convert is None else convert(value) for convert, value in zip(converters, values)])
+
+        _builders[cls] = build
+    return build
+
+
+# Public interface
+
+
+def _schema_version(cls: type) -> int:
+    schema_version = getattr(cls, "_schema_version", None)
+    if schema_version is None:
+        raise ValueError(f"{cls.__name__} does not support binary encoding.")
+    return schema_version
+
+
+def _check_header(cls: type, data: bytes) -> None:
+    if len(data) < _HEADER.size:
+        raise ValueError("Binary data is too short to hold a header.")
+    magic, format_version, schema_version = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not TextVerified binary data.")
+    if format_version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported binary format version: {format_version}")
+    if schema_version != _schema_version(cls):
+        raise ValueError(f"Binary data was written by a different schema version of {cls.__name__}.")
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode a generated dataclass instance, with a header.
+
+    Raises:
+        ValueError: If the object is not a generated dataclass.
+
+    Returns:
+        bytes: The encoded object.
+    """
+    out = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, _schema_version(type(obj))))
+    _pack(obj, out)
+    return bytes(out)
+
+
+def loads(cls: Type[T], data: bytes) -> T:
+    """Decode an instance of `cls` encoded by `dumps`.
+
+    Raises:
+        ValueError: If the data is malformed or was written for another schema version.
+
+    Returns:
+        T: The decoded object.
+    """
+    _check_header(cls, data)
+    values, _ = _unpack(data, _HEADER.size)
+    return _builder(cls)(values)
+
+
+class BinaryWriter(Generic[T]):
+    """Writes a stream of objects of one dataclass as a header followed by length-prefixed records.
+
+    Example:
+        with open("rentals.bin", "wb") as file:
+            BinaryWriter(file, RenewableRentalExpanded).write_all(rentals)
+    """
+
+    def __init__(self, stream: BinaryIO, cls: Type[T]):
+        self.stream = stream
+        self.cls = cls
+        self.stream.write(_HEADER.pack(MAGIC, FORMAT_VERSION, _schema_version(cls)))
+
+    def write(self, obj: T) -> None:
+        """Append one object to the stream."""
+        if not isinstance(obj, self.cls):
+            raise ValueError(f"Expected {self.cls.__name__}, got {type(obj).__name__}.")
+        record = bytearray()
+        _pack(obj, record)
+        self.stream.write(_RECORD_LENGTH.pack(len(record)))
+        self.stream.write(record)
+
+    def write_all(self, objs: Iterable[T]) -> None:
+        """Append every object of an iterable to the stream."""
+        for obj in objs:
+            self.write(obj)
+
+
+class BinaryReader(Generic[T]):
+    """Reads back, one at a time, the objects written by a `BinaryWriter`.
+
+    Example:
+        with open("rentals.bin", "rb") as file:
+            rentals = list(BinaryReader(file, RenewableRentalExpanded))
+    """
+
+    def __init__(self, stream: BinaryIO, cls: Type[T]):
+        self.stream = stream
+        self.cls = cls
+        _check_header(cls, stream.read(_HEADER.size))
+        self.__build = _builder(cls)
+
+    def __iter__(self) -> Iterator[T]:
+        return self
+
+    def __next__(self) -> T:
+        prefix = self.stream.read(_RECORD_LENGTH.size)
+        if not prefix:
+            raise StopIteration
+        if len(prefix) < _RECORD_LENGTH.size:
+            raise ValueError("Truncated binary stream.")
+        (length,) = _RECORD_LENGTH.unpack(prefix)
+        record = self.stream.read(length)
+        if len(record) < length:
+            raise ValueError("Truncated binary stream.")
+        values, _ = _unpack(record, 0)
+        return self.__build(values)
@@ -1,8 +1,9 @@
-from .action import _ActionPerformer, _Action
-from typing import List, Union
+from .action import _Action
+from typing import Iterator, Union
 from .paginated_list import PaginatedList
 from .data import (
     Call,
+    Sms,
     Reservation,
     NonrenewableRentalCompact,
     NonrenewableRentalExpanded,
@@ -12,14 +13,21 @@ from .data import (
     VerificationExpanded,
     ReservationType,
     TwilioCallingContextDto,
+    KeysetPaginationDirectionality,
 )
+from .feed_api import _FeedAPI, _Poller, _sleep
+from .call_watcher import CallWatcher
+from .polling import PollingPolicy
+import datetime
+import threading
 
 
-class CallAPI:
+class CallAPI(_FeedAPI):
     """API endpoints related to calls."""
 
-    def __init__(self, client: _ActionPerformer):
-        self.client = client
+    _name = "calls"
+    _href = "/api/pub/v2/calls"
+    _item = Call
 
     def list(
         self,
@@ -35,6 +43,8 @@ class CallAPI:
         *,
         to_number: str = None,
         reservation_type: ReservationType = None,
+        direction: KeysetPaginationDirectionality = None,
+        cache: bool = True,
     ) -> PaginatedList[Call]:
         """List calls to rentals and verifications associated with this account.
 
@@ -45,6 +55,8 @@ class CallAPI:
             data (Union[Reservation, NonrenewableRentalCompact, NonrenewableRentalExpanded, RenewableRentalCompact, RenewableRentalExpanded, VerificationCompact, VerificationExpanded], optional): A rental or verification object to get calls for. The phone number will be extracted from this object. Defaults to None.
             to_number (str, optional): Filter calls by the destination phone number. Cannot be used together with data parameter. Defaults to None.
             reservation_type (ReservationType, optional): Filter calls by reservation type (renewable, non-renewable, verification). Cannot be used when providing a data object. Defaults to None.
+            direction (KeysetPaginationDirectionality, optional): Order in which pages are walked, REVERSE for the newest calls first. Not part of the documented API, so the server may ignore it; use `PaginatedList.created_since` to stop at a lower bound regardless of the order returned. Defaults to None (server default, forward).
+            cache (bool, optional): Serve pages from the client's page cache, if it has one. Polling for new calls always bypasses it. Defaults to True.
 
         Raises:
             ValueError: If both data and to_number are provided, or if reservation_type is specified when using a rental/verification object.
@@ -52,55 +64,132 @@ class CallAPI:
         Returns:
             PaginatedList[Call]: A paginated list of calls matching the specified criteria.
         """
+        return self._list(data, to_number, reservation_type, direction, cache)
 
-        # Extract needed data from provided objects
-        reservation_id = None
-        if data and isinstance(
-            data,
-            (
-                NonrenewableRentalCompact,
-                NonrenewableRentalExpanded,
-                RenewableRentalCompact,
-                RenewableRentalExpanded,
-                VerificationCompact,
-                VerificationExpanded,
-            ),
-        ):
-            if to_number:
-                raise ValueError("Cannot specify both rental/verification data and to_number.")
-            to_number = data.number
-
-            if reservation_type is not None:
-                raise ValueError("Cannot specify reservation_type when using a rental or verification object.")
-
-        if isinstance(
-            data,
-            (
-                Reservation,
-                NonrenewableRentalCompact,
-                NonrenewableRentalExpanded,
-                RenewableRentalCompact,
-                RenewableRentalExpanded,
-            ),
-        ):
-            reservation_id = data.id
-
-        # Construct url params
-        params = dict()
-        if to_number:
-            params["to"] = to_number
-
-        if reservation_id:
-            params["reservationId"] = reservation_id
-
-        if isinstance(reservation_type, ReservationType):
-            params["reservationType"] = reservation_type.to_api()
-
-        # Construct and perform the action
-        action = _Action(method="GET", href="/api/pub/v2/calls")
-        response = self.client._perform_action(action, params=params)
-
-        return PaginatedList(request_json=response.data, parse_item=Call.from_api, api_context=self.client)
+    def watcher(
+        self,
+        *,
+        polling_interval: float = 1.0,
+        reservation_type: ReservationType = None,
+        since: datetime.datetime = None,
+        policy: PollingPolicy = None,
+    ) -> CallWatcher:
+        """Create a watcher delivering the incoming calls of many numbers, polling the account-wide feed once per tick.
+
+        Args:
+            polling_interval (float, optional): Time in seconds between polls of the background thread. Defaults to 1.0.
+            reservation_type (ReservationType, optional): Only watch calls of this reservation type. Defaults to None (all).
+            since (datetime.datetime, optional): Only deliver calls created after this timestamp. Defaults to the client's checkpoint of the feed, left by an earlier watcher, or datetime.datetime.now() if there is none.
+            policy (PollingPolicy, optional): When the background thread polls. Overrides polling_interval. Defaults to None (poll immediately, then every polling_interval seconds).
+
+        Returns:
+            CallWatcher: The watcher, not yet started. Use it as a context manager, or call `start`/`stop`.
+        """
+        return CallWatcher(
+            self.client,
+            polling_interval=polling_interval,
+            reservation_type=reservation_type,
+            since=since,
+            policy=policy,
+        )
+
+    def incoming(
+        self,
+        data: Union[
+            NonrenewableRentalCompact,
+            NonrenewableRentalExpanded,
+            RenewableRentalCompact,
+            RenewableRentalExpanded,
+            VerificationCompact,
+            VerificationExpanded,
+        ] = None,
+        *,
+        to_number: str = None,
+        reservation_type: ReservationType = None,
+        timeout: float = 10.0,
+        polling_interval: float = 1.0,
+        since: datetime.datetime = None,
+        policy: PollingPolicy = None,
+    ) -> Iterator[Call]:
+        """Wait for and yield incoming calls in real-time.
+
+        Works like `SMSApi.incoming`: polls until the first batch of new calls arrives or the timeout is reached,
+        walking the listing newest first down to the calls already seen, and resumes from the position kept per
+        stream on the client.
+
+        Args:
+            data (Union[NonrenewableRentalCompact, NonrenewableRentalExpanded, RenewableRentalCompact, RenewableRentalExpanded, VerificationCompact, VerificationExpanded], optional): A rental or verification object to monitor for incoming calls. Defaults to None.
+            to_number (str, optional): Filter incoming calls by destination phone number. Cannot be used together with data parameter. Defaults to None.
+            reservation_type (ReservationType, optional): Filter incoming calls by reservation type. Cannot be used when providing a data object. Defaults to None.
+            timeout (float, optional): Maximum time in seconds to wait for incoming calls. If negative, no timeout will be applied. Defaults to 10.0.
+            polling_interval (float, optional): Time in seconds between polling attempts. Defaults to 1.0.
+            since (datetime.datetime, optional): Only yield calls created after this timestamp. Calls already yielded by an earlier call are skipped regardless. Defaults to where the last call on the same stream stopped, or datetime.datetime.now() for a new stream.
+            policy (PollingPolicy, optional): When to poll, for backoff, jitter or faster polls while a call is expected. Overrides polling_interval. Defaults to None (poll immediately, then every polling_interval seconds).
+
+        Yields:
+            Call: New calls as they arrive.
+        """
+        policy = policy or PollingPolicy(interval=polling_interval)
+        poller = _Poller([self._feed(data, to_number, reservation_type, since, policy)], policy, timeout)
+
+        # wait up to [timeout] seconds for a NEW call
+        yield from poller.run(_sleep, first_batch=True)
+
+    def inbound(
+        self,
+        data: Union[
+            NonrenewableRentalCompact,
+            NonrenewableRentalExpanded,
+            RenewableRentalCompact,
+            RenewableRentalExpanded,
+            VerificationCompact,
+            VerificationExpanded,
+        ] = None,
+        *,
+        to_number: str = None,
+        reservation_type: ReservationType = None,
+        timeout: float = -1,
+        stop: threading.Event = None,
+        polling_interval: float = 1.0,
+        dedup_window: float = 300.0,
+        since: datetime.datetime = None,
+        policy: PollingPolicy = None,
+    ) -> Iterator[Union[Sms, Call]]:
+        """Yield incoming SMS and calls as one stream, continuously, until stopped or timed out.
+
+        Each poll lists the new SMS and the new calls, then yields both merged in order of `created_at`. Like
+        `SMSApi.stream`, items are deduplicated over a rolling window, and the positions of the SMS and call
+        streams are resumed from and kept on the client, shared with `SMSApi.incoming` and `incoming`.
+
+        Example:
+            for item in client.calls.inbound(verification, timeout=300):
+                if isinstance(item, Sms):
+                    print(item.parsed_code)
+                else:
+                    print(item.recording_uri)
+
+        Args:
+            data (Union[NonrenewableRentalCompact, NonrenewableRentalExpanded, RenewableRentalCompact, RenewableRentalExpanded, VerificationCompact, VerificationExpanded], optional): A rental or verification object to monitor. Defaults to None.
+            to_number (str, optional): Filter by destination phone number. Cannot be used together with data parameter. Defaults to None.
+            reservation_type (ReservationType, optional): Filter by reservation type. Cannot be used when providing a data object. Defaults to None.
+            timeout (float, optional): Time in seconds after which the stream ends. If negative, no timeout will be applied. Defaults to -1.
+            stop (threading.Event, optional): Ends the stream once set, even while waiting between polls. Defaults to None.
+            polling_interval (float, optional): Time in seconds between polling attempts. Defaults to 1.0.
+            dedup_window (float, optional): Time in seconds behind the newest item of each feed during which ids are remembered. Defaults to 300.0.
+            since (datetime.datetime, optional): Only yield items created after this timestamp. Items already yielded by an earlier call are skipped regardless. Defaults to where the last call on the same streams stopped, or datetime.datetime.now() for new streams.
+            policy (PollingPolicy, optional): When to poll, for backoff when idle, jitter or faster polls while items are expected. Overrides polling_interval. Defaults to None (poll immediately, then every polling_interval seconds).
+
+        Yields:
+            Union[Sms, Call]: New SMS and calls as they arrive, oldest first within each poll.
+        """
+        if stop is None:
+            stop = threading.Event()
+
+        policy = policy or PollingPolicy(interval=polling_interval)
+        feeds = [
+            api._feed(data, to_number, reservation_type, since, policy, dedup_window) for api in (self.client.sms, self)
+        ]
+        yield from _Poller(feeds, policy, timeout).run(stop.wait)
 
     def open_call_session(
         self,
@@ -0,0 +1,23 @@
+from .data import Call, KeysetPaginationDirectionality
+from .feed_watcher import _FeedWatcher
+from typing import Iterable
+
+
+class CallWatcher(_FeedWatcher):
+    """Watches any number of phone numbers with a single polling loop over the account-wide call feed.
+
+    Works like `SmsWatcher`: each tick lists the calls of the account once, newest first and only down to the
+    calls already seen, then hands every new call to the subscribers of its destination number.
+
+    Example:
+        with client.calls.watcher() as watcher:
+            calls = watcher.watch(verification)
+            call = calls.get(timeout=120)
+    """
+
+    _name = "call"
+
+    def _list(self) -> Iterable[Call]:
+        return self.client.calls.list(
+            reservation_type=self.reservation_type, direction=KeysetPaginationDirectionality.REVERSE, cache=False
+        )
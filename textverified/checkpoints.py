@@ -0,0 +1,175 @@
+"""Checkpoints of the SMS and call consumers of a client: how far each stream of messages has been delivered.
+
+`SMSApi.incoming`, `SMSApi.stream`, `SMSApi.aincoming`, `CallAPI.incoming`, `CallAPI.inbound`, `SmsWatcher` and
+`CallWatcher` record, per stream, the creation time and ids of the newest messages they delivered, and resume from
+there. By default checkpoints are kept in memory for the lifetime of the client. Pass a `FileCheckpointStore` or
+`SqliteCheckpointStore` as the client's `checkpoints` to keep them across restarts, so a restarted consumer does not
+miss the messages that arrived while it was down, nor deliver again the ones it finished handling.
+
+A message is checkpointed once the consumer asks for the next one, so delivery is at-least-once: a message whose
+handling was interrupted by an error or a crash is delivered again on resume.
+
+Example:
+    client = TextVerified(api_key="...", api_username="...", checkpoints=SqliteCheckpointStore("checkpoints.db"))
+"""
+
+from .high_water_mark import HighWaterMark
+from typing import Dict, Hashable, Optional
+import datetime
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+
+
+def _stream_name(key: Hashable) -> str:
+    """Stream keys are tuples of filters; persisted checkpoints are keyed by their JSON encoding."""
+    return key if isinstance(key, str) else json.dumps(key)
+
+
+def _encode_mark(mark: HighWaterMark) -> dict:
+    return {"created_at": mark.created_at.isoformat(), "ids": sorted(mark.ids)}
+
+
+def _decode_mark(data: dict) -> HighWaterMark:
+    return HighWaterMark(created_at=datetime.datetime.fromisoformat(data["created_at"]), ids=frozenset(data["ids"]))
+
+
+class CheckpointStore:
+    """In-memory checkpoints, keyed by stream. Safe to share between threads.
+
+    Subclasses persist checkpoints by loading them in `_load` and saving each update in `_save`.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__marks: Dict[str, HighWaterMark] = self._load()
+
+    def get(self, key: Hashable) -> Optional[HighWaterMark]:
+        """Get the checkpoint of a stream, or None if the stream was never consumed."""
+        with self.__lock:
+            return self.__marks.get(_stream_name(key), None)
+
+    def put(self, key: Hashable, mark: HighWaterMark) -> None:
+        """Record the checkpoint of a stream, unless the recorded one is already further ahead."""
+        stream = _stream_name(key)
+        with self.__lock:
+            current = self.__marks.get(stream, None)
+            if current is not None and mark.created_at < current.created_at:
+                return
+            if current is not None and mark.created_at == current.created_at:
+                if mark.ids <= current.ids:
+                    return
+                mark = HighWaterMark(created_at=mark.created_at, ids=mark.ids | current.ids)
+            self.__marks[stream] = mark
+            self._save(stream, mark, dict(self.__marks))
+
+    def resume(self, key: Hashable, since: Optional[datetime.datetime], leniency: float = 0.0) -> HighWaterMark:
+        """Starting point of a consumer of a stream: its checkpoint, unless `since` is further ahead.
+
+        Args:
+            key (Hashable): The stream.
+            since (Optional[datetime.datetime]): Explicit starting point, or None to resume from the checkpoint, or from now if the stream was never consumed.
+            leniency (float, optional): Seconds to start before `since`, for messages listed late. Defaults to 0.0.
+
+        Raises:
+            ValueError: If since is not a datetime object.
+        """
+        mark = self.get(key)
+        if since is not None or mark is None:
+            if since is None:
+                since = datetime.datetime.now(datetime.timezone.utc)
+            if not isinstance(since, datetime.datetime):
+                raise ValueError("since must be a datetime object.")
+
+            floor = HighWaterMark(created_at=since - datetime.timedelta(seconds=leniency))
+            if mark is None or floor.created_at > mark.created_at:
+                mark = floor
+        return mark
+
+    def clear(self) -> None:
+        """Forget every checkpoint."""
+        with self.__lock:
+            self.__marks.clear()
+            self._save(None, None, dict())
+
+    def _load(self) -> Dict[str, HighWaterMark]:
+        """Load the persisted checkpoints. Called once, on creation."""
+        return dict()
+
+    def _save(self, stream: Optional[str], mark: Optional[HighWaterMark], marks: Dict[str, HighWaterMark]) -> None:
+        """Persist the update of one stream, given every checkpoint after it. A None stream means all were cleared."""
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__marks)
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Checkpoints kept in a JSON file, rewritten atomically and synced to disk on every update.
+
+    Every delivered message therefore costs a rewrite of the whole file and an fsync, which suits a few streams
+    with moderate traffic. `SqliteCheckpointStore` writes only the updated stream, which scales to many streams and
+    higher rates. Either store caches its checkpoints in memory, so a file or database should be used by one
+    client at a time.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        super().__init__()
+
+    def _load(self) -> Dict[str, HighWaterMark]:
+        if not os.path.exists(self.path):
+            return dict()
+        with open(self.path, "r") as f:
+            return {stream: _decode_mark(data) for stream, data in json.load(f).items()}
+
+    def _save(self, stream: Optional[str], mark: Optional[HighWaterMark], marks: Dict[str, HighWaterMark]) -> None:
+        # Write a sibling file then rename it over the old one, so a crash never leaves a truncated file
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(prefix=".checkpoints-", dir=directory)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({name: _encode_mark(value) for name, value in marks.items()}, f)
+                # Sync before the rename, or a crash can leave the renamed file empty
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+class SqliteCheckpointStore(CheckpointStore):
+    """Checkpoints kept in a sqlite database, updated one stream at a time."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        with self.__connection:
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints (stream TEXT PRIMARY KEY, created_at TEXT NOT NULL, "
+                "ids TEXT NOT NULL)"
+            )
+        super().__init__()
+
+    def _load(self) -> Dict[str, HighWaterMark]:
+        rows = self.__connection.execute("SELECT stream, created_at, ids FROM checkpoints").fetchall()
+        return {
+            stream: _decode_mark({"created_at": created_at, "ids": json.loads(ids)}) for stream, created_at, ids in rows
+        }
+
+    def _save(self, stream: Optional[str], mark: Optional[HighWaterMark], marks: Dict[str, HighWaterMark]) -> None:
+        with self.__connection:
+            if stream is None:
+                self.__connection.execute("DELETE FROM checkpoints")
+            else:
+                self.__connection.execute(
+                    "INSERT OR REPLACE INTO checkpoints (stream, created_at, ids) VALUES (?, ?, ?)",
+                    (stream, mark.created_at.isoformat(), json.dumps(sorted(mark.ids))),
+                )
+
+    def close(self) -> None:
+        """Close the database."""
+        self.__connection.close()
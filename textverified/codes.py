@@ -0,0 +1,152 @@
+"""Extraction of verification codes from SMS text.
+
+`Sms.parsed_code` is filled in by the API, but can be missing, or wrong for services with unusual message formats.
+`CodeExtractor` finds codes in `Sms.sms_content` with precompiled pattern sets, one per service (keyed by the
+`service_name` of the verification or rental), falling back to generic patterns.
+
+Patterns are tried in a fixed order: the service's own patterns, then the default patterns, then the fallback
+patterns, which are the least specific. The most specific pattern that matches wins, so the code extracted from a
+message never depends on the messages extracted before it.
+"""
+
+from .data import Sms
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence, Tuple, Union
+import re
+
+# Patterns whose groups, joined, form the code. Tried in order
+DEFAULT_PATTERNS = [
+    r"(?i)\b(?:code|pin|otp|passcode)\b\D{0,20}?\b(\d{4,8})\b",
+    r"\b[A-Z]-(\d{4,8})\b",
+    r"(?<![\d-])(\d{3})[- ](\d{3})(?![\d-])",
+]
+
+# Tried last, in order
+DEFAULT_FALLBACK_PATTERNS = [
+    r"(?<![\d+])(\d{4,8})(?!\d)",
+]
+
+# Message formats of specific services, tried before the default patterns
+SERVICE_PATTERNS = {
+    "google": [r"\bG-(\d{6})\b"],
+    "whatsapp": [r"(?<!\d)(\d{3})-(\d{3})(?!\d)"],
+}
+
+
+class _PatternSet:
+    """Precompiled patterns of one service, tried in order: its own patterns, the default ones, then the fallback."""
+
+    __slots__ = ("patterns",)
+
+    def __init__(self, patterns: Sequence[str], fallback: Sequence[str]):
+        # Immutable once built, so a pattern set can be shared by any number of threads
+        self.patterns: Tuple[Pattern, ...] = tuple(re.compile(pattern) for pattern in chain(patterns, fallback))
+
+    def search(self, text: str) -> Optional[str]:
+        for pattern in self.patterns:
+            match = pattern.search(text)
+            if match is not None:
+                return _code(match)
+        return None
+
+
+def _code(match) -> str:
+    """The groups of a match, joined."""
+    if match.re.groups == 1:
+        return match.group(1)
+    return "".join(group for group in match.groups() if group)
+
+
+class CodeExtractor:
+    """Finds verification codes in SMS text, using precompiled pattern sets per service.
+
+    Patterns are regular expressions whose groups, joined, form the code, e.g. `(\\d{3})-(\\d{3})` turns
+    "123-456" into "123456". A service's own patterns are tried before the default ones.
+
+    Example:
+        extractor = CodeExtractor()
+        extractor.register("myservice", [r"token (\\w{6})"])
+        code = extractor.extract(sms, service_name=verification.service_name)
+        codes = extractor.extract_many(client.sms.list(verification), service_name=verification.service_name)
+    """
+
+    def __init__(
+        self,
+        service_patterns: Dict[str, Sequence[str]] = None,
+        patterns: Sequence[str] = None,
+        fallback_patterns: Sequence[str] = None,
+    ):
+        """
+        Args:
+            service_patterns (Dict[str, Sequence[str]], optional): Patterns of specific services, keyed by service name. Defaults to None (SERVICE_PATTERNS).
+            patterns (Sequence[str], optional): Patterns tried for every service. Defaults to None (DEFAULT_PATTERNS).
+            fallback_patterns (Sequence[str], optional): Less specific patterns, tried last in order. Defaults to None (DEFAULT_FALLBACK_PATTERNS).
+        """
+        self.patterns = list(patterns if patterns is not None else DEFAULT_PATTERNS)
+        self.fallback_patterns = list(fallback_patterns if fallback_patterns is not None else DEFAULT_FALLBACK_PATTERNS)
+        self.__default = _PatternSet(self.patterns, self.fallback_patterns)
+        self.__services: Dict[str, _PatternSet] = dict()
+        for service_name, service_patterns in (
+            service_patterns if service_patterns is not None else SERVICE_PATTERNS
+        ).items():
+            self.register(service_name, service_patterns)
+
+    def register(self, service_name: str, patterns: Sequence[str]) -> None:
+        """Set the patterns of a service, tried before the default patterns.
+
+        Raises:
+            re.error: If a pattern is not a valid regular expression.
+        """
+        self.__services[service_name.lower()] = _PatternSet(list(patterns) + self.patterns, self.fallback_patterns)
+
+    def __pattern_set(self, service_name: Optional[str]) -> _PatternSet:
+        if service_name is None:
+            return self.__default
+        return self.__services.get(service_name.lower(), self.__default)
+
+    def extract(
+        self, message: Union[Sms, str], service_name: str = None, use_parsed_code: bool = True
+    ) -> Optional[str]:
+        """Extract the verification code of a message.
+
+        Args:
+            message (Union[Sms, str]): The message, or its text.
+            service_name (str, optional): The service that sent the message, to try its patterns first. Defaults to None.
+            use_parsed_code (bool, optional): Return the code parsed by the API when it appears in the message text. Defaults to True.
+
+        Returns:
+            Optional[str]: The code, or None if none was found.
+        """
+        return self.__extract(message, self.__pattern_set(service_name), use_parsed_code)
+
+    def extract_many(
+        self, messages: Iterable[Union[Sms, str]], service_name: str = None, use_parsed_code: bool = True
+    ) -> List[Optional[str]]:
+        """Extract the verification codes of many messages, such as a page of SMS, in one pass.
+
+        Args:
+            messages (Iterable[Union[Sms, str]]): The messages, or their texts.
+            service_name (str, optional): The service that sent the messages, to try its patterns first. Defaults to None.
+            use_parsed_code (bool, optional): Return the codes parsed by the API when they appear in the message text. Defaults to True.
+
+        Returns:
+            List[Optional[str]]: The code of each message, or None where none was found.
+        """
+        pattern_set = self.__pattern_set(service_name)
+        extract = self.__extract
+        return [extract(message, pattern_set, use_parsed_code) for message in messages]
+
+    @staticmethod
+    def __extract(message: Union[Sms, str], pattern_set: _PatternSet, use_parsed_code: bool) -> Optional[str]:
+        if type(message) is str:
+            return pattern_set.search(message)
+
+        text = message.sms_content
+        if use_parsed_code:
+            parsed_code = message.parsed_code
+            # Trust the API's code unless it does not appear in the message at all
+            if parsed_code and (text is None or parsed_code in text):
+                return parsed_code
+        if not text:
+            return None
+        return pattern_set.search(text)
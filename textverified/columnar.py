@@ -0,0 +1,221 @@
+"""Columnar export of paginated results.
+
+Turns a `PaginatedList` into per-field arrays without creating a dataclass for each row.
+Numbers, booleans and timestamps are stored in NumPy arrays; text and enum values are stored in object
+arrays of interned strings, so repeated values (service names, numbers, states) share a single object.
+
+NumPy is required for this module. pandas and pyarrow are only needed for the matching adapters.
+"""
+
+from array import array
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any, Dict, Optional, Sequence, Tuple
+import datetime
+
+from .data._base import _parse_datetime
+from .paginated_list import PaginatedList
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+_NAT = -(2**63)  # numpy's NaT as int64
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("Columnar export requires numpy. Install it with `pip install numpy`.") from e
+    return numpy
+
+
+def _unwrap_optional(annotation: Any) -> Tuple[Any, bool]:
+    """Return the inner type of Optional[X] and whether it was optional."""
+    args = getattr(annotation, "__args__", None) or ()
+    if getattr(annotation, "__origin__", None) is not None and type(None) in args and len(args) == 2:
+        return next(arg for arg in args if arg is not type(None)), True
+    return annotation, False
+
+
+def _parse_timestamp(value: str) -> int:
+    """Parse an API timestamp into microseconds since the epoch (UTC)."""
+    parsed = _parse_datetime(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return (parsed - _EPOCH) // _ONE_MICROSECOND
+
+
+class _Column:
+    """Accumulates the raw values of one field and converts them to a NumPy array."""
+
+    def __init__(self, kind: str, optional: bool):
+        self.kind = kind
+        self.optional = optional
+        if kind == "int" and not optional:
+            self.values = array("q")
+        elif kind in ("int", "float"):
+            self.values = array("d")
+        elif kind == "datetime":
+            self.values = array("q")
+        elif kind == "bool" and not optional:
+            self.values = array("b")
+        else:
+            self.values = []
+        self.interned: Dict[str, str] = dict() if kind == "str" else None
+
+    def convert(self, value: Any) -> Any:
+        """Convert a raw API value to what is stored in the column."""
+        if self.kind == "datetime":
+            return _parse_timestamp(value) if value is not None else _NAT
+        elif self.kind in ("int", "float") and self.optional:
+            return float(value) if value is not None else float("nan")
+        elif self.kind == "float":
+            return float(value)
+        elif self.kind == "str" and value is not None:
+            return self.interned.setdefault(value, value)
+        return value
+
+    def extend(self, page: Sequence[dict], key: str) -> None:
+        """Append the value of `key` for every item of a page."""
+        convert = self.convert
+        self.values.extend([convert(item.get(key, None)) for item in page])
+
+    def to_numpy(self):
+        numpy = _import_numpy()
+        if self.kind == "int" and not self.optional:
+            return numpy.frombuffer(self.values, dtype=numpy.int64).copy()
+        elif self.kind in ("int", "float"):
+            return numpy.frombuffer(self.values, dtype=numpy.float64).copy()
+        elif self.kind == "datetime":
+            return numpy.frombuffer(self.values, dtype=numpy.int64).view("datetime64[us]").copy()
+        elif self.kind == "bool" and not self.optional:
+            return numpy.frombuffer(self.values, dtype=numpy.int8).astype(bool)
+
+        column = numpy.empty(len(self.values), dtype=object)
+        column[:] = self.values
+        return column
+
+
+def _column_kind(annotation: Any) -> Tuple[str, bool]:
+    """Map a dataclass field annotation to a column kind."""
+    inner, optional = _unwrap_optional(annotation)
+    if inner is bool:
+        return "bool", optional
+    elif inner is int:
+        return "int", optional
+    elif inner is float:
+        return "float", optional
+    elif inner is datetime.datetime:
+        return "datetime", optional
+    elif inner is str or (isinstance(inner, type) and issubclass(inner, Enum)):
+        return "str", optional
+    return "object", optional
+
+
+class ColumnarTable:
+    """Per-field arrays built from a paginated listing.
+
+    Columns are keyed by attribute name (for example `created_at`), matching the dataclass of the listing.
+    Timestamps are `datetime64[us]` arrays in UTC, with missing values as NaT. Optional numbers are float arrays
+    with missing values as NaN. Enums are stored as their API value.
+    """
+
+    def __init__(self, columns: Dict[str, Any]):
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+    def __getitem__(self, name: str):
+        return self.columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def to_pandas(self):
+        """Convert the table to a pandas DataFrame, with timezone-aware timestamp columns.
+
+        Raises:
+            ImportError: If pandas is not installed.
+
+        Returns:
+            pandas.DataFrame: The table as a DataFrame.
+        """
+        try:
+            import pandas
+        except ImportError as e:
+            raise ImportError("to_pandas requires pandas. Install it with `pip install pandas`.") from e
+
+        frame = pandas.DataFrame(self.columns, copy=False)
+        for name, column in self.columns.items():
+            if column.dtype.kind == "M":
+                frame[name] = frame[name].dt.tz_localize("UTC")
+        return frame
+
+    def to_arrow(self):
+        """Convert the table to a pyarrow Table, with timezone-aware timestamp columns.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+
+        Returns:
+            pyarrow.Table: The table as an Arrow table.
+        """
+        try:
+            import pyarrow
+        except ImportError as e:
+            raise ImportError("to_arrow requires pyarrow. Install it with `pip install pyarrow`.") from e
+
+        arrays = dict()
+        for name, column in self.columns.items():
+            if column.dtype.kind == "M":
+                arrays[name] = pyarrow.array(column, type=pyarrow.timestamp("us", tz="UTC"))
+            elif column.dtype.kind == "O":
+                arrays[name] = pyarrow.array(column.tolist())
+            else:
+                arrays[name] = pyarrow.array(column)
+        return pyarrow.table(arrays)
+
+
+def to_columns(
+    paginated_list: PaginatedList, columns: Sequence[str] = None, item_type: Optional[type] = None
+) -> ColumnarTable:
+    """Stream every page of a listing into per-field arrays.
+
+    Pages are read as raw API data, so no dataclass instances are created for rows that were not already
+    accessed. Pages that were not fetched yet are streamed without being stored in the list.
+
+    Args:
+        paginated_list (PaginatedList): The listing to export, for example the result of `sms.list()`.
+        columns (Sequence[str], optional): Attribute names to export. Defaults to all fields of the item type.
+        item_type (type, optional): The dataclass of the listing items. Defaults to the class of the listing's
+            `parse_item` (for example `Sms` for `Sms.from_api`).
+
+    Raises:
+        ImportError: If numpy is not installed.
+        ValueError: If the item type cannot be determined or a requested column does not exist.
+
+    Returns:
+        ColumnarTable: The exported columns.
+    """
+    _import_numpy()
+
+    item_type = item_type or getattr(paginated_list.parse_item, "__self__", None)
+    if not is_dataclass(item_type) or not hasattr(item_type, "_api_fields"):
+        raise ValueError("Cannot determine the item type of this listing; pass item_type explicitly.")
+
+    field_types = {field.name: field.type for field in fields(item_type)}
+    selected = list(columns) if columns is not None else list(field_types)
+    unknown = [name for name in selected if name not in field_types]
+    if unknown:
+        raise ValueError(f"Unknown columns for {item_type.__name__}: {', '.join(unknown)}")
+
+    # (api key, column) pairs, in the order requested
+    api_keys = {name: key for key, name in item_type._api_fields.items()}
+    extractors = [(api_keys[name], _Column(*_column_kind(field_types[name]))) for name in selected]
+
+    for page in paginated_list._iter_raw_pages():
+        for key, column in extractors:
+            column.extend(page, key)
+
+    return ColumnarTable({name: column.to_numpy() for name, (_, column) in zip(selected, extractors)})
@@ -1,9 +1,87 @@
-import inspect
-from . import dtypes
-from .dtypes import *
-
-__all__ = [
-    name
-    for name, obj in inspect.getmembers(dtypes, inspect.isclass)
-    if obj.__module__ == dtypes.__name__ and not name.startswith("_")
-]
+"""
+Generated enums and dataclasses from Swagger schema, split into domain modules
+that are only imported when one of their types is first accessed.
+This file is auto-generated. Do not edit manually.
+"""
+import importlib
+
+_TYPE_MODULES = {
+    'BackOrderState': 'common',
+    'KeysetPaginationDirectionality': 'common',
+    'LineReservationType': 'common',
+    'RentalDuration': 'common',
+    'NumberType': 'common',
+    'ReservationCapability': 'common',
+    'ReservationState': 'common',
+    'ReservationType': 'common',
+    'ReservationSaleState': 'common',
+    'Account': 'common',
+    'BearerToken': 'common',
+    'CancelAction': 'common',
+    'PricingSnapshot': 'common',
+    'ReactivationAction': 'common',
+    'ReportAction': 'common',
+    'Error': 'common',
+    'RefundAction': 'common',
+    'ReuseAction': 'common',
+    'AddOnSnapshot': 'rentals',
+    'BackOrderReservationCompact': 'rentals',
+    'RentalExtensionRequest': 'rentals',
+    'Reservation': 'rentals',
+    'ReservationSaleCompact': 'rentals',
+    'BackOrderReservationExpanded': 'rentals',
+    'LineHealth': 'rentals',
+    'NonrenewableRentalCompact': 'rentals',
+    'NonrenewableRentalUpdateRequest': 'rentals',
+    'RenewableRentalCompact': 'rentals',
+    'RenewableRentalUpdateRequest': 'rentals',
+    'RentalPriceCheckRequest': 'rentals',
+    'RentalSnapshot': 'rentals',
+    'NewRentalRequest': 'rentals',
+    'NonrenewableRentalExpanded': 'rentals',
+    'RenewableRentalExpanded': 'rentals',
+    'ReservationSaleExpanded': 'rentals',
+    'AreaCode': 'services',
+    'Service': 'services',
+    'BackOrderReservationWebhookEvent': 'webhooks',
+    'ReservationCreatedWebhookEvent': 'webhooks',
+    'WebhookEventBackOrderReservationWebhookEvent': 'webhooks',
+    'BillingCycleWebhookEvent': 'webhooks',
+    'WebhookEventReservationCreatedWebhookEvent': 'webhooks',
+    'SmsWebhookEvent': 'webhooks',
+    'WebhookEventBillingCycleWebhookEvent': 'webhooks',
+    'WebhookEventSmsWebhookEvent': 'webhooks',
+    'BillingCycleCompact': 'billing',
+    'BillingCycleExpanded': 'billing',
+    'BillingCycleUpdateRequest': 'billing',
+    'BillingCycleRenewalInvoice': 'billing',
+    'BillingCycleRenewalInvoicePreview': 'billing',
+    'CallSessionRequest': 'calls',
+    'Call': 'calls',
+    'TwilioCallingContextDto': 'calls',
+    'CallContext': 'calls',
+    'UsageWindowEstimateRequest': 'wake',
+    'WakeRequest': 'wake',
+    'UsageWindowEstimateResponse': 'wake',
+    'WakeResponse': 'wake',
+    'VerificationCompact': 'verifications',
+    'VerificationPriceCheckRequest': 'verifications',
+    'NewVerificationRequest': 'verifications',
+    'VerificationExpanded': 'verifications',
+    'Sms': 'sms',
+}
+
+__all__ = list(_TYPE_MODULES)
+
+
+def __getattr__(name):
+    module_name = _TYPE_MODULES.get(name, None)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,145 @@
+"""
+Helpers shared by the generated enums and dataclasses
+This file is auto-generated. Do not edit manually.
+"""
+from dataclasses import dataclass, fields
+from enum import Enum
+from typing import Optional, Dict, List, Any
+import datetime
+import dateutil.parser
+import json
+import re
+import sys
+from ..binary import dumps as _binary_dumps, loads as _binary_loads
+from ..interning import _intern, _intern_opt_in, _opt_in_interner, current_intern_table as _current_intern_table
+
+# ISO-8601 timestamps, as sent by the API: optional fraction of any precision, optional Z or +HH:MM offset
+_ISO_DATETIME = re.compile(r"(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})?$")
+
+
+def _parse_datetime(value: str) -> datetime.datetime:
+    """Parse an API timestamp. ISO-8601 goes through fromisoformat, anything else through dateutil."""
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        pass
+
+    # Before 3.11, fromisoformat rejects Z, offsets without a colon, and fractions other than 3 or 6 digits
+    match = _ISO_DATETIME.match(value)
+    if match is not None:
+        base, fraction, offset = match.groups()
+        if fraction:
+            base += "." + fraction[:6].ljust(6, "0")
+        if offset == "Z":
+            offset = "+00:00"
+        elif offset and len(offset) == 5:
+            offset = offset[:3] + ":" + offset[3:]
+        try:
+            return datetime.datetime.fromisoformat(base + (offset or ""))
+        except ValueError:
+            pass
+    return dateutil.parser.parse(value)
+
+
+def _batch_datetime_parser():
+    """Memoized _parse_datetime for one batch, so timestamps repeated across a page are parsed once."""
+    cache = dict()
+
+    def parse_datetime(value: str) -> datetime.datetime:
+        parsed = cache.get(value)
+        if parsed is None:
+            parsed = cache[value] = _parse_datetime(value)
+        return parsed
+
+    return parse_datetime
+
+
+def _slots_getstate(self):
+    return tuple(getattr(self, f.name) for f in fields(self))
+
+
+def _slots_setstate(self, state):
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
+
+
+class _Unparsed:
+    """Raw API list of a lazily decoded field. Raw objects are stored as plain dicts."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+
+class _MemoizedJson:
+    """Base of request dataclasses reused across many calls, caching their encoded JSON body per instance."""
+
+    __slots__ = ("_json",)
+
+    def to_json(self) -> bytes:
+        """Encode `to_api()` as JSON, once per instance.
+
+        The result is cached on first call, so list fields must not be modified in place afterwards.
+        """
+        try:
+            return self._json
+        except AttributeError:
+            encoded = json.dumps(self.to_api(), separators=(",", ":"), allow_nan=False).encode("utf-8")
+            object.__setattr__(self, "_json", encoded)
+            return encoded
+
+
+class _LazyField:
+    """Wraps the slot of a field, decoding a raw value on first access and caching it in the slot."""
+
+    def __init__(self, slot, parse):
+        self.slot = slot
+        self.parse = parse
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, owner)
+        value_type = type(value)
+        if value_type is dict or value_type is _Unparsed:
+            value = self.parse(value if value_type is dict else value.data)
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+
+
+def _lazy_fields(**parsers):
+    """Decode the given fields of a slotted dataclass lazily, each with its parser."""
+
+    def decorate(cls):
+        for name, parse in parsers.items():
+            setattr(cls, name, _LazyField(cls.__dict__[name], parse))
+        return cls
+
+    return decorate
+
+
+def _slot_setters(cls) -> tuple:
+    """Setters of each field's slot, in field order, used by batch decoders to fill instances directly."""
+    return tuple(cls.__dict__[f.name].__set__ for f in fields(cls))
+
+
+def _frozen_dataclass(cls):
+    """Frozen dataclass whose instances use __slots__ instead of a per-instance __dict__."""
+    if sys.version_info >= (3, 11):
+        # 3.10 also has slots=True, but cannot unpickle frozen slotted classes
+        return dataclass(frozen=True, slots=True)(cls)
+
+    cls = dataclass(frozen=True)(cls)
+    names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value for key, value in cls.__dict__.items() if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+    namespace["__qualname__"] = cls.__qualname__
+    namespace["__getstate__"] = _slots_getstate
+    namespace["__setstate__"] = _slots_setstate
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
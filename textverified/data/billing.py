@@ -0,0 +1,308 @@
+"""
+Generated billing enums and dataclasses from Swagger schema
+This file is auto-generated. Do not edit manually.
+"""
+from enum import Enum
+from typing import Optional, Dict, List, Any
+import datetime
+from ._base import (
+    _Unparsed,
+    _batch_datetime_parser,
+    _binary_dumps,
+    _binary_loads,
+    _current_intern_table,
+    _frozen_dataclass,
+    _intern,
+    _intern_opt_in,
+    _lazy_fields,
+    _MemoizedJson,
+    _opt_in_interner,
+    _parse_datetime,
+    _slot_setters,
+)
+from .rentals import RentalSnapshot
+
+__all__ = ['BillingCycleCompact', 'BillingCycleExpanded', 'BillingCycleUpdateRequest', 'BillingCycleRenewalInvoice', 'BillingCycleRenewalInvoicePreview']
+
+
+@_frozen_dataclass
+class BillingCycleCompact:
+    id: str
+    """Id of the billing cycle"""
+
+    billing_cycle_ends_at: datetime.datetime
+    email_notifications_enabled: bool
+    state: str
+
+    _api_fields = {'id': 'id', 'billingCycleEndsAt': 'billing_cycle_ends_at', 'emailNotificationsEnabled': 'email_notifications_enabled', 'state': 'state'}
+    _schema_version = 0x4c7dbe76
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'billingCycleEndsAt': self.billing_cycle_ends_at.isoformat(),
+            'emailNotificationsEnabled': self.email_notifications_enabled,
+            'state': self.state,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'BillingCycleCompact':
+        return cls(
+            id=data.get("id"),
+            billing_cycle_ends_at=_parse_datetime(data.get("billingCycleEndsAt")),
+            email_notifications_enabled=data.get("emailNotificationsEnabled"),
+            state=data.get("state"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BillingCycleCompact':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['BillingCycleCompact']:
+        parse_datetime = _batch_datetime_parser()
+        set_id, set_billing_cycle_ends_at, set_email_notifications_enabled, set_state, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_id(obj, data.get("id"))
+            set_billing_cycle_ends_at(obj, parse_datetime(data.get("billingCycleEndsAt")))
+            set_email_notifications_enabled(obj, data.get("emailNotificationsEnabled"))
+            set_state(obj, data.get("state"))
+            append(obj)
+        return result
+
+
+BillingCycleCompact._slot_setters = _slot_setters(BillingCycleCompact)
+
+
+@_frozen_dataclass
+class BillingCycleExpanded:
+    id: str
+    """Id of the billing cycle"""
+
+    renewed_through: datetime.datetime
+    billing_cycle_ends_at: datetime.datetime
+    email_notifications_enabled: bool
+    state: str
+    next_auto_renew_attempt: Optional[datetime.datetime] = None
+
+    _api_fields = {'id': 'id', 'renewedThrough': 'renewed_through', 'billingCycleEndsAt': 'billing_cycle_ends_at', 'emailNotificationsEnabled': 'email_notifications_enabled', 'state': 'state', 'nextAutoRenewAttempt': 'next_auto_renew_attempt'}
+    _schema_version = 0x273ff26b
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'renewedThrough': self.renewed_through.isoformat(),
+            'billingCycleEndsAt': self.billing_cycle_ends_at.isoformat(),
+            'emailNotificationsEnabled': self.email_notifications_enabled,
+            'state': self.state,
+            'nextAutoRenewAttempt': (self.next_auto_renew_attempt.isoformat() if self.next_auto_renew_attempt is not None else None),
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'BillingCycleExpanded':
+        _next_auto_renew_attempt = data.get("nextAutoRenewAttempt")
+        return cls(
+            id=data.get("id"),
+            renewed_through=_parse_datetime(data.get("renewedThrough")),
+            billing_cycle_ends_at=_parse_datetime(data.get("billingCycleEndsAt")),
+            email_notifications_enabled=data.get("emailNotificationsEnabled"),
+            state=data.get("state"),
+            next_auto_renew_attempt=(_parse_datetime(_next_auto_renew_attempt) if _next_auto_renew_attempt is not None else None),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BillingCycleExpanded':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['BillingCycleExpanded']:
+        parse_datetime = _batch_datetime_parser()
+        set_id, set_renewed_through, set_billing_cycle_ends_at, set_email_notifications_enabled, set_state, set_next_auto_renew_attempt, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            _next_auto_renew_attempt = data.get("nextAutoRenewAttempt")
+            obj = new(cls)
+            set_id(obj, data.get("id"))
+            set_renewed_through(obj, parse_datetime(data.get("renewedThrough")))
+            set_billing_cycle_ends_at(obj, parse_datetime(data.get("billingCycleEndsAt")))
+            set_email_notifications_enabled(obj, data.get("emailNotificationsEnabled"))
+            set_state(obj, data.get("state"))
+            set_next_auto_renew_attempt(obj, (parse_datetime(_next_auto_renew_attempt) if _next_auto_renew_attempt is not None else None))
+            append(obj)
+        return result
+
+
+BillingCycleExpanded._slot_setters = _slot_setters(BillingCycleExpanded)
+
+
+@_frozen_dataclass
+class BillingCycleUpdateRequest:
+    """Supplying a value of 'null' or not supplying a value for any nullable properties will cause the property to be ignored.
+
+    """
+
+    reminders_enabled: Optional[bool] = None
+    nickname: Optional[str] = None
+
+    _api_fields = {'remindersEnabled': 'reminders_enabled', 'nickname': 'nickname'}
+    _schema_version = 0xedfbddf6
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'remindersEnabled': self.reminders_enabled,
+            'nickname': self.nickname,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'BillingCycleUpdateRequest':
+        return cls(
+            reminders_enabled=data.get("remindersEnabled"),
+            nickname=data.get("nickname"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BillingCycleUpdateRequest':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['BillingCycleUpdateRequest']:
+        set_reminders_enabled, set_nickname, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_reminders_enabled(obj, data.get("remindersEnabled"))
+            set_nickname(obj, data.get("nickname"))
+            append(obj)
+        return result
+
+
+BillingCycleUpdateRequest._slot_setters = _slot_setters(BillingCycleUpdateRequest)
+
+
+@_frozen_dataclass
+class BillingCycleRenewalInvoice:
+    created_at: datetime.datetime
+    id: str
+    excluded_rentals: List[RentalSnapshot]
+    included_rentals: List[RentalSnapshot]
+    is_paid_for: bool
+    total_cost: float
+    """Total amount cost of the invoice, in account credits."""
+
+
+    _api_fields = {'createdAt': 'created_at', 'id': 'id', 'excludedRentals': 'excluded_rentals', 'includedRentals': 'included_rentals', 'isPaidFor': 'is_paid_for', 'totalCost': 'total_cost'}
+    _schema_version = 0x4aaebe86
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'createdAt': self.created_at.isoformat(),
+            'id': self.id,
+            'excludedRentals': [item.to_api() for item in self.excluded_rentals],
+            'includedRentals': [item.to_api() for item in self.included_rentals],
+            'isPaidFor': self.is_paid_for,
+            'totalCost': self.total_cost,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'BillingCycleRenewalInvoice':
+        return cls(
+            created_at=_parse_datetime(data.get("createdAt")),
+            id=data.get("id"),
+            excluded_rentals=[RentalSnapshot.from_api(item) for item in data.get("excludedRentals")],
+            included_rentals=[RentalSnapshot.from_api(item) for item in data.get("includedRentals")],
+            is_paid_for=data.get("isPaidFor"),
+            total_cost=float(data.get("totalCost")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BillingCycleRenewalInvoice':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['BillingCycleRenewalInvoice']:
+        parse_datetime = _batch_datetime_parser()
+        set_created_at, set_id, set_excluded_rentals, set_included_rentals, set_is_paid_for, set_total_cost, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_created_at(obj, parse_datetime(data.get("createdAt")))
+            set_id(obj, data.get("id"))
+            set_excluded_rentals(obj, RentalSnapshot.from_api_many(data.get("excludedRentals")))
+            set_included_rentals(obj, RentalSnapshot.from_api_many(data.get("includedRentals")))
+            set_is_paid_for(obj, data.get("isPaidFor"))
+            set_total_cost(obj, float(data.get("totalCost")))
+            append(obj)
+        return result
+
+
+BillingCycleRenewalInvoice._slot_setters = _slot_setters(BillingCycleRenewalInvoice)
+
+
+@_frozen_dataclass
+class BillingCycleRenewalInvoicePreview:
+    billing_cycle_id: str
+    renewal_estimate: BillingCycleRenewalInvoice
+
+    _api_fields = {'billingCycleId': 'billing_cycle_id', 'renewalEstimate': 'renewal_estimate'}
+    _schema_version = 0x08d42ea0
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'billingCycleId': self.billing_cycle_id,
+            'renewalEstimate': self.renewal_estimate.to_api(),
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'BillingCycleRenewalInvoicePreview':
+        return cls(
+            billing_cycle_id=_intern_opt_in(data.get("billingCycleId")),
+            renewal_estimate=BillingCycleRenewalInvoice.from_api(data.get("renewalEstimate")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BillingCycleRenewalInvoicePreview':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['BillingCycleRenewalInvoicePreview']:
+        intern_opt_in = _opt_in_interner()
+        set_billing_cycle_id, set_renewal_estimate, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_billing_cycle_id(obj, intern_opt_in(data.get("billingCycleId")))
+            set_renewal_estimate(obj, BillingCycleRenewalInvoice.from_api(data.get("renewalEstimate")))
+            append(obj)
+        return result
+
+
+BillingCycleRenewalInvoicePreview._slot_setters = _slot_setters(BillingCycleRenewalInvoicePreview)
+
+
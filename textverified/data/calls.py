@@ -0,0 +1,214 @@
+"""
+Generated calls enums and dataclasses from Swagger schema
+This file is auto-generated. Do not edit manually.
+"""
+from enum import Enum
+from typing import Optional, Dict, List, Any
+import datetime
+from ._base import (
+    _Unparsed,
+    _batch_datetime_parser,
+    _binary_dumps,
+    _binary_loads,
+    _current_intern_table,
+    _frozen_dataclass,
+    _intern,
+    _intern_opt_in,
+    _lazy_fields,
+    _MemoizedJson,
+    _opt_in_interner,
+    _parse_datetime,
+    _slot_setters,
+)
+
+__all__ = ['CallSessionRequest', 'Call', 'TwilioCallingContextDto', 'CallContext']
+
+
+@_frozen_dataclass
+class CallSessionRequest:
+    reservation_id: str
+
+    _api_fields = {'reservationId': 'reservation_id'}
+    _schema_version = 0x4ab0d00d
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'reservationId': self.reservation_id,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'CallSessionRequest':
+        return cls(
+            reservation_id=data.get("reservationId"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'CallSessionRequest':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['CallSessionRequest']:
+        set_reservation_id, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_reservation_id(obj, data.get("reservationId"))
+            append(obj)
+        return result
+
+
+CallSessionRequest._slot_setters = _slot_setters(CallSessionRequest)
+
+
+@_frozen_dataclass
+class Call:
+    to_value: str
+    created_at: datetime.datetime
+    id: str
+    from_value: Optional[str] = None
+    recording_uri: Optional[str] = None
+
+    _api_fields = {'to': 'to_value', 'createdAt': 'created_at', 'id': 'id', 'from': 'from_value', 'recordingUri': 'recording_uri'}
+    _schema_version = 0xe4c69327
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'to': self.to_value,
+            'createdAt': self.created_at.isoformat(),
+            'id': self.id,
+            'from': self.from_value,
+            'recordingUri': self.recording_uri,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'Call':
+        return cls(
+            to_value=_intern_opt_in(data.get("to")),
+            created_at=_parse_datetime(data.get("createdAt")),
+            id=data.get("id"),
+            from_value=_intern_opt_in(data.get("from")),
+            recording_uri=data.get("recordingUri"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Call':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['Call']:
+        parse_datetime = _batch_datetime_parser()
+        intern_opt_in = _opt_in_interner()
+        set_to_value, set_created_at, set_id, set_from_value, set_recording_uri, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_to_value(obj, intern_opt_in(data.get("to")))
+            set_created_at(obj, parse_datetime(data.get("createdAt")))
+            set_id(obj, data.get("id"))
+            set_from_value(obj, intern_opt_in(data.get("from")))
+            set_recording_uri(obj, data.get("recordingUri"))
+            append(obj)
+        return result
+
+
+Call._slot_setters = _slot_setters(Call)
+
+
+@_frozen_dataclass
+class TwilioCallingContextDto:
+    token: Optional[str] = None
+
+    _api_fields = {'token': 'token'}
+    _schema_version = 0x68d22494
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'token': self.token,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'TwilioCallingContextDto':
+        return cls(
+            token=data.get("token"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'TwilioCallingContextDto':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['TwilioCallingContextDto']:
+        set_token, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_token(obj, data.get("token"))
+            append(obj)
+        return result
+
+
+TwilioCallingContextDto._slot_setters = _slot_setters(TwilioCallingContextDto)
+
+
+@_frozen_dataclass
+class CallContext:
+    reservation_id: str
+    """Id of the verification that this call context is associated with."""
+
+    twilio_context: TwilioCallingContextDto
+
+    _api_fields = {'reservationId': 'reservation_id', 'twilioContext': 'twilio_context'}
+    _schema_version = 0xfc4f4a08
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'reservationId': self.reservation_id,
+            'twilioContext': self.twilio_context.to_api(),
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'CallContext':
+        return cls(
+            reservation_id=data.get("reservationId"),
+            twilio_context=TwilioCallingContextDto.from_api(data.get("twilioContext")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'CallContext':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['CallContext']:
+        set_reservation_id, set_twilio_context, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_reservation_id(obj, data.get("reservationId"))
+            set_twilio_context(obj, TwilioCallingContextDto.from_api(data.get("twilioContext")))
+            append(obj)
+        return result
+
+
+CallContext._slot_setters = _slot_setters(CallContext)
+
+
@@ -0,0 +1,627 @@
+"""
+Generated common enums and dataclasses from Swagger schema
+This file is auto-generated. Do not edit manually.
+"""
+from enum import Enum
+from typing import Optional, Dict, List, Any
+import datetime
+from ._base import (
+    _Unparsed,
+    _batch_datetime_parser,
+    _binary_dumps,
+    _binary_loads,
+    _current_intern_table,
+    _frozen_dataclass,
+    _intern,
+    _intern_opt_in,
+    _lazy_fields,
+    _MemoizedJson,
+    _opt_in_interner,
+    _parse_datetime,
+    _slot_setters,
+)
+
+__all__ = ['BackOrderState', 'KeysetPaginationDirectionality', 'LineReservationType', 'RentalDuration', 'NumberType', 'ReservationCapability', 'ReservationState', 'ReservationType', 'ReservationSaleState', 'Account', 'BearerToken', 'CancelAction', 'PricingSnapshot', 'ReactivationAction', 'ReportAction', 'Error', 'RefundAction', 'ReuseAction']
+
+
+class BackOrderState(Enum):
+    CREATED = 'created'
+    FULFILLED = 'fulfilled'
+    CANCELED = 'canceled'
+
+    def to_api(self) -> str:
+        return self.value
+
+    @classmethod
+    def from_api(cls, value: str) -> 'BackOrderState':
+        try:
+            return cls._api_lookup[value.casefold()]
+        except KeyError:
+            raise ValueError(f'Unknown BackOrderState value: {value}') from None
+
+
+BackOrderState._api_lookup = {member.value.casefold(): member for member in BackOrderState}
+
+
+class KeysetPaginationDirectionality(Enum):
+    FORWARD = 'forward'
+    REVERSE = 'reverse'
+
+    def to_api(self) -> str:
+        return self.value
+
+    @classmethod
+    def from_api(cls, value: str) -> 'KeysetPaginationDirectionality':
+        try:
+            return cls._api_lookup[value.casefold()]
+        except KeyError:
+            raise ValueError(f'Unknown KeysetPaginationDirectionality value: {value}') from None
+
+
+KeysetPaginationDirectionality._api_lookup = {member.value.casefold(): member for member in KeysetPaginationDirectionality}
+
+
+class LineReservationType(Enum):
+    VERIFICATION = 'verification'
+    RENTAL = 'rental'
+
+    def to_api(self) -> str:
+        return self.value
+
+    @classmethod
+    def from_api(cls, value: str) -> 'LineReservationType':
+        try:
+            return cls._api_lookup[value.casefold()]
+        except KeyError:
+            raise ValueError(f'Unknown LineReservationType value: {value}') from None
+
+
+LineReservationType._api_lookup = {member.value.casefold(): member for member in LineReservationType}
+
+
+class RentalDuration(Enum):
+    ONE_DAY = 'oneDay'
+    THREE_DAY = 'threeDay'
+    SEVEN_DAY = 'sevenDay'
+    FOURTEEN_DAY = 'fourteenDay'
+    THIRTY_DAY = 'thirtyDay'
+    NINETY_DAY = 'ninetyDay'
+    ONE_YEAR = 'oneYear'
+
+    def to_api(self) -> str:
+        return self.value
+
+    @classmethod
+    def from_api(cls, value: str) -> 'RentalDuration':
+        try:
+            return cls._api_lookup[value.casefold()]
+        except KeyError:
+            raise ValueError(f'Unknown RentalDuration value: {value}') from None
+
+
+RentalDuration._api_lookup = {member.value.casefold(): member for member in RentalDuration}
+
+
+class NumberType(Enum):
+    MOBILE = 'mobile'
+    VOIP = 'voip'
+    LANDLINE = 'landline'
+
+    def to_api(self) -> str:
+        return self.value
+
+    @classmethod
+    def from_api(cls, value: str) -> 'NumberType':
+        try:
+            return cls._api_lookup[value.casefold()]
+        except KeyError:
+            raise ValueError(f'Unknown NumberType value: {value}') from None
+
+
+NumberType._api_lookup = {member.value.casefold(): member for member in NumberType}
+
+
+class ReservationCapability(Enum):
+    SMS = 'sms'
+    VOICE = 'voice'
+    SMS_AND_VOICE_COMBO = 'smsAndVoiceCombo'
+
+    def to_api(self) -> str:
+        return self.value
+
+    @classmethod
+    def from_api(cls, value: str) -> 'ReservationCapability':
+        try:
+            return cls._api_lookup[value.casefold()]
+        except KeyError:
+            raise ValueError(f'Unknown ReservationCapability value: {value}') from None
+
+
+ReservationCapability._api_lookup = {member.value.casefold(): member for member in ReservationCapability}
+
+
+class ReservationState(Enum):
+    VERIFICATION_PENDING = 'verificationPending'
+    VERIFICATION_COMPLETED = 'verificationCompleted'
+    VERIFICATION_CANCELED = 'verificationCanceled'
+    VERIFICATION_TIMED_OUT = 'verificationTimedOut'
+    VERIFICATION_REPORTED = 'verificationReported'
+    VERIFICATION_REFUNDED = 'verificationRefunded'
+    VERIFICATION_REUSED = 'verificationReused'
+    VERIFICATION_REACTIVATED = 'verificationReactivated'
+    RENEWABLE_ACTIVE = 'renewableActive'
+    RENEWABLE_OVERDUE = 'renewableOverdue'
+    RENEWABLE_EXPIRED = 'renewableExpired'
+    RENEWABLE_REFUNDED = 'renewableRefunded'
+    NONRENEWABLE_ACTIVE = 'nonrenewableActive'
+    NONRENEWABLE_EXPIRED = 'nonrenewableExpired'
+    NONRENEWABLE_REFUNDED = 'nonrenewableRefunded'
+
+    def to_api(self) -> str:
+        return self.value
+
+    @classmethod
+    def from_api(cls, value: str) -> 'ReservationState':
+        try:
+            return cls._api_lookup[value.casefold()]
+        except KeyError:
+            raise ValueError(f'Unknown ReservationState value: {value}') from None
+
+
+ReservationState._api_lookup = {member.value.casefold(): member for member in ReservationState}
+
+
+class ReservationType(Enum):
+    RENEWABLE = 'renewable'
+    NONRENEWABLE = 'nonrenewable'
+    VERIFICATION = 'verification'
+
+    def to_api(self) -> str:
+        return self.value
+
+    @classmethod
+    def from_api(cls, value: str) -> 'ReservationType':
+        try:
+            return cls._api_lookup[value.casefold()]
+        except KeyError:
+            raise ValueError(f'Unknown ReservationType value: {value}') from None
+
+
+ReservationType._api_lookup = {member.value.casefold(): member for member in ReservationType}
+
+
+class ReservationSaleState(Enum):
+    CREATED = 'created'
+    PROCESSING = 'processing'
+    FAILED = 'failed'
+    SUCCEEDED = 'succeeded'
+
+    def to_api(self) -> str:
+        return self.value
+
+    @classmethod
+    def from_api(cls, value: str) -> 'ReservationSaleState':
+        try:
+            return cls._api_lookup[value.casefold()]
+        except KeyError:
+            raise ValueError(f'Unknown ReservationSaleState value: {value}') from None
+
+
+ReservationSaleState._api_lookup = {member.value.casefold(): member for member in ReservationSaleState}
+
+
+@_frozen_dataclass
+class Account:
+    username: str
+    """The username of the account holder."""
+
+    current_balance: float
+    """The current balance of the account."""
+
+
+    _api_fields = {'username': 'username', 'currentBalance': 'current_balance'}
+    _schema_version = 0x4bb4edb7
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'username': self.username,
+            'currentBalance': self.current_balance,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'Account':
+        return cls(
+            username=data.get("username"),
+            current_balance=float(data.get("currentBalance")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Account':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['Account']:
+        set_username, set_current_balance, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_username(obj, data.get("username"))
+            set_current_balance(obj, float(data.get("currentBalance")))
+            append(obj)
+        return result
+
+
+Account._slot_setters = _slot_setters(Account)
+
+
+@_frozen_dataclass
+class BearerToken:
+    token: str
+    """Bearer token"""
+
+    expires_in: float
+    """Seconds remaining until bearer token expires"""
+
+    expires_at: datetime.datetime
+    """Timestamp of when the token will expire"""
+
+
+    _api_fields = {'token': 'token', 'expiresIn': 'expires_in', 'expiresAt': 'expires_at'}
+    _schema_version = 0x8671b8af
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'token': self.token,
+            'expiresIn': self.expires_in,
+            'expiresAt': self.expires_at.isoformat(),
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'BearerToken':
+        return cls(
+            token=data.get("token"),
+            expires_in=float(data.get("expiresIn")),
+            expires_at=_parse_datetime(data.get("expiresAt")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BearerToken':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['BearerToken']:
+        parse_datetime = _batch_datetime_parser()
+        set_token, set_expires_in, set_expires_at, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_token(obj, data.get("token"))
+            set_expires_in(obj, float(data.get("expiresIn")))
+            set_expires_at(obj, parse_datetime(data.get("expiresAt")))
+            append(obj)
+        return result
+
+
+BearerToken._slot_setters = _slot_setters(BearerToken)
+
+
+@_frozen_dataclass
+class CancelAction:
+    can_cancel: bool
+
+    _api_fields = {'canCancel': 'can_cancel'}
+    _schema_version = 0xa423f568
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'canCancel': self.can_cancel,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'CancelAction':
+        return cls(
+            can_cancel=data.get("canCancel"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'CancelAction':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['CancelAction']:
+        set_can_cancel, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_can_cancel(obj, data.get("canCancel"))
+            append(obj)
+        return result
+
+
+CancelAction._slot_setters = _slot_setters(CancelAction)
+
+
+@_frozen_dataclass
+class PricingSnapshot:
+    service_name: str
+    """Name of the service."""
+
+    price: float
+    """Total cost."""
+
+
+    _api_fields = {'serviceName': 'service_name', 'price': 'price'}
+    _schema_version = 0xb6b3aedf
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'serviceName': self.service_name,
+            'price': self.price,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'PricingSnapshot':
+        return cls(
+            service_name=_intern(data.get("serviceName")),
+            price=float(data.get("price")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'PricingSnapshot':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['PricingSnapshot']:
+        intern = _current_intern_table().intern
+        set_service_name, set_price, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_service_name(obj, intern(data.get("serviceName")))
+            set_price(obj, float(data.get("price")))
+            append(obj)
+        return result
+
+
+PricingSnapshot._slot_setters = _slot_setters(PricingSnapshot)
+
+
+@_frozen_dataclass
+class ReactivationAction:
+    can_reactivate: bool
+
+    _api_fields = {'canReactivate': 'can_reactivate'}
+    _schema_version = 0x4058b868
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'canReactivate': self.can_reactivate,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'ReactivationAction':
+        return cls(
+            can_reactivate=data.get("canReactivate"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ReactivationAction':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['ReactivationAction']:
+        set_can_reactivate, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_can_reactivate(obj, data.get("canReactivate"))
+            append(obj)
+        return result
+
+
+ReactivationAction._slot_setters = _slot_setters(ReactivationAction)
+
+
+@_frozen_dataclass
+class ReportAction:
+    can_report: bool
+
+    _api_fields = {'canReport': 'can_report'}
+    _schema_version = 0xf9702cc7
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'canReport': self.can_report,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'ReportAction':
+        return cls(
+            can_report=data.get("canReport"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ReportAction':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['ReportAction']:
+        set_can_report, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_can_report(obj, data.get("canReport"))
+            append(obj)
+        return result
+
+
+ReportAction._slot_setters = _slot_setters(ReportAction)
+
+
+@_frozen_dataclass
+class Error:
+    error_code: Optional[str] = None
+    error_description: Optional[str] = None
+
+    _api_fields = {'errorCode': 'error_code', 'errorDescription': 'error_description'}
+    _schema_version = 0x00a6bf2b
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'errorCode': self.error_code,
+            'errorDescription': self.error_description,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'Error':
+        return cls(
+            error_code=data.get("errorCode"),
+            error_description=data.get("errorDescription"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Error':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['Error']:
+        set_error_code, set_error_description, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_error_code(obj, data.get("errorCode"))
+            set_error_description(obj, data.get("errorDescription"))
+            append(obj)
+        return result
+
+
+Error._slot_setters = _slot_setters(Error)
+
+
+@_frozen_dataclass
+class RefundAction:
+    can_refund: bool
+    refundable_until: Optional[datetime.datetime] = None
+
+    _api_fields = {'canRefund': 'can_refund', 'refundableUntil': 'refundable_until'}
+    _schema_version = 0x28a1a0ee
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'canRefund': self.can_refund,
+            'refundableUntil': (self.refundable_until.isoformat() if self.refundable_until is not None else None),
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'RefundAction':
+        _refundable_until = data.get("refundableUntil")
+        return cls(
+            can_refund=data.get("canRefund"),
+            refundable_until=(_parse_datetime(_refundable_until) if _refundable_until is not None else None),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'RefundAction':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['RefundAction']:
+        parse_datetime = _batch_datetime_parser()
+        set_can_refund, set_refundable_until, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            _refundable_until = data.get("refundableUntil")
+            obj = new(cls)
+            set_can_refund(obj, data.get("canRefund"))
+            set_refundable_until(obj, (parse_datetime(_refundable_until) if _refundable_until is not None else None))
+            append(obj)
+        return result
+
+
+RefundAction._slot_setters = _slot_setters(RefundAction)
+
+
+@_frozen_dataclass
+class ReuseAction:
+    reusable_until: Optional[datetime.datetime] = None
+
+    _api_fields = {'reusableUntil': 'reusable_until'}
+    _schema_version = 0x3f7e0008
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'reusableUntil': (self.reusable_until.isoformat() if self.reusable_until is not None else None),
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'ReuseAction':
+        _reusable_until = data.get("reusableUntil")
+        return cls(
+            reusable_until=(_parse_datetime(_reusable_until) if _reusable_until is not None else None),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ReuseAction':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['ReuseAction']:
+        parse_datetime = _batch_datetime_parser()
+        set_reusable_until, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            _reusable_until = data.get("reusableUntil")
+            obj = new(cls)
+            set_reusable_until(obj, (parse_datetime(_reusable_until) if _reusable_until is not None else None))
+            append(obj)
+        return result
+
+
+ReuseAction._slot_setters = _slot_setters(ReuseAction)
+
+
@@ -0,0 +1,1115 @@
+"""
+Generated rentals enums and dataclasses from Swagger schema
+This file is auto-generated. Do not edit manually.
+"""
+from enum import Enum
+from typing import Optional, Dict, List, Any
+import datetime
+from ._base import (
+    _Unparsed,
+    _batch_datetime_parser,
+    _binary_dumps,
+    _binary_loads,
+    _current_intern_table,
+    _frozen_dataclass,
+    _intern,
+    _intern_opt_in,
+    _lazy_fields,
+    _MemoizedJson,
+    _opt_in_interner,
+    _parse_datetime,
+    _slot_setters,
+)
+from .common import BackOrderState, NumberType, RefundAction, RentalDuration, ReservationCapability, ReservationSaleState, ReservationState, ReservationType
+
+__all__ = ['AddOnSnapshot', 'BackOrderReservationCompact', 'RentalExtensionRequest', 'Reservation', 'ReservationSaleCompact', 'BackOrderReservationExpanded', 'LineHealth', 'NonrenewableRentalCompact', 'NonrenewableRentalUpdateRequest', 'RenewableRentalCompact', 'RenewableRentalUpdateRequest', 'RentalPriceCheckRequest', 'RentalSnapshot', 'NewRentalRequest', 'NonrenewableRentalExpanded', 'RenewableRentalExpanded', 'ReservationSaleExpanded']
+
+
+@_frozen_dataclass
+class AddOnSnapshot:
+    add_on_id: str
+    description: str
+    renewal_cost: float
+    already_renewed: bool
+
+    _api_fields = {'addOnId': 'add_on_id', 'description': 'description', 'renewalCost': 'renewal_cost', 'alreadyRenewed': 'already_renewed'}
+    _schema_version = 0xe5e6c73c
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'addOnId': self.add_on_id,
+            'description': self.description,
+            'renewalCost': self.renewal_cost,
+            'alreadyRenewed': self.already_renewed,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'AddOnSnapshot':
+        return cls(
+            add_on_id=data.get("addOnId"),
+            description=data.get("description"),
+            renewal_cost=float(data.get("renewalCost")),
+            already_renewed=data.get("alreadyRenewed"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'AddOnSnapshot':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['AddOnSnapshot']:
+        set_add_on_id, set_description, set_renewal_cost, set_already_renewed, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_add_on_id(obj, data.get("addOnId"))
+            set_description(obj, data.get("description"))
+            set_renewal_cost(obj, float(data.get("renewalCost")))
+            set_already_renewed(obj, data.get("alreadyRenewed"))
+            append(obj)
+        return result
+
+
+AddOnSnapshot._slot_setters = _slot_setters(AddOnSnapshot)
+
+
+@_frozen_dataclass
+class BackOrderReservationCompact:
+    id: str
+    service_name: str
+    """Name of service"""
+
+    status: BackOrderState
+
+    _api_fields = {'id': 'id', 'serviceName': 'service_name', 'status': 'status'}
+    _schema_version = 0xeb7be441
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'serviceName': self.service_name,
+            'status': self.status.to_api(),
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'BackOrderReservationCompact':
+        return cls(
+            id=data.get("id"),
+            service_name=_intern(data.get("serviceName")),
+            status=BackOrderState.from_api(data.get("status")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BackOrderReservationCompact':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['BackOrderReservationCompact']:
+        intern = _current_intern_table().intern
+        set_id, set_service_name, set_status, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_id(obj, data.get("id"))
+            set_service_name(obj, intern(data.get("serviceName")))
+            set_status(obj, BackOrderState.from_api(data.get("status")))
+            append(obj)
+        return result
+
+
+BackOrderReservationCompact._slot_setters = _slot_setters(BackOrderReservationCompact)
+
+
+@_frozen_dataclass
+class RentalExtensionRequest:
+    extension_duration: RentalDuration
+    rental_id: str
+
+    _api_fields = {'extensionDuration': 'extension_duration', 'rentalId': 'rental_id'}
+    _schema_version = 0x999ee325
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'extensionDuration': self.extension_duration.to_api(),
+            'rentalId': self.rental_id,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'RentalExtensionRequest':
+        return cls(
+            extension_duration=RentalDuration.from_api(data.get("extensionDuration")),
+            rental_id=data.get("rentalId"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'RentalExtensionRequest':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['RentalExtensionRequest']:
+        set_extension_duration, set_rental_id, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_extension_duration(obj, RentalDuration.from_api(data.get("extensionDuration")))
+            set_rental_id(obj, data.get("rentalId"))
+            append(obj)
+        return result
+
+
+RentalExtensionRequest._slot_setters = _slot_setters(RentalExtensionRequest)
+
+
+@_frozen_dataclass
+class Reservation:
+    id: str
+    """Id of the reservation"""
+
+    reservation_type: ReservationType
+    service_name: str
+    """Name of service"""
+
+
+    _api_fields = {'id': 'id', 'reservationType': 'reservation_type', 'serviceName': 'service_name'}
+    _schema_version = 0xea38481b
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'reservationType': self.reservation_type.to_api(),
+            'serviceName': self.service_name,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'Reservation':
+        return cls(
+            id=data.get("id"),
+            reservation_type=ReservationType.from_api(data.get("reservationType")),
+            service_name=_intern(data.get("serviceName")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Reservation':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['Reservation']:
+        intern = _current_intern_table().intern
+        set_id, set_reservation_type, set_service_name, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_id(obj, data.get("id"))
+            set_reservation_type(obj, ReservationType.from_api(data.get("reservationType")))
+            set_service_name(obj, intern(data.get("serviceName")))
+            append(obj)
+        return result
+
+
+Reservation._slot_setters = _slot_setters(Reservation)
+
+
+@_frozen_dataclass
+class ReservationSaleCompact:
+    created_at: datetime.datetime
+    id: str
+    state: ReservationSaleState
+    total_cost: float
+    """Example: 0.95"""
+
+    updated_at: datetime.datetime
+
+    _api_fields = {'createdAt': 'created_at', 'id': 'id', 'state': 'state', 'totalCost': 'total_cost', 'updatedAt': 'updated_at'}
+    _schema_version = 0xa816b883
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'createdAt': self.created_at.isoformat(),
+            'id': self.id,
+            'state': self.state.to_api(),
+            'totalCost': self.total_cost,
+            'updatedAt': self.updated_at.isoformat(),
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'ReservationSaleCompact':
+        return cls(
+            created_at=_parse_datetime(data.get("createdAt")),
+            id=data.get("id"),
+            state=ReservationSaleState.from_api(data.get("state")),
+            total_cost=float(data.get("totalCost")),
+            updated_at=_parse_datetime(data.get("updatedAt")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ReservationSaleCompact':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['ReservationSaleCompact']:
+        parse_datetime = _batch_datetime_parser()
+        set_created_at, set_id, set_state, set_total_cost, set_updated_at, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_created_at(obj, parse_datetime(data.get("createdAt")))
+            set_id(obj, data.get("id"))
+            set_state(obj, ReservationSaleState.from_api(data.get("state")))
+            set_total_cost(obj, float(data.get("totalCost")))
+            set_updated_at(obj, parse_datetime(data.get("updatedAt")))
+            append(obj)
+        return result
+
+
+ReservationSaleCompact._slot_setters = _slot_setters(ReservationSaleCompact)
+
+
+@_frozen_dataclass
+class BackOrderReservationExpanded:
+    id: str
+    service_name: str
+    sale_id: str
+    status: BackOrderState
+    reservation_id: Optional[str] = None
+
+    _api_fields = {'id': 'id', 'serviceName': 'service_name', 'saleId': 'sale_id', 'status': 'status', 'reservationId': 'reservation_id'}
+    _schema_version = 0xc94cb283
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'serviceName': self.service_name,
+            'saleId': self.sale_id,
+            'status': self.status.to_api(),
+            'reservationId': self.reservation_id,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'BackOrderReservationExpanded':
+        return cls(
+            id=data.get("id"),
+            service_name=_intern(data.get("serviceName")),
+            sale_id=_intern_opt_in(data.get("saleId")),
+            status=BackOrderState.from_api(data.get("status")),
+            reservation_id=data.get("reservationId"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BackOrderReservationExpanded':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['BackOrderReservationExpanded']:
+        intern = _current_intern_table().intern
+        intern_opt_in = _opt_in_interner()
+        set_id, set_service_name, set_sale_id, set_status, set_reservation_id, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_id(obj, data.get("id"))
+            set_service_name(obj, intern(data.get("serviceName")))
+            set_sale_id(obj, intern_opt_in(data.get("saleId")))
+            set_status(obj, BackOrderState.from_api(data.get("status")))
+            set_reservation_id(obj, data.get("reservationId"))
+            append(obj)
+        return result
+
+
+BackOrderReservationExpanded._slot_setters = _slot_setters(BackOrderReservationExpanded)
+
+
+@_frozen_dataclass
+class LineHealth:
+    line_number: str
+    """Line number associated with the reservation."""
+
+    checked_at: Optional[datetime.datetime] = None
+
+    _api_fields = {'lineNumber': 'line_number', 'checkedAt': 'checked_at'}
+    _schema_version = 0xf30ee297
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'lineNumber': self.line_number,
+            'checkedAt': (self.checked_at.isoformat() if self.checked_at is not None else None),
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'LineHealth':
+        _checked_at = data.get("checkedAt")
+        return cls(
+            line_number=data.get("lineNumber"),
+            checked_at=(_parse_datetime(_checked_at) if _checked_at is not None else None),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'LineHealth':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['LineHealth']:
+        parse_datetime = _batch_datetime_parser()
+        set_line_number, set_checked_at, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            _checked_at = data.get("checkedAt")
+            obj = new(cls)
+            set_line_number(obj, data.get("lineNumber"))
+            set_checked_at(obj, (parse_datetime(_checked_at) if _checked_at is not None else None))
+            append(obj)
+        return result
+
+
+LineHealth._slot_setters = _slot_setters(LineHealth)
+
+
+@_frozen_dataclass
+class NonrenewableRentalCompact:
+    created_at: datetime.datetime
+    id: str
+    service_name: str
+    state: ReservationState
+    number: str
+    always_on: bool
+    sale_id: Optional[str] = None
+
+    _api_fields = {'createdAt': 'created_at', 'id': 'id', 'serviceName': 'service_name', 'state': 'state', 'number': 'number', 'alwaysOn': 'always_on', 'saleId': 'sale_id'}
+    _schema_version = 0x9f8a687e
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'createdAt': self.created_at.isoformat(),
+            'id': self.id,
+            'serviceName': self.service_name,
+            'state': self.state.to_api(),
+            'number': self.number,
+            'alwaysOn': self.always_on,
+            'saleId': self.sale_id,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'NonrenewableRentalCompact':
+        return cls(
+            created_at=_parse_datetime(data.get("createdAt")),
+            id=data.get("id"),
+            service_name=_intern(data.get("serviceName")),
+            state=ReservationState.from_api(data.get("state")),
+            number=_intern_opt_in(data.get("number")),
+            always_on=data.get("alwaysOn"),
+            sale_id=_intern_opt_in(data.get("saleId")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'NonrenewableRentalCompact':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['NonrenewableRentalCompact']:
+        parse_datetime = _batch_datetime_parser()
+        intern = _current_intern_table().intern
+        intern_opt_in = _opt_in_interner()
+        set_created_at, set_id, set_service_name, set_state, set_number, set_always_on, set_sale_id, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_created_at(obj, parse_datetime(data.get("createdAt")))
+            set_id(obj, data.get("id"))
+            set_service_name(obj, intern(data.get("serviceName")))
+            set_state(obj, ReservationState.from_api(data.get("state")))
+            set_number(obj, intern_opt_in(data.get("number")))
+            set_always_on(obj, data.get("alwaysOn"))
+            set_sale_id(obj, intern_opt_in(data.get("saleId")))
+            append(obj)
+        return result
+
+
+NonrenewableRentalCompact._slot_setters = _slot_setters(NonrenewableRentalCompact)
+
+
+@_frozen_dataclass
+class NonrenewableRentalUpdateRequest:
+    """Supplying a value of 'null' or not supplying a value for any nullable properties will cause the property to be ignored.
+
+    """
+
+    user_notes: Optional[str] = None
+    mark_all_sms_read: Optional[bool] = None
+
+    _api_fields = {'userNotes': 'user_notes', 'markAllSmsRead': 'mark_all_sms_read'}
+    _schema_version = 0xcc5a45ce
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'userNotes': self.user_notes,
+            'markAllSmsRead': self.mark_all_sms_read,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'NonrenewableRentalUpdateRequest':
+        return cls(
+            user_notes=data.get("userNotes"),
+            mark_all_sms_read=data.get("markAllSmsRead"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'NonrenewableRentalUpdateRequest':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['NonrenewableRentalUpdateRequest']:
+        set_user_notes, set_mark_all_sms_read, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_user_notes(obj, data.get("userNotes"))
+            set_mark_all_sms_read(obj, data.get("markAllSmsRead"))
+            append(obj)
+        return result
+
+
+NonrenewableRentalUpdateRequest._slot_setters = _slot_setters(NonrenewableRentalUpdateRequest)
+
+
+@_frozen_dataclass
+class RenewableRentalCompact:
+    created_at: datetime.datetime
+    id: str
+    service_name: str
+    """Example: yahoo"""
+
+    state: ReservationState
+    billing_cycle_id: str
+    is_included_for_next_renewal: bool
+    number: str
+    """Example: 2223334444"""
+
+    always_on: bool
+    sale_id: Optional[str] = None
+
+    _api_fields = {'createdAt': 'created_at', 'id': 'id', 'serviceName': 'service_name', 'state': 'state', 'billingCycleId': 'billing_cycle_id', 'isIncludedForNextRenewal': 'is_included_for_next_renewal', 'number': 'number', 'alwaysOn': 'always_on', 'saleId': 'sale_id'}
+    _schema_version = 0xf00e6e5a
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'createdAt': self.created_at.isoformat(),
+            'id': self.id,
+            'serviceName': self.service_name,
+            'state': self.state.to_api(),
+            'billingCycleId': self.billing_cycle_id,
+            'isIncludedForNextRenewal': self.is_included_for_next_renewal,
+            'number': self.number,
+            'alwaysOn': self.always_on,
+            'saleId': self.sale_id,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'RenewableRentalCompact':
+        return cls(
+            created_at=_parse_datetime(data.get("createdAt")),
+            id=data.get("id"),
+            service_name=_intern(data.get("serviceName")),
+            state=ReservationState.from_api(data.get("state")),
+            billing_cycle_id=_intern_opt_in(data.get("billingCycleId")),
+            is_included_for_next_renewal=data.get("isIncludedForNextRenewal"),
+            number=_intern_opt_in(data.get("number")),
+            always_on=data.get("alwaysOn"),
+            sale_id=_intern_opt_in(data.get("saleId")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'RenewableRentalCompact':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['RenewableRentalCompact']:
+        parse_datetime = _batch_datetime_parser()
+        intern = _current_intern_table().intern
+        intern_opt_in = _opt_in_interner()
+        set_created_at, set_id, set_service_name, set_state, set_billing_cycle_id, set_is_included_for_next_renewal, set_number, set_always_on, set_sale_id, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_created_at(obj, parse_datetime(data.get("createdAt")))
+            set_id(obj, data.get("id"))
+            set_service_name(obj, intern(data.get("serviceName")))
+            set_state(obj, ReservationState.from_api(data.get("state")))
+            set_billing_cycle_id(obj, intern_opt_in(data.get("billingCycleId")))
+            set_is_included_for_next_renewal(obj, data.get("isIncludedForNextRenewal"))
+            set_number(obj, intern_opt_in(data.get("number")))
+            set_always_on(obj, data.get("alwaysOn"))
+            set_sale_id(obj, intern_opt_in(data.get("saleId")))
+            append(obj)
+        return result
+
+
+RenewableRentalCompact._slot_setters = _slot_setters(RenewableRentalCompact)
+
+
+@_frozen_dataclass
+class RenewableRentalUpdateRequest:
+    """Supplying a value of 'null' or not supplying a value for any nullable properties will cause the property to be ignored.
+
+    """
+
+    user_notes: Optional[str] = None
+    include_for_renewal: Optional[bool] = None
+    mark_all_sms_read: Optional[bool] = None
+
+    _api_fields = {'userNotes': 'user_notes', 'includeForRenewal': 'include_for_renewal', 'markAllSmsRead': 'mark_all_sms_read'}
+    _schema_version = 0xccb9f4bd
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'userNotes': self.user_notes,
+            'includeForRenewal': self.include_for_renewal,
+            'markAllSmsRead': self.mark_all_sms_read,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'RenewableRentalUpdateRequest':
+        return cls(
+            user_notes=data.get("userNotes"),
+            include_for_renewal=data.get("includeForRenewal"),
+            mark_all_sms_read=data.get("markAllSmsRead"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'RenewableRentalUpdateRequest':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['RenewableRentalUpdateRequest']:
+        set_user_notes, set_include_for_renewal, set_mark_all_sms_read, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_user_notes(obj, data.get("userNotes"))
+            set_include_for_renewal(obj, data.get("includeForRenewal"))
+            set_mark_all_sms_read(obj, data.get("markAllSmsRead"))
+            append(obj)
+        return result
+
+
+RenewableRentalUpdateRequest._slot_setters = _slot_setters(RenewableRentalUpdateRequest)
+
+
+@_frozen_dataclass
+class RentalPriceCheckRequest(_MemoizedJson):
+    service_name: str
+    """Name of the service"""
+
+    area_code: bool
+    """Set to true if a specific area code will be requested when creating a rental, false if any area code can be used."""
+
+    number_type: NumberType
+    capability: ReservationCapability
+    always_on: bool
+    """Example: True"""
+
+    is_renewable: bool
+    """Example: True"""
+
+    duration: RentalDuration
+    call_forwarding: Optional[bool] = None
+    billing_cycle_id_to_assign_to: Optional[str] = None
+
+    _api_fields = {'serviceName': 'service_name', 'areaCode': 'area_code', 'numberType': 'number_type', 'capability': 'capability', 'alwaysOn': 'always_on', 'isRenewable': 'is_renewable', 'duration': 'duration', 'callForwarding': 'call_forwarding', 'billingCycleIdToAssignTo': 'billing_cycle_id_to_assign_to'}
+    _schema_version = 0x4c7c1855
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'serviceName': self.service_name,
+            'areaCode': self.area_code,
+            'numberType': self.number_type.to_api(),
+            'capability': self.capability.to_api(),
+            'alwaysOn': self.always_on,
+            'isRenewable': self.is_renewable,
+            'duration': self.duration.to_api(),
+            'callForwarding': self.call_forwarding,
+            'billingCycleIdToAssignTo': self.billing_cycle_id_to_assign_to,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'RentalPriceCheckRequest':
+        return cls(
+            service_name=_intern(data.get("serviceName")),
+            area_code=data.get("areaCode"),
+            number_type=NumberType.from_api(data.get("numberType")),
+            capability=ReservationCapability.from_api(data.get("capability")),
+            always_on=data.get("alwaysOn"),
+            is_renewable=data.get("isRenewable"),
+            duration=RentalDuration.from_api(data.get("duration")),
+            call_forwarding=data.get("callForwarding"),
+            billing_cycle_id_to_assign_to=data.get("billingCycleIdToAssignTo"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'RentalPriceCheckRequest':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['RentalPriceCheckRequest']:
+        intern = _current_intern_table().intern
+        set_service_name, set_area_code, set_number_type, set_capability, set_always_on, set_is_renewable, set_duration, set_call_forwarding, set_billing_cycle_id_to_assign_to, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_service_name(obj, intern(data.get("serviceName")))
+            set_area_code(obj, data.get("areaCode"))
+            set_number_type(obj, NumberType.from_api(data.get("numberType")))
+            set_capability(obj, ReservationCapability.from_api(data.get("capability")))
+            set_always_on(obj, data.get("alwaysOn"))
+            set_is_renewable(obj, data.get("isRenewable"))
+            set_duration(obj, RentalDuration.from_api(data.get("duration")))
+            set_call_forwarding(obj, data.get("callForwarding"))
+            set_billing_cycle_id_to_assign_to(obj, data.get("billingCycleIdToAssignTo"))
+            append(obj)
+        return result
+
+
+RentalPriceCheckRequest._slot_setters = _slot_setters(RentalPriceCheckRequest)
+
+
+@_frozen_dataclass
+class RentalSnapshot:
+    number: str
+    renewal_cost: float
+    """Renewal cost, in account credits."""
+
+    service_name: str
+    already_renewed: bool
+    included_add_ons: List[AddOnSnapshot]
+    excluded_add_ons: List[AddOnSnapshot]
+
+    _api_fields = {'number': 'number', 'renewalCost': 'renewal_cost', 'serviceName': 'service_name', 'alreadyRenewed': 'already_renewed', 'includedAddOns': 'included_add_ons', 'excludedAddOns': 'excluded_add_ons'}
+    _schema_version = 0xdd2b8784
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'number': self.number,
+            'renewalCost': self.renewal_cost,
+            'serviceName': self.service_name,
+            'alreadyRenewed': self.already_renewed,
+            'includedAddOns': [item.to_api() for item in self.included_add_ons],
+            'excludedAddOns': [item.to_api() for item in self.excluded_add_ons],
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'RentalSnapshot':
+        return cls(
+            number=_intern_opt_in(data.get("number")),
+            renewal_cost=float(data.get("renewalCost")),
+            service_name=_intern(data.get("serviceName")),
+            already_renewed=data.get("alreadyRenewed"),
+            included_add_ons=[AddOnSnapshot.from_api(item) for item in data.get("includedAddOns")],
+            excluded_add_ons=[AddOnSnapshot.from_api(item) for item in data.get("excludedAddOns")],
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'RentalSnapshot':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['RentalSnapshot']:
+        intern = _current_intern_table().intern
+        intern_opt_in = _opt_in_interner()
+        set_number, set_renewal_cost, set_service_name, set_already_renewed, set_included_add_ons, set_excluded_add_ons, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_number(obj, intern_opt_in(data.get("number")))
+            set_renewal_cost(obj, float(data.get("renewalCost")))
+            set_service_name(obj, intern(data.get("serviceName")))
+            set_already_renewed(obj, data.get("alreadyRenewed"))
+            set_included_add_ons(obj, AddOnSnapshot.from_api_many(data.get("includedAddOns")))
+            set_excluded_add_ons(obj, AddOnSnapshot.from_api_many(data.get("excludedAddOns")))
+            append(obj)
+        return result
+
+
+RentalSnapshot._slot_setters = _slot_setters(RentalSnapshot)
+
+
+@_frozen_dataclass
+class NewRentalRequest(_MemoizedJson):
+    allow_back_order_reservations: bool
+    """If set to true, a rental back order will be created if the requested rental is out of stock"""
+
+    always_on: bool
+    """If set to true, a line that does not require wake up will be assigned if in stock"""
+
+    duration: RentalDuration
+    is_renewable: bool
+    number_type: NumberType
+    service_name: str
+    """Name of the service"""
+
+    capability: ReservationCapability
+    area_code_select_option: Optional[List[str]] = None
+    billing_cycle_id_to_assign_to: Optional[str] = None
+
+    _api_fields = {'allowBackOrderReservations': 'allow_back_order_reservations', 'alwaysOn': 'always_on', 'duration': 'duration', 'isRenewable': 'is_renewable', 'numberType': 'number_type', 'serviceName': 'service_name', 'capability': 'capability', 'areaCodeSelectOption': 'area_code_select_option', 'billingCycleIdToAssignTo': 'billing_cycle_id_to_assign_to'}
+    _schema_version = 0x690defe2
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'allowBackOrderReservations': self.allow_back_order_reservations,
+            'alwaysOn': self.always_on,
+            'duration': self.duration.to_api(),
+            'isRenewable': self.is_renewable,
+            'numberType': self.number_type.to_api(),
+            'serviceName': self.service_name,
+            'capability': self.capability.to_api(),
+            'areaCodeSelectOption': (list(self.area_code_select_option) if self.area_code_select_option is not None else None),
+            'billingCycleIdToAssignTo': self.billing_cycle_id_to_assign_to,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'NewRentalRequest':
+        _area_code_select_option = data.get("areaCodeSelectOption")
+        return cls(
+            allow_back_order_reservations=data.get("allowBackOrderReservations"),
+            always_on=data.get("alwaysOn"),
+            duration=RentalDuration.from_api(data.get("duration")),
+            is_renewable=data.get("isRenewable"),
+            number_type=NumberType.from_api(data.get("numberType")),
+            service_name=_intern(data.get("serviceName")),
+            capability=ReservationCapability.from_api(data.get("capability")),
+            area_code_select_option=(list(_area_code_select_option) if _area_code_select_option is not None else None),
+            billing_cycle_id_to_assign_to=data.get("billingCycleIdToAssignTo"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'NewRentalRequest':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['NewRentalRequest']:
+        intern = _current_intern_table().intern
+        set_allow_back_order_reservations, set_always_on, set_duration, set_is_renewable, set_number_type, set_service_name, set_capability, set_area_code_select_option, set_billing_cycle_id_to_assign_to, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            _area_code_select_option = data.get("areaCodeSelectOption")
+            obj = new(cls)
+            set_allow_back_order_reservations(obj, data.get("allowBackOrderReservations"))
+            set_always_on(obj, data.get("alwaysOn"))
+            set_duration(obj, RentalDuration.from_api(data.get("duration")))
+            set_is_renewable(obj, data.get("isRenewable"))
+            set_number_type(obj, NumberType.from_api(data.get("numberType")))
+            set_service_name(obj, intern(data.get("serviceName")))
+            set_capability(obj, ReservationCapability.from_api(data.get("capability")))
+            set_area_code_select_option(obj, (list(_area_code_select_option) if _area_code_select_option is not None else None))
+            set_billing_cycle_id_to_assign_to(obj, data.get("billingCycleIdToAssignTo"))
+            append(obj)
+        return result
+
+
+NewRentalRequest._slot_setters = _slot_setters(NewRentalRequest)
+
+
+@_lazy_fields(
+    refund=lambda value: RefundAction.from_api(value),
+)
+@_frozen_dataclass
+class NonrenewableRentalExpanded:
+    created_at: datetime.datetime
+    ends_at: datetime.datetime
+    id: str
+    refund: RefundAction
+    service_name: str
+    state: ReservationState
+    number: str
+    always_on: bool
+    sale_id: Optional[str] = None
+
+    _api_fields = {'createdAt': 'created_at', 'endsAt': 'ends_at', 'id': 'id', 'refund': 'refund', 'serviceName': 'service_name', 'state': 'state', 'number': 'number', 'alwaysOn': 'always_on', 'saleId': 'sale_id'}
+    _schema_version = 0x5cca59f0
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'createdAt': self.created_at.isoformat(),
+            'endsAt': self.ends_at.isoformat(),
+            'id': self.id,
+            'refund': self.refund.to_api(),
+            'serviceName': self.service_name,
+            'state': self.state.to_api(),
+            'number': self.number,
+            'alwaysOn': self.always_on,
+            'saleId': self.sale_id,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'NonrenewableRentalExpanded':
+        return cls(
+            created_at=_parse_datetime(data.get("createdAt")),
+            ends_at=_parse_datetime(data.get("endsAt")),
+            id=data.get("id"),
+            refund=data.get("refund"),
+            service_name=_intern(data.get("serviceName")),
+            state=ReservationState.from_api(data.get("state")),
+            number=_intern_opt_in(data.get("number")),
+            always_on=data.get("alwaysOn"),
+            sale_id=_intern_opt_in(data.get("saleId")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'NonrenewableRentalExpanded':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['NonrenewableRentalExpanded']:
+        parse_datetime = _batch_datetime_parser()
+        intern = _current_intern_table().intern
+        intern_opt_in = _opt_in_interner()
+        set_created_at, set_ends_at, set_id, set_refund, set_service_name, set_state, set_number, set_always_on, set_sale_id, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_created_at(obj, parse_datetime(data.get("createdAt")))
+            set_ends_at(obj, parse_datetime(data.get("endsAt")))
+            set_id(obj, data.get("id"))
+            set_refund(obj, data.get("refund"))
+            set_service_name(obj, intern(data.get("serviceName")))
+            set_state(obj, ReservationState.from_api(data.get("state")))
+            set_number(obj, intern_opt_in(data.get("number")))
+            set_always_on(obj, data.get("alwaysOn"))
+            set_sale_id(obj, intern_opt_in(data.get("saleId")))
+            append(obj)
+        return result
+
+
+NonrenewableRentalExpanded._slot_setters = _slot_setters(NonrenewableRentalExpanded)
+
+
+@_lazy_fields(
+    refund=lambda value: RefundAction.from_api(value),
+)
+@_frozen_dataclass
+class RenewableRentalExpanded:
+    created_at: datetime.datetime
+    id: str
+    refund: RefundAction
+    service_name: str
+    state: ReservationState
+    billing_cycle_id: str
+    is_included_for_next_renewal: bool
+    number: str
+    """Example: 2223334444"""
+
+    always_on: bool
+    sale_id: Optional[str] = None
+
+    _api_fields = {'createdAt': 'created_at', 'id': 'id', 'refund': 'refund', 'serviceName': 'service_name', 'state': 'state', 'billingCycleId': 'billing_cycle_id', 'isIncludedForNextRenewal': 'is_included_for_next_renewal', 'number': 'number', 'alwaysOn': 'always_on', 'saleId': 'sale_id'}
+    _schema_version = 0x793938ec
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'createdAt': self.created_at.isoformat(),
+            'id': self.id,
+            'refund': self.refund.to_api(),
+            'serviceName': self.service_name,
+            'state': self.state.to_api(),
+            'billingCycleId': self.billing_cycle_id,
+            'isIncludedForNextRenewal': self.is_included_for_next_renewal,
+            'number': self.number,
+            'alwaysOn': self.always_on,
+            'saleId': self.sale_id,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'RenewableRentalExpanded':
+        return cls(
+            created_at=_parse_datetime(data.get("createdAt")),
+            id=data.get("id"),
+            refund=data.get("refund"),
+            service_name=_intern(data.get("serviceName")),
+            state=ReservationState.from_api(data.get("state")),
+            billing_cycle_id=_intern_opt_in(data.get("billingCycleId")),
+            is_included_for_next_renewal=data.get("isIncludedForNextRenewal"),
+            number=_intern_opt_in(data.get("number")),
+            always_on=data.get("alwaysOn"),
+            sale_id=_intern_opt_in(data.get("saleId")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'RenewableRentalExpanded':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['RenewableRentalExpanded']:
+        parse_datetime = _batch_datetime_parser()
+        intern = _current_intern_table().intern
+        intern_opt_in = _opt_in_interner()
+        set_created_at, set_id, set_refund, set_service_name, set_state, set_billing_cycle_id, set_is_included_for_next_renewal, set_number, set_always_on, set_sale_id, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_created_at(obj, parse_datetime(data.get("createdAt")))
+            set_id(obj, data.get("id"))
+            set_refund(obj, data.get("refund"))
+            set_service_name(obj, intern(data.get("serviceName")))
+            set_state(obj, ReservationState.from_api(data.get("state")))
+            set_billing_cycle_id(obj, intern_opt_in(data.get("billingCycleId")))
+            set_is_included_for_next_renewal(obj, data.get("isIncludedForNextRenewal"))
+            set_number(obj, intern_opt_in(data.get("number")))
+            set_always_on(obj, data.get("alwaysOn"))
+            set_sale_id(obj, intern_opt_in(data.get("saleId")))
+            append(obj)
+        return result
+
+
+RenewableRentalExpanded._slot_setters = _slot_setters(RenewableRentalExpanded)
+
+
+@_lazy_fields(
+    back_order_reservations=lambda value: BackOrderReservationCompact.from_api_many(value),
+    reservations=lambda value: Reservation.from_api_many(value),
+)
+@_frozen_dataclass
+class ReservationSaleExpanded:
+    created_at: datetime.datetime
+    id: str
+    back_order_reservations: List[BackOrderReservationCompact]
+    reservations: List[Reservation]
+    state: ReservationSaleState
+    total: float
+    """Total amount of the sale, in account credits."""
+
+    updated_at: datetime.datetime
+
+    _api_fields = {'createdAt': 'created_at', 'id': 'id', 'backOrderReservations': 'back_order_reservations', 'reservations': 'reservations', 'state': 'state', 'total': 'total', 'updatedAt': 'updated_at'}
+    _schema_version = 0x81479945
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'createdAt': self.created_at.isoformat(),
+            'id': self.id,
+            'backOrderReservations': [item.to_api() for item in self.back_order_reservations],
+            'reservations': [item.to_api() for item in self.reservations],
+            'state': self.state.to_api(),
+            'total': self.total,
+            'updatedAt': self.updated_at.isoformat(),
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'ReservationSaleExpanded':
+        return cls(
+            created_at=_parse_datetime(data.get("createdAt")),
+            id=data.get("id"),
+            back_order_reservations=_Unparsed(data.get("backOrderReservations")),
+            reservations=_Unparsed(data.get("reservations")),
+            state=ReservationSaleState.from_api(data.get("state")),
+            total=float(data.get("total")),
+            updated_at=_parse_datetime(data.get("updatedAt")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ReservationSaleExpanded':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['ReservationSaleExpanded']:
+        parse_datetime = _batch_datetime_parser()
+        set_created_at, set_id, set_back_order_reservations, set_reservations, set_state, set_total, set_updated_at, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_created_at(obj, parse_datetime(data.get("createdAt")))
+            set_id(obj, data.get("id"))
+            set_back_order_reservations(obj, _Unparsed(data.get("backOrderReservations")))
+            set_reservations(obj, _Unparsed(data.get("reservations")))
+            set_state(obj, ReservationSaleState.from_api(data.get("state")))
+            set_total(obj, float(data.get("total")))
+            set_updated_at(obj, parse_datetime(data.get("updatedAt")))
+            append(obj)
+        return result
+
+
+ReservationSaleExpanded._slot_setters = _slot_setters(ReservationSaleExpanded)
+
+
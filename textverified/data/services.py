@@ -0,0 +1,124 @@
+"""
+Generated services enums and dataclasses from Swagger schema
+This file is auto-generated. Do not edit manually.
+"""
+from enum import Enum
+from typing import Optional, Dict, List, Any
+import datetime
+from ._base import (
+    _Unparsed,
+    _batch_datetime_parser,
+    _binary_dumps,
+    _binary_loads,
+    _current_intern_table,
+    _frozen_dataclass,
+    _intern,
+    _intern_opt_in,
+    _lazy_fields,
+    _MemoizedJson,
+    _opt_in_interner,
+    _parse_datetime,
+    _slot_setters,
+)
+from .common import ReservationCapability
+
+__all__ = ['AreaCode', 'Service']
+
+
+@_frozen_dataclass
+class AreaCode:
+    area_code: str
+    """Area code. Optionally supply this value when an ```areaCodeSelectOption``` is in the request body or parameter."""
+
+    state: str
+    """The US state associated with the area code."""
+
+
+    _api_fields = {'areaCode': 'area_code', 'state': 'state'}
+    _schema_version = 0xeeb6da59
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'areaCode': self.area_code,
+            'state': self.state,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'AreaCode':
+        return cls(
+            area_code=data.get("areaCode"),
+            state=data.get("state"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'AreaCode':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['AreaCode']:
+        set_area_code, set_state, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_area_code(obj, data.get("areaCode"))
+            set_state(obj, data.get("state"))
+            append(obj)
+        return result
+
+
+AreaCode._slot_setters = _slot_setters(AreaCode)
+
+
+@_frozen_dataclass
+class Service:
+    service_name: str
+    """Name of the service. Supply this value when a ```ServiceName``` is required."""
+
+    capability: ReservationCapability
+
+    _api_fields = {'serviceName': 'service_name', 'capability': 'capability'}
+    _schema_version = 0xae36a2f8
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'serviceName': self.service_name,
+            'capability': self.capability.to_api(),
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'Service':
+        return cls(
+            service_name=_intern(data.get("serviceName")),
+            capability=ReservationCapability.from_api(data.get("capability")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Service':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['Service']:
+        intern = _current_intern_table().intern
+        set_service_name, set_capability, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_service_name(obj, intern(data.get("serviceName")))
+            set_capability(obj, ReservationCapability.from_api(data.get("capability")))
+            append(obj)
+        return result
+
+
+Service._slot_setters = _slot_setters(Service)
+
+
@@ -0,0 +1,97 @@
+"""
+Generated sms enums and dataclasses from Swagger schema
+This file is auto-generated. Do not edit manually.
+"""
+from enum import Enum
+from typing import Optional, Dict, List, Any
+import datetime
+from ._base import (
+    _Unparsed,
+    _batch_datetime_parser,
+    _binary_dumps,
+    _binary_loads,
+    _current_intern_table,
+    _frozen_dataclass,
+    _intern,
+    _intern_opt_in,
+    _lazy_fields,
+    _MemoizedJson,
+    _opt_in_interner,
+    _parse_datetime,
+    _slot_setters,
+)
+
+__all__ = ['Sms']
+
+
+@_frozen_dataclass
+class Sms:
+    """Sms
+
+    """
+
+    id: str
+    to_value: str
+    created_at: datetime.datetime
+    encrypted: bool
+    from_value: Optional[str] = None
+    sms_content: Optional[str] = None
+    parsed_code: Optional[str] = None
+
+    _api_fields = {'id': 'id', 'to': 'to_value', 'createdAt': 'created_at', 'encrypted': 'encrypted', 'from': 'from_value', 'smsContent': 'sms_content', 'parsedCode': 'parsed_code'}
+    _schema_version = 0x1bcc5e2e
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'to': self.to_value,
+            'createdAt': self.created_at.isoformat(),
+            'encrypted': self.encrypted,
+            'from': self.from_value,
+            'smsContent': self.sms_content,
+            'parsedCode': self.parsed_code,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'Sms':
+        return cls(
+            id=data.get("id"),
+            to_value=_intern_opt_in(data.get("to")),
+            created_at=_parse_datetime(data.get("createdAt")),
+            encrypted=data.get("encrypted"),
+            from_value=_intern_opt_in(data.get("from")),
+            sms_content=data.get("smsContent"),
+            parsed_code=data.get("parsedCode"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Sms':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['Sms']:
+        parse_datetime = _batch_datetime_parser()
+        intern_opt_in = _opt_in_interner()
+        set_id, set_to_value, set_created_at, set_encrypted, set_from_value, set_sms_content, set_parsed_code, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_id(obj, data.get("id"))
+            set_to_value(obj, intern_opt_in(data.get("to")))
+            set_created_at(obj, parse_datetime(data.get("createdAt")))
+            set_encrypted(obj, data.get("encrypted"))
+            set_from_value(obj, intern_opt_in(data.get("from")))
+            set_sms_content(obj, data.get("smsContent"))
+            set_parsed_code(obj, data.get("parsedCode"))
+            append(obj)
+        return result
+
+
+Sms._slot_setters = _slot_setters(Sms)
+
+
@@ -0,0 +1,319 @@
+"""
+Generated verifications enums and dataclasses from Swagger schema
+This file is auto-generated. Do not edit manually.
+"""
+from enum import Enum
+from typing import Optional, Dict, List, Any
+import datetime
+from ._base import (
+    _Unparsed,
+    _batch_datetime_parser,
+    _binary_dumps,
+    _binary_loads,
+    _current_intern_table,
+    _frozen_dataclass,
+    _intern,
+    _intern_opt_in,
+    _lazy_fields,
+    _MemoizedJson,
+    _opt_in_interner,
+    _parse_datetime,
+    _slot_setters,
+)
+from .common import CancelAction, NumberType, ReactivationAction, ReportAction, ReservationCapability, ReservationState, ReuseAction
+
+__all__ = ['VerificationCompact', 'VerificationPriceCheckRequest', 'NewVerificationRequest', 'VerificationExpanded']
+
+
+@_frozen_dataclass
+class VerificationCompact:
+    created_at: datetime.datetime
+    id: str
+    service_name: str
+    state: ReservationState
+    total_cost: float
+    """Example: 0.95"""
+
+    number: str
+
+    _api_fields = {'createdAt': 'created_at', 'id': 'id', 'serviceName': 'service_name', 'state': 'state', 'totalCost': 'total_cost', 'number': 'number'}
+    _schema_version = 0x763845e2
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'createdAt': self.created_at.isoformat(),
+            'id': self.id,
+            'serviceName': self.service_name,
+            'state': self.state.to_api(),
+            'totalCost': self.total_cost,
+            'number': self.number,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'VerificationCompact':
+        return cls(
+            created_at=_parse_datetime(data.get("createdAt")),
+            id=data.get("id"),
+            service_name=_intern(data.get("serviceName")),
+            state=ReservationState.from_api(data.get("state")),
+            total_cost=float(data.get("totalCost")),
+            number=_intern_opt_in(data.get("number")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'VerificationCompact':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['VerificationCompact']:
+        parse_datetime = _batch_datetime_parser()
+        intern = _current_intern_table().intern
+        intern_opt_in = _opt_in_interner()
+        set_created_at, set_id, set_service_name, set_state, set_total_cost, set_number, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_created_at(obj, parse_datetime(data.get("createdAt")))
+            set_id(obj, data.get("id"))
+            set_service_name(obj, intern(data.get("serviceName")))
+            set_state(obj, ReservationState.from_api(data.get("state")))
+            set_total_cost(obj, float(data.get("totalCost")))
+            set_number(obj, intern_opt_in(data.get("number")))
+            append(obj)
+        return result
+
+
+VerificationCompact._slot_setters = _slot_setters(VerificationCompact)
+
+
+@_frozen_dataclass
+class VerificationPriceCheckRequest(_MemoizedJson):
+    service_name: str
+    """Example: yahoo"""
+
+    area_code: bool
+    """Set to true if a specific area code will be requested when creating a verification, false if any area code can be used."""
+
+    carrier: bool
+    """Set to true if a specific carrier will be requested when creating a verification, false if any carrier can be used."""
+
+    number_type: NumberType
+    capability: ReservationCapability
+
+    _api_fields = {'serviceName': 'service_name', 'areaCode': 'area_code', 'carrier': 'carrier', 'numberType': 'number_type', 'capability': 'capability'}
+    _schema_version = 0xcc419e3b
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'serviceName': self.service_name,
+            'areaCode': self.area_code,
+            'carrier': self.carrier,
+            'numberType': self.number_type.to_api(),
+            'capability': self.capability.to_api(),
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'VerificationPriceCheckRequest':
+        return cls(
+            service_name=_intern(data.get("serviceName")),
+            area_code=data.get("areaCode"),
+            carrier=data.get("carrier"),
+            number_type=NumberType.from_api(data.get("numberType")),
+            capability=ReservationCapability.from_api(data.get("capability")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'VerificationPriceCheckRequest':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['VerificationPriceCheckRequest']:
+        intern = _current_intern_table().intern
+        set_service_name, set_area_code, set_carrier, set_number_type, set_capability, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_service_name(obj, intern(data.get("serviceName")))
+            set_area_code(obj, data.get("areaCode"))
+            set_carrier(obj, data.get("carrier"))
+            set_number_type(obj, NumberType.from_api(data.get("numberType")))
+            set_capability(obj, ReservationCapability.from_api(data.get("capability")))
+            append(obj)
+        return result
+
+
+VerificationPriceCheckRequest._slot_setters = _slot_setters(VerificationPriceCheckRequest)
+
+
+@_frozen_dataclass
+class NewVerificationRequest(_MemoizedJson):
+    service_name: str
+    """Example: abra"""
+
+    capability: ReservationCapability
+    area_code_select_option: Optional[List[str]] = None
+    carrier_select_option: Optional[List[str]] = None
+    service_not_listed_name: Optional[str] = None
+    max_price: Optional[float] = None
+
+    _api_fields = {'serviceName': 'service_name', 'capability': 'capability', 'areaCodeSelectOption': 'area_code_select_option', 'carrierSelectOption': 'carrier_select_option', 'serviceNotListedName': 'service_not_listed_name', 'maxPrice': 'max_price'}
+    _schema_version = 0xb783266e
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'serviceName': self.service_name,
+            'capability': self.capability.to_api(),
+            'areaCodeSelectOption': (list(self.area_code_select_option) if self.area_code_select_option is not None else None),
+            'carrierSelectOption': (list(self.carrier_select_option) if self.carrier_select_option is not None else None),
+            'serviceNotListedName': self.service_not_listed_name,
+            'maxPrice': self.max_price,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'NewVerificationRequest':
+        _area_code_select_option = data.get("areaCodeSelectOption")
+        _carrier_select_option = data.get("carrierSelectOption")
+        _max_price = data.get("maxPrice")
+        return cls(
+            service_name=_intern(data.get("serviceName")),
+            capability=ReservationCapability.from_api(data.get("capability")),
+            area_code_select_option=(list(_area_code_select_option) if _area_code_select_option is not None else None),
+            carrier_select_option=(list(_carrier_select_option) if _carrier_select_option is not None else None),
+            service_not_listed_name=data.get("serviceNotListedName"),
+            max_price=(float(_max_price) if _max_price is not None else None),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'NewVerificationRequest':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['NewVerificationRequest']:
+        intern = _current_intern_table().intern
+        set_service_name, set_capability, set_area_code_select_option, set_carrier_select_option, set_service_not_listed_name, set_max_price, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            _area_code_select_option = data.get("areaCodeSelectOption")
+            _carrier_select_option = data.get("carrierSelectOption")
+            _max_price = data.get("maxPrice")
+            obj = new(cls)
+            set_service_name(obj, intern(data.get("serviceName")))
+            set_capability(obj, ReservationCapability.from_api(data.get("capability")))
+            set_area_code_select_option(obj, (list(_area_code_select_option) if _area_code_select_option is not None else None))
+            set_carrier_select_option(obj, (list(_carrier_select_option) if _carrier_select_option is not None else None))
+            set_service_not_listed_name(obj, data.get("serviceNotListedName"))
+            set_max_price(obj, (float(_max_price) if _max_price is not None else None))
+            append(obj)
+        return result
+
+
+NewVerificationRequest._slot_setters = _slot_setters(NewVerificationRequest)
+
+
+@_lazy_fields(
+    cancel=lambda value: CancelAction.from_api(value),
+    reactivate=lambda value: ReactivationAction.from_api(value),
+    report=lambda value: ReportAction.from_api(value),
+    reuse=lambda value: ReuseAction.from_api(value),
+)
+@_frozen_dataclass
+class VerificationExpanded:
+    number: str
+    created_at: datetime.datetime
+    ends_at: datetime.datetime
+    id: str
+    cancel: CancelAction
+    reactivate: ReactivationAction
+    report: ReportAction
+    reuse: ReuseAction
+    service_name: str
+    state: ReservationState
+    total_cost: float
+    """Example: 0.95"""
+
+
+    _api_fields = {'number': 'number', 'createdAt': 'created_at', 'endsAt': 'ends_at', 'id': 'id', 'cancel': 'cancel', 'reactivate': 'reactivate', 'report': 'report', 'reuse': 'reuse', 'serviceName': 'service_name', 'state': 'state', 'totalCost': 'total_cost'}
+    _schema_version = 0x0c384236
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'number': self.number,
+            'createdAt': self.created_at.isoformat(),
+            'endsAt': self.ends_at.isoformat(),
+            'id': self.id,
+            'cancel': self.cancel.to_api(),
+            'reactivate': self.reactivate.to_api(),
+            'report': self.report.to_api(),
+            'reuse': self.reuse.to_api(),
+            'serviceName': self.service_name,
+            'state': self.state.to_api(),
+            'totalCost': self.total_cost,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'VerificationExpanded':
+        return cls(
+            number=_intern_opt_in(data.get("number")),
+            created_at=_parse_datetime(data.get("createdAt")),
+            ends_at=_parse_datetime(data.get("endsAt")),
+            id=data.get("id"),
+            cancel=data.get("cancel"),
+            reactivate=data.get("reactivate"),
+            report=data.get("report"),
+            reuse=data.get("reuse"),
+            service_name=_intern(data.get("serviceName")),
+            state=ReservationState.from_api(data.get("state")),
+            total_cost=float(data.get("totalCost")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'VerificationExpanded':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['VerificationExpanded']:
+        parse_datetime = _batch_datetime_parser()
+        intern = _current_intern_table().intern
+        intern_opt_in = _opt_in_interner()
+        set_number, set_created_at, set_ends_at, set_id, set_cancel, set_reactivate, set_report, set_reuse, set_service_name, set_state, set_total_cost, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_number(obj, intern_opt_in(data.get("number")))
+            set_created_at(obj, parse_datetime(data.get("createdAt")))
+            set_ends_at(obj, parse_datetime(data.get("endsAt")))
+            set_id(obj, data.get("id"))
+            set_cancel(obj, data.get("cancel"))
+            set_reactivate(obj, data.get("reactivate"))
+            set_report(obj, data.get("report"))
+            set_reuse(obj, data.get("reuse"))
+            set_service_name(obj, intern(data.get("serviceName")))
+            set_state(obj, ReservationState.from_api(data.get("state")))
+            set_total_cost(obj, float(data.get("totalCost")))
+            append(obj)
+        return result
+
+
+VerificationExpanded._slot_setters = _slot_setters(VerificationExpanded)
+
+
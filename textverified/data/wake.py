@@ -0,0 +1,234 @@
+"""
+Generated wake enums and dataclasses from Swagger schema
+This file is auto-generated. Do not edit manually.
+"""
+from enum import Enum
+from typing import Optional, Dict, List, Any
+import datetime
+from ._base import (
+    _Unparsed,
+    _batch_datetime_parser,
+    _binary_dumps,
+    _binary_loads,
+    _current_intern_table,
+    _frozen_dataclass,
+    _intern,
+    _intern_opt_in,
+    _lazy_fields,
+    _MemoizedJson,
+    _opt_in_interner,
+    _parse_datetime,
+    _slot_setters,
+)
+
+__all__ = ['UsageWindowEstimateRequest', 'WakeRequest', 'UsageWindowEstimateResponse', 'WakeResponse']
+
+
+@_frozen_dataclass
+class UsageWindowEstimateRequest:
+    reservation_id: str
+    """The reservation Id to get the estimated usage window for. If a valid reservation does not exist, a 400 response will be returned."""
+
+
+    _api_fields = {'reservationId': 'reservation_id'}
+    _schema_version = 0xb59fd0bf
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'reservationId': self.reservation_id,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'UsageWindowEstimateRequest':
+        return cls(
+            reservation_id=data.get("reservationId"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'UsageWindowEstimateRequest':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['UsageWindowEstimateRequest']:
+        set_reservation_id, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_reservation_id(obj, data.get("reservationId"))
+            append(obj)
+        return result
+
+
+UsageWindowEstimateRequest._slot_setters = _slot_setters(UsageWindowEstimateRequest)
+
+
+@_frozen_dataclass
+class WakeRequest:
+    reservation_id: str
+    """The reservation Id to create a wake request for. If a valid reservation does not exist, a 400 response will be returned."""
+
+
+    _api_fields = {'reservationId': 'reservation_id'}
+    _schema_version = 0x4cbd491f
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'reservationId': self.reservation_id,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'WakeRequest':
+        return cls(
+            reservation_id=data.get("reservationId"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'WakeRequest':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['WakeRequest']:
+        set_reservation_id, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_reservation_id(obj, data.get("reservationId"))
+            append(obj)
+        return result
+
+
+WakeRequest._slot_setters = _slot_setters(WakeRequest)
+
+
+@_frozen_dataclass
+class UsageWindowEstimateResponse:
+    reservation_id: str
+    """Id of the reservation that this usage window estimate is associated with."""
+
+    estimated_window_start: Optional[datetime.datetime] = None
+    estimated_window_end: Optional[datetime.datetime] = None
+
+    _api_fields = {'reservationId': 'reservation_id', 'estimatedWindowStart': 'estimated_window_start', 'estimatedWindowEnd': 'estimated_window_end'}
+    _schema_version = 0x2fb6abd6
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'reservationId': self.reservation_id,
+            'estimatedWindowStart': (self.estimated_window_start.isoformat() if self.estimated_window_start is not None else None),
+            'estimatedWindowEnd': (self.estimated_window_end.isoformat() if self.estimated_window_end is not None else None),
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'UsageWindowEstimateResponse':
+        _estimated_window_start = data.get("estimatedWindowStart")
+        _estimated_window_end = data.get("estimatedWindowEnd")
+        return cls(
+            reservation_id=data.get("reservationId"),
+            estimated_window_start=(_parse_datetime(_estimated_window_start) if _estimated_window_start is not None else None),
+            estimated_window_end=(_parse_datetime(_estimated_window_end) if _estimated_window_end is not None else None),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'UsageWindowEstimateResponse':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['UsageWindowEstimateResponse']:
+        parse_datetime = _batch_datetime_parser()
+        set_reservation_id, set_estimated_window_start, set_estimated_window_end, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            _estimated_window_start = data.get("estimatedWindowStart")
+            _estimated_window_end = data.get("estimatedWindowEnd")
+            obj = new(cls)
+            set_reservation_id(obj, data.get("reservationId"))
+            set_estimated_window_start(obj, (parse_datetime(_estimated_window_start) if _estimated_window_start is not None else None))
+            set_estimated_window_end(obj, (parse_datetime(_estimated_window_end) if _estimated_window_end is not None else None))
+            append(obj)
+        return result
+
+
+UsageWindowEstimateResponse._slot_setters = _slot_setters(UsageWindowEstimateResponse)
+
+
+@_frozen_dataclass
+class WakeResponse:
+    id: str
+    """The Id of this wake request."""
+
+    is_scheduled: bool
+    """Indicates whether or not the wake request was successfully scheduled. If a wake request fails to be scheduled, then you will have to submit a new wake request. Too many wake requests may result in wake request throttling."""
+
+    usage_window_start: Optional[datetime.datetime] = None
+    usage_window_end: Optional[datetime.datetime] = None
+    reservation_id: Optional[str] = None
+
+    _api_fields = {'id': 'id', 'isScheduled': 'is_scheduled', 'usageWindowStart': 'usage_window_start', 'usageWindowEnd': 'usage_window_end', 'reservationId': 'reservation_id'}
+    _schema_version = 0x7cbf45e1
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'isScheduled': self.is_scheduled,
+            'usageWindowStart': (self.usage_window_start.isoformat() if self.usage_window_start is not None else None),
+            'usageWindowEnd': (self.usage_window_end.isoformat() if self.usage_window_end is not None else None),
+            'reservationId': self.reservation_id,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'WakeResponse':
+        _usage_window_start = data.get("usageWindowStart")
+        _usage_window_end = data.get("usageWindowEnd")
+        return cls(
+            id=data.get("id"),
+            is_scheduled=data.get("isScheduled"),
+            usage_window_start=(_parse_datetime(_usage_window_start) if _usage_window_start is not None else None),
+            usage_window_end=(_parse_datetime(_usage_window_end) if _usage_window_end is not None else None),
+            reservation_id=data.get("reservationId"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'WakeResponse':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['WakeResponse']:
+        parse_datetime = _batch_datetime_parser()
+        set_id, set_is_scheduled, set_usage_window_start, set_usage_window_end, set_reservation_id, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            _usage_window_start = data.get("usageWindowStart")
+            _usage_window_end = data.get("usageWindowEnd")
+            obj = new(cls)
+            set_id(obj, data.get("id"))
+            set_is_scheduled(obj, data.get("isScheduled"))
+            set_usage_window_start(obj, (parse_datetime(_usage_window_start) if _usage_window_start is not None else None))
+            set_usage_window_end(obj, (parse_datetime(_usage_window_end) if _usage_window_end is not None else None))
+            set_reservation_id(obj, data.get("reservationId"))
+            append(obj)
+        return result
+
+
+WakeResponse._slot_setters = _slot_setters(WakeResponse)
+
+
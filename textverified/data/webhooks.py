@@ -0,0 +1,492 @@
+"""
+Generated webhooks enums and dataclasses from Swagger schema
+This file is auto-generated. Do not edit manually.
+"""
+from enum import Enum
+from typing import Optional, Dict, List, Any
+import datetime
+from ._base import (
+    _Unparsed,
+    _batch_datetime_parser,
+    _binary_dumps,
+    _binary_loads,
+    _current_intern_table,
+    _frozen_dataclass,
+    _intern,
+    _intern_opt_in,
+    _lazy_fields,
+    _MemoizedJson,
+    _opt_in_interner,
+    _parse_datetime,
+    _slot_setters,
+)
+from .common import LineReservationType
+
+__all__ = ['BackOrderReservationWebhookEvent', 'ReservationCreatedWebhookEvent', 'WebhookEventBackOrderReservationWebhookEvent', 'BillingCycleWebhookEvent', 'WebhookEventReservationCreatedWebhookEvent', 'SmsWebhookEvent', 'WebhookEventBillingCycleWebhookEvent', 'WebhookEventSmsWebhookEvent']
+
+
+@_frozen_dataclass
+class BackOrderReservationWebhookEvent:
+    back_order_id: str
+    """Id of the back order reservation."""
+
+
+    _api_fields = {'backOrderId': 'back_order_id'}
+    _schema_version = 0xee9a2cc0
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'backOrderId': self.back_order_id,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'BackOrderReservationWebhookEvent':
+        return cls(
+            back_order_id=data.get("backOrderId"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BackOrderReservationWebhookEvent':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['BackOrderReservationWebhookEvent']:
+        set_back_order_id, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_back_order_id(obj, data.get("backOrderId"))
+            append(obj)
+        return result
+
+
+BackOrderReservationWebhookEvent._slot_setters = _slot_setters(BackOrderReservationWebhookEvent)
+
+
+@_frozen_dataclass
+class ReservationCreatedWebhookEvent:
+    id: str
+    """Id of the created reservation."""
+
+    type: LineReservationType
+
+    _api_fields = {'id': 'id', 'type': 'type'}
+    _schema_version = 0xb781a421
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'type': self.type.to_api(),
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'ReservationCreatedWebhookEvent':
+        return cls(
+            id=data.get("id"),
+            type=LineReservationType.from_api(data.get("type")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ReservationCreatedWebhookEvent':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['ReservationCreatedWebhookEvent']:
+        set_id, set_type, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_id(obj, data.get("id"))
+            set_type(obj, LineReservationType.from_api(data.get("type")))
+            append(obj)
+        return result
+
+
+ReservationCreatedWebhookEvent._slot_setters = _slot_setters(ReservationCreatedWebhookEvent)
+
+
+@_frozen_dataclass
+class WebhookEventBackOrderReservationWebhookEvent:
+    attempt: int
+    """Send attempt count"""
+
+    occurred_at: datetime.datetime
+    """When the event occurred"""
+
+    data: BackOrderReservationWebhookEvent
+    event: str
+    """Name of the event"""
+
+    id: str
+    """Id of event"""
+
+
+    _api_fields = {'attempt': 'attempt', 'occurredAt': 'occurred_at', 'data': 'data', 'event': 'event', 'id': 'id'}
+    _schema_version = 0x75a2e8ea
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'attempt': self.attempt,
+            'occurredAt': self.occurred_at.isoformat(),
+            'data': self.data.to_api(),
+            'event': self.event,
+            'id': self.id,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'WebhookEventBackOrderReservationWebhookEvent':
+        return cls(
+            attempt=data.get("attempt"),
+            occurred_at=_parse_datetime(data.get("occurredAt")),
+            data=BackOrderReservationWebhookEvent.from_api(data.get("data")),
+            event=data.get("event"),
+            id=data.get("id"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'WebhookEventBackOrderReservationWebhookEvent':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['WebhookEventBackOrderReservationWebhookEvent']:
+        parse_datetime = _batch_datetime_parser()
+        set_attempt, set_occurred_at, set_data, set_event, set_id, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_attempt(obj, data.get("attempt"))
+            set_occurred_at(obj, parse_datetime(data.get("occurredAt")))
+            set_data(obj, BackOrderReservationWebhookEvent.from_api(data.get("data")))
+            set_event(obj, data.get("event"))
+            set_id(obj, data.get("id"))
+            append(obj)
+        return result
+
+
+WebhookEventBackOrderReservationWebhookEvent._slot_setters = _slot_setters(WebhookEventBackOrderReservationWebhookEvent)
+
+
+@_frozen_dataclass
+class BillingCycleWebhookEvent:
+    billing_cycle_id: Optional[str] = None
+
+    _api_fields = {'billingCycleId': 'billing_cycle_id'}
+    _schema_version = 0x75c569c3
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'billingCycleId': self.billing_cycle_id,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'BillingCycleWebhookEvent':
+        return cls(
+            billing_cycle_id=_intern_opt_in(data.get("billingCycleId")),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BillingCycleWebhookEvent':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['BillingCycleWebhookEvent']:
+        intern_opt_in = _opt_in_interner()
+        set_billing_cycle_id, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_billing_cycle_id(obj, intern_opt_in(data.get("billingCycleId")))
+            append(obj)
+        return result
+
+
+BillingCycleWebhookEvent._slot_setters = _slot_setters(BillingCycleWebhookEvent)
+
+
+@_frozen_dataclass
+class WebhookEventReservationCreatedWebhookEvent:
+    attempt: int
+    """Send attempt count"""
+
+    occurred_at: datetime.datetime
+    """When the event occurred"""
+
+    data: ReservationCreatedWebhookEvent
+    event: str
+    """Name of the event"""
+
+    id: str
+    """Id of event"""
+
+
+    _api_fields = {'attempt': 'attempt', 'occurredAt': 'occurred_at', 'data': 'data', 'event': 'event', 'id': 'id'}
+    _schema_version = 0x3636169d
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'attempt': self.attempt,
+            'occurredAt': self.occurred_at.isoformat(),
+            'data': self.data.to_api(),
+            'event': self.event,
+            'id': self.id,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'WebhookEventReservationCreatedWebhookEvent':
+        return cls(
+            attempt=data.get("attempt"),
+            occurred_at=_parse_datetime(data.get("occurredAt")),
+            data=ReservationCreatedWebhookEvent.from_api(data.get("data")),
+            event=data.get("event"),
+            id=data.get("id"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'WebhookEventReservationCreatedWebhookEvent':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['WebhookEventReservationCreatedWebhookEvent']:
+        parse_datetime = _batch_datetime_parser()
+        set_attempt, set_occurred_at, set_data, set_event, set_id, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_attempt(obj, data.get("attempt"))
+            set_occurred_at(obj, parse_datetime(data.get("occurredAt")))
+            set_data(obj, ReservationCreatedWebhookEvent.from_api(data.get("data")))
+            set_event(obj, data.get("event"))
+            set_id(obj, data.get("id"))
+            append(obj)
+        return result
+
+
+WebhookEventReservationCreatedWebhookEvent._slot_setters = _slot_setters(WebhookEventReservationCreatedWebhookEvent)
+
+
+@_frozen_dataclass
+class SmsWebhookEvent:
+    to_value: str
+    created_at: datetime.datetime
+    encrypted: bool
+    """True if the contents of the sms is encrypted at rest."""
+
+    from_value: Optional[str] = None
+    sms_content: Optional[str] = None
+    parsed_code: Optional[str] = None
+    reservation_id: Optional[str] = None
+
+    _api_fields = {'to': 'to_value', 'createdAt': 'created_at', 'encrypted': 'encrypted', 'from': 'from_value', 'smsContent': 'sms_content', 'parsedCode': 'parsed_code', 'reservationId': 'reservation_id'}
+    _schema_version = 0x9bf8179a
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'to': self.to_value,
+            'createdAt': self.created_at.isoformat(),
+            'encrypted': self.encrypted,
+            'from': self.from_value,
+            'smsContent': self.sms_content,
+            'parsedCode': self.parsed_code,
+            'reservationId': self.reservation_id,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'SmsWebhookEvent':
+        return cls(
+            to_value=_intern_opt_in(data.get("to")),
+            created_at=_parse_datetime(data.get("createdAt")),
+            encrypted=data.get("encrypted"),
+            from_value=_intern_opt_in(data.get("from")),
+            sms_content=data.get("smsContent"),
+            parsed_code=data.get("parsedCode"),
+            reservation_id=data.get("reservationId"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'SmsWebhookEvent':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['SmsWebhookEvent']:
+        parse_datetime = _batch_datetime_parser()
+        intern_opt_in = _opt_in_interner()
+        set_to_value, set_created_at, set_encrypted, set_from_value, set_sms_content, set_parsed_code, set_reservation_id, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_to_value(obj, intern_opt_in(data.get("to")))
+            set_created_at(obj, parse_datetime(data.get("createdAt")))
+            set_encrypted(obj, data.get("encrypted"))
+            set_from_value(obj, intern_opt_in(data.get("from")))
+            set_sms_content(obj, data.get("smsContent"))
+            set_parsed_code(obj, data.get("parsedCode"))
+            set_reservation_id(obj, data.get("reservationId"))
+            append(obj)
+        return result
+
+
+SmsWebhookEvent._slot_setters = _slot_setters(SmsWebhookEvent)
+
+
+@_frozen_dataclass
+class WebhookEventBillingCycleWebhookEvent:
+    attempt: int
+    """Send attempt count"""
+
+    occurred_at: datetime.datetime
+    """When the event occurred"""
+
+    data: BillingCycleWebhookEvent
+    event: str
+    """Name of the event"""
+
+    id: str
+    """Id of event"""
+
+
+    _api_fields = {'attempt': 'attempt', 'occurredAt': 'occurred_at', 'data': 'data', 'event': 'event', 'id': 'id'}
+    _schema_version = 0xc98eb1a1
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'attempt': self.attempt,
+            'occurredAt': self.occurred_at.isoformat(),
+            'data': self.data.to_api(),
+            'event': self.event,
+            'id': self.id,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'WebhookEventBillingCycleWebhookEvent':
+        return cls(
+            attempt=data.get("attempt"),
+            occurred_at=_parse_datetime(data.get("occurredAt")),
+            data=BillingCycleWebhookEvent.from_api(data.get("data")),
+            event=data.get("event"),
+            id=data.get("id"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'WebhookEventBillingCycleWebhookEvent':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['WebhookEventBillingCycleWebhookEvent']:
+        parse_datetime = _batch_datetime_parser()
+        set_attempt, set_occurred_at, set_data, set_event, set_id, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_attempt(obj, data.get("attempt"))
+            set_occurred_at(obj, parse_datetime(data.get("occurredAt")))
+            set_data(obj, BillingCycleWebhookEvent.from_api(data.get("data")))
+            set_event(obj, data.get("event"))
+            set_id(obj, data.get("id"))
+            append(obj)
+        return result
+
+
+WebhookEventBillingCycleWebhookEvent._slot_setters = _slot_setters(WebhookEventBillingCycleWebhookEvent)
+
+
+@_frozen_dataclass
+class WebhookEventSmsWebhookEvent:
+    attempt: int
+    """Send attempt count"""
+
+    occurred_at: datetime.datetime
+    """When the event occurred"""
+
+    data: SmsWebhookEvent
+    event: str
+    """Name of the event"""
+
+    id: str
+    """Id of event"""
+
+
+    _api_fields = {'attempt': 'attempt', 'occurredAt': 'occurred_at', 'data': 'data', 'event': 'event', 'id': 'id'}
+    _schema_version = 0xf9f88f94
+
+    def to_api(self) -> Dict[str, Any]:
+        return {
+            'attempt': self.attempt,
+            'occurredAt': self.occurred_at.isoformat(),
+            'data': self.data.to_api(),
+            'event': self.event,
+            'id': self.id,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'WebhookEventSmsWebhookEvent':
+        return cls(
+            attempt=data.get("attempt"),
+            occurred_at=_parse_datetime(data.get("occurredAt")),
+            data=SmsWebhookEvent.from_api(data.get("data")),
+            event=data.get("event"),
+            id=data.get("id"),
+        )
+
+    def to_bytes(self) -> bytes:
+        return _binary_dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'WebhookEventSmsWebhookEvent':
+        return _binary_loads(cls, data)
+
+    @classmethod
+    def from_api_many(cls, items: List[Dict[str, Any]]) -> List['WebhookEventSmsWebhookEvent']:
+        parse_datetime = _batch_datetime_parser()
+        set_attempt, set_occurred_at, set_data, set_event, set_id, = cls._slot_setters
+        new = object.__new__
+        result = []
+        append = result.append
+        for data in items:
+            obj = new(cls)
+            set_attempt(obj, data.get("attempt"))
+            set_occurred_at(obj, parse_datetime(data.get("occurredAt")))
+            set_data(obj, SmsWebhookEvent.from_api(data.get("data")))
+            set_event(obj, data.get("event"))
+            set_id(obj, data.get("id"))
+            append(obj)
+        return result
+
+
+WebhookEventSmsWebhookEvent._slot_setters = _slot_setters(WebhookEventSmsWebhookEvent)
+
+
@@ -0,0 +1,259 @@
+from .action import _ActionPerformer, _Action
+from .data import (
+    Reservation,
+    NonrenewableRentalCompact,
+    NonrenewableRentalExpanded,
+    RenewableRentalCompact,
+    RenewableRentalExpanded,
+    VerificationCompact,
+    VerificationExpanded,
+    ReservationType,
+    KeysetPaginationDirectionality,
+)
+from .high_water_mark import HighWaterMark, SeenWindow
+from .paginated_list import PaginatedList
+from .polling import PollingPolicy
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+import abc
+import asyncio
+import datetime
+import heapq
+import time
+
+
+# Item attributes (or server-only filters) mapped to the query params of the listing endpoints
+_QUERY_FILTERS = {"to_value": "to", "reservation_id": "reservationId", "reservation_type": "reservationType"}
+
+
+def _sleep(seconds: float) -> bool:
+    """Wait between polls that can only end by timing out."""
+    time.sleep(seconds)
+    return False
+
+
+class _Feed:
+    """Position of a consumer in one feed: its checkpointed high-water mark, and optionally the ids seen recently."""
+
+    def __init__(
+        self,
+        client: _ActionPerformer,
+        key: Hashable,
+        listing: Callable[[], Iterable],
+        mark: HighWaterMark,
+        dedup_window: float = None,
+    ):
+        self.client = client
+        self.key = key
+        self.listing = listing
+        self.mark = mark
+        self.window = SeenWindow(datetime.timedelta(seconds=dedup_window), mark) if dedup_window is not None else None
+
+    def unseen(self) -> List:
+        """Fetch the items not seen yet, oldest first."""
+        return (self.mark if self.window is None else self.window).unseen(self.listing())
+
+    def deliver(self, item: Any) -> None:
+        """Move the position of the consumer past an item, and checkpoint it on the client."""
+        if self.window is not None:
+            self.window.add(item.created_at, item.id)
+        self.mark = self.mark.advance(item.created_at, item.id)
+        self.client.checkpoints.put(self.key, self.mark)
+
+
+class _Poller:
+    """Polls one or more feeds following a `PollingPolicy` until a timeout, merging their new items oldest first."""
+
+    def __init__(self, feeds: List[_Feed], policy: PollingPolicy, timeout: float):
+        self.feeds = feeds
+        self.schedule = policy.schedule()
+        self.timeout = float("inf") if timeout < 0 else timeout
+        self.found = False
+        self.start_time = time.monotonic()
+
+    def next_delay(self) -> Optional[float]:
+        """Seconds to wait before the next poll, or None once timed out."""
+        elapsed = time.monotonic() - self.start_time
+        if elapsed >= self.timeout:
+            return None
+        return min(self.schedule.next_delay(elapsed, self.found), self.timeout - elapsed)
+
+    def poll(self) -> List[Tuple[_Feed, Any]]:
+        """Fetch the new items of every feed, merged oldest first, each paired with its feed."""
+        batches = [[(feed, item) for item in feed.unseen()] for feed in self.feeds]
+        items = list(heapq.merge(*batches, key=lambda pair: pair[1].created_at))
+        self.found = bool(items)
+        return items
+
+    @staticmethod
+    def deliver(items: List[Tuple[_Feed, Any]]) -> Iterator:
+        """Yield the items of a poll, moving their feeds past each one once the consumer asks for the next.
+
+        An item the consumer did not finish handling, because it raised or stopped iterating, stays ahead of the
+        checkpoint and is delivered again on resume: delivery is at-least-once.
+        """
+        for feed, item in items:
+            yield item
+            feed.deliver(item)
+
+    def run(self, wait: Callable[[float], Any], first_batch: bool = False) -> Iterator:
+        """Poll until timed out, or until `wait` returns True, yielding each new item once.
+
+        Args:
+            wait (Callable[[float], Any]): Waits the given number of seconds before a poll, returning True to stop.
+            first_batch (bool, optional): Stop after the first poll that found new items. Defaults to False.
+        """
+        while True:
+            delay = self.next_delay()
+            if delay is None or wait(delay):
+                return
+
+            items = self.poll()
+            yield from self.deliver(items)
+            if items and first_batch:
+                return
+
+    async def arun(self, executor: Executor, first_batch: bool = False) -> AsyncIterator:
+        """Like `run`, but waits with `asyncio.sleep` and polls on `executor`, without blocking the event loop.
+
+        Args:
+            executor (Executor): Runs the blocking polls. Bounds how many run at once across all consumers sharing it.
+            first_batch (bool, optional): Stop after the first poll that found new items. Defaults to False.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            delay = self.next_delay()
+            if delay is None:
+                return
+            await asyncio.sleep(delay)
+
+            items = await loop.run_in_executor(executor, self.poll)
+            for item in self.deliver(items):
+                yield item
+            if items and first_batch:
+                return
+
+
+class _FeedAPI(abc.ABC):
+    """Listing and polling shared by the APIs of account-wide feeds of incoming items, such as SMS and calls.
+
+    Subclasses set the endpoint (`_href`) and item type (`_item`) of the listing, and `_name` the streams whose
+    positions are kept on the client. Their `list` builds on `_list`, which polls go through.
+    """
+
+    _name: str
+    _href: str
+    _item: type
+
+    def __init__(self, client: _ActionPerformer):
+        self.client = client
+
+    @abc.abstractmethod
+    def list(
+        self,
+        data=None,
+        *,
+        to_number: str = None,
+        reservation_type: ReservationType = None,
+        direction: KeysetPaginationDirectionality = None,
+        cache: bool = True,
+    ) -> PaginatedList:
+        """List the items of the feed."""
+
+    def _list(
+        self,
+        data,
+        to_number: str,
+        reservation_type: ReservationType,
+        direction: KeysetPaginationDirectionality,
+        cache: bool,
+    ) -> PaginatedList:
+        """Validate the filters of a listing and list the matching items."""
+        params = self._query_params(data, to_number, reservation_type)
+
+        if isinstance(direction, KeysetPaginationDirectionality):
+            params["direction"] = direction.to_api()
+
+        # Construct and perform the action
+        action = _Action(method="GET", href=self._href)
+
+        return PaginatedList.from_action(
+            action,
+            parse_item=self._item.from_api,
+            api_context=self.client,
+            query_filters=_QUERY_FILTERS,
+            cache=cache,
+            params=params,
+        )
+
+    def _query_params(self, data, to_number: str, reservation_type: ReservationType) -> Dict[str, str]:
+        """Validate the filters of a listing and build its query params."""
+        # Extract needed data from provided objects
+        reservation_id = None
+        if data and isinstance(
+            data,
+            (
+                NonrenewableRentalCompact,
+                NonrenewableRentalExpanded,
+                RenewableRentalCompact,
+                RenewableRentalExpanded,
+                VerificationCompact,
+                VerificationExpanded,
+            ),
+        ):
+            if to_number:
+                raise ValueError("Cannot specify both rental/verification data and to_number.")
+            to_number = data.number
+
+            if reservation_type is not None:
+                raise ValueError("Cannot specify reservation_type when using a rental or verification object.")
+
+        if isinstance(
+            data,
+            (
+                Reservation,
+                NonrenewableRentalCompact,
+                NonrenewableRentalExpanded,
+                RenewableRentalCompact,
+                RenewableRentalExpanded,
+            ),
+        ):
+            reservation_id = data.id
+
+        params = dict()
+        if to_number:
+            params["to"] = to_number
+
+        if reservation_id:
+            params["reservationId"] = reservation_id
+
+        if isinstance(reservation_type, ReservationType):
+            params["reservationType"] = reservation_type.to_api()
+
+        return params
+
+    def _feed(
+        self,
+        data,
+        to_number: str,
+        reservation_type: ReservationType,
+        since: Optional[datetime.datetime],
+        policy: PollingPolicy,
+        dedup_window: float = None,
+    ) -> _Feed:
+        """Position of a new consumer of the stream with these filters, resumed from the client's checkpoint."""
+        # Streams are keyed by their query filters
+        key = (self._name, tuple(sorted(self._query_params(data, to_number, reservation_type).items())))
+        mark = self.client.checkpoints.resume(key, since, policy.interval)
+
+        # Walk newest first, and stop paging as soon as items fall behind what was seen
+        def listing() -> Iterable:
+            return self.list(
+                data=data,
+                to_number=to_number,
+                reservation_type=reservation_type,
+                direction=KeysetPaginationDirectionality.REVERSE,
+                cache=False,
+            )
+
+        return _Feed(self.client, key, listing, mark, dedup_window)
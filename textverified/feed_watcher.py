@@ -0,0 +1,189 @@
+from .action import _ActionPerformer
+from .data import (
+    NonrenewableRentalCompact,
+    NonrenewableRentalExpanded,
+    RenewableRentalCompact,
+    RenewableRentalExpanded,
+    VerificationCompact,
+    VerificationExpanded,
+    ReservationType,
+)
+from .high_water_mark import HighWaterMark
+from .polling import PollingPolicy
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+import abc
+import datetime
+import queue
+import re
+import threading
+import time
+
+_WatchTarget = Union[
+    str,
+    NonrenewableRentalCompact,
+    NonrenewableRentalExpanded,
+    RenewableRentalCompact,
+    RenewableRentalExpanded,
+    VerificationCompact,
+    VerificationExpanded,
+]
+
+
+def _number_key(target: _WatchTarget) -> str:
+    """Digits of the number of a watch target, so "+1 (234) 567-8900" and "12345678900" match."""
+    number = target if isinstance(target, str) else target.number
+    key = re.sub(r"\D", "", number or "")
+    if not key:
+        raise ValueError(f"Not a phone number: {number!r}")
+    return key
+
+
+class _FeedWatcher(abc.ABC):
+    """Watches any number of phone numbers with a single polling loop over an account-wide feed.
+
+    Subclasses list the feed newest first in `_list`; `_name` names their checkpoint and polling thread.
+    """
+
+    _name: str
+
+    def __init__(
+        self,
+        client: _ActionPerformer,
+        *,
+        polling_interval: float = 1.0,
+        reservation_type: ReservationType = None,
+        since: datetime.datetime = None,
+        policy: PollingPolicy = None,
+    ):
+        """
+        Args:
+            client (_ActionPerformer): The client to poll with.
+            polling_interval (float, optional): Time in seconds between ticks of the background thread. Defaults to 1.0.
+            reservation_type (ReservationType, optional): Only poll the feed for this reservation type. Defaults to None (all).
+            since (datetime.datetime, optional): Only deliver items created after this timestamp. Defaults to the client's checkpoint of the feed, left by an earlier watcher, or datetime.datetime.now() if there is none.
+            policy (PollingPolicy, optional): When the background thread polls. Overrides polling_interval. Defaults to None (poll immediately, then every polling_interval seconds).
+        """
+        if policy is None:
+            if polling_interval <= 0:
+                raise ValueError("polling_interval must be positive.")
+            policy = PollingPolicy(interval=polling_interval)
+        if since is not None and not isinstance(since, datetime.datetime):
+            raise ValueError("since must be a datetime object.")
+
+        self.client = client
+        self.policy = policy
+        self.reservation_type = reservation_type
+        self.last_error: Optional[Exception] = None
+        """Last error raised by a callback, or by a tick of the background thread, which keeps polling regardless."""
+
+        # Resume from the client's checkpoint of the feed, unless given an explicit starting point
+        self.__stream_key = (
+            f"{self._name}_watcher",
+            reservation_type.to_api() if reservation_type is not None else None,
+        )
+        self.__mark = client.checkpoints.get(self.__stream_key) if since is None else None
+        if self.__mark is None:
+            if since is None:
+                since = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=policy.interval)
+            self.__mark = HighWaterMark(created_at=since)
+        self.__subscribers: Dict[str, List[Callable[[Any], None]]] = dict()
+        self.__lock = threading.Lock()
+        self.__poll_lock = threading.Lock()
+        self.__stopping = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    def watch(self, target: _WatchTarget, callback: Callable[[Any], None] = None) -> Optional["queue.Queue"]:
+        """Deliver the new items of a number to a callback, or to a queue.
+
+        Args:
+            target (Union[str, NonrenewableRentalCompact, NonrenewableRentalExpanded, RenewableRentalCompact, RenewableRentalExpanded, VerificationCompact, VerificationExpanded]): The phone number, or a rental or verification whose number to watch.
+            callback (Callable[[Any], None], optional): Called once with each new item, from the polling thread. Errors it raises are stored in `last_error`. Defaults to None, delivering to a new queue instead.
+
+        Raises:
+            ValueError: If the target has no phone number.
+
+        Returns:
+            Optional[queue.Queue]: The queue receiving the items, if no callback was given.
+        """
+        items = None
+        if callback is None:
+            items = queue.Queue()
+            callback = items.put
+
+        key = _number_key(target)
+        with self.__lock:
+            self.__subscribers.setdefault(key, []).append(callback)
+        return items
+
+    def unwatch(self, target: _WatchTarget) -> None:
+        """Stop delivering the items of a number to all of its subscribers."""
+        with self.__lock:
+            self.__subscribers.pop(_number_key(target), None)
+
+    @property
+    def watched(self) -> List[str]:
+        """Digits of every watched number."""
+        with self.__lock:
+            return list(self.__subscribers)
+
+    def poll(self) -> int:
+        """Fetch the new items of the feed once and deliver them to their subscribers.
+
+        Items of numbers nobody watches are skipped. An error raised by a callback is stored in `last_error` and does
+        not stop the other subscribers, nor later items: every item is handed to each subscriber once, and the
+        checkpoint moves past it whether or not its callbacks succeeded.
+
+        Returns:
+            int: Number of items handed to at least one subscriber.
+        """
+        with self.__poll_lock:
+            delivered = 0
+            for msg in self.__mark.unseen(self._list()):
+                with self.__lock:
+                    callbacks = list(self.__subscribers.get(_number_key(msg.to_value), ()))
+                for callback in callbacks:
+                    try:
+                        callback(msg)
+                    except Exception as e:
+                        self.last_error = e
+                if callbacks:
+                    delivered += 1
+                self.__mark = self.__mark.advance(msg.created_at, msg.id)
+                self.client.checkpoints.put(self.__stream_key, self.__mark)
+            return delivered
+
+    def start(self) -> "_FeedWatcher":
+        """Start polling from a background thread. Does nothing if already started."""
+        if self.__thread is None or not self.__thread.is_alive():
+            self.__stopping.clear()
+            self.__thread = threading.Thread(target=self.__run, name=f"textverified-{self._name}-watcher", daemon=True)
+            self.__thread.start()
+        return self
+
+    def stop(self, timeout: float = None) -> None:
+        """Stop the background thread, waiting up to `timeout` seconds for the current tick to finish."""
+        self.__stopping.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+            self.__thread = None
+
+    def __run(self) -> None:
+        schedule = self.policy.schedule()
+        start_time = time.monotonic()
+        found = False
+        while not self.__stopping.wait(schedule.next_delay(time.monotonic() - start_time, found)):
+            try:
+                found = self.poll() > 0
+            except Exception as e:
+                self.last_error = e
+                found = False
+
+    @abc.abstractmethod
+    def _list(self) -> Iterable:
+        """The feed, newest first."""
+
+    def __enter__(self) -> "_FeedWatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, Iterator, List
+import datetime
+import heapq
+
+
+def _not_behind(listing: Iterable, floor: datetime.datetime) -> Iterator:
+    """Yield the items of a listing created at or after `floor`.
+
+    A listing walked newest first ends with everything older than `floor`, so iteration stops there and older pages
+    are never fetched. The order is checked rather than assumed: iteration only stops at an item behind `floor` once
+    creation times were seen strictly falling, and never rising, up to it (looking further when the first items are
+    behind). Equal creation times prove neither order, and if they ever rise the rest of the listing is scanned.
+    """
+    previous = None
+    falling = rising = False
+    for item in listing:
+        if previous is not None:
+            if item.created_at > previous:
+                rising = True
+            elif item.created_at < previous:
+                falling = True
+        previous = item.created_at
+        if item.created_at < floor:
+            if falling and not rising:
+                return
+            continue
+        yield item
+
+
+@dataclass(frozen=True)
+class HighWaterMark:
+    """Newest point reached in a stream of messages: a creation time, plus the ids already seen at that time.
+
+    Messages created before `created_at` are seen; messages created exactly at `created_at` are seen only if
+    their id is listed, since several messages can share a timestamp.
+    """
+
+    created_at: datetime.datetime
+    ids: FrozenSet[str] = frozenset()
+
+    def is_seen(self, created_at: datetime.datetime, id: str) -> bool:
+        """Check whether a message is at or behind the mark."""
+        return created_at < self.created_at or (created_at == self.created_at and id in self.ids)
+
+    def advance(self, created_at: datetime.datetime, id: str) -> "HighWaterMark":
+        """Get the mark moved past a message. Messages behind the mark leave it unchanged."""
+        if created_at > self.created_at:
+            return HighWaterMark(created_at=created_at, ids=frozenset((id,)))
+        if created_at == self.created_at and id not in self.ids:
+            return HighWaterMark(created_at=created_at, ids=self.ids | {id})
+        return self
+
+    def unseen(self, listing: Iterable) -> List:
+        """Get the messages ahead of the mark, oldest first.
+
+        On a listing walked newest first, iteration stops past the first message created before the mark, so older
+        pages are never fetched. Listings in any other order are scanned in full.
+        """
+        messages = [msg for msg in _not_behind(listing, self.created_at) if not self.is_seen(msg.created_at, msg.id)]
+        return sorted(reversed(messages), key=lambda msg: msg.created_at)
+
+
+class SeenWindow:
+    """Bounded record of the messages seen by a long-running stream.
+
+    Ids are remembered for messages created within `window` of the newest message seen; anything older is
+    treated as seen and its id forgotten. Messages that show up late in the listing are still caught as long as
+    they are no older than `window`, and memory is bounded by the traffic of one window however long the stream runs.
+    """
+
+    def __init__(self, window: datetime.timedelta, start: HighWaterMark):
+        if window < datetime.timedelta(0):
+            raise ValueError("window must not be negative.")
+
+        self.window = window
+        self.__floor = start.created_at
+        self.__newest = start.created_at
+        self.__ids: Dict[str, datetime.datetime] = {id: start.created_at for id in start.ids}
+        self.__expiry = [(start.created_at, id) for id in start.ids]  # heap of (created_at, id)
+
+    @property
+    def horizon(self) -> datetime.datetime:
+        """Creation time before which every message counts as seen."""
+        return max(self.__floor, self.__newest - self.window)
+
+    def is_seen(self, created_at: datetime.datetime, id: str) -> bool:
+        """Check whether a message was seen, or is behind the horizon."""
+        return created_at < self.horizon or id in self.__ids
+
+    def add(self, created_at: datetime.datetime, id: str) -> None:
+        """Record a message as seen, and forget the ids that fell behind the horizon."""
+        if self.is_seen(created_at, id):
+            return
+        self.__ids[id] = created_at
+        heapq.heappush(self.__expiry, (created_at, id))
+        self.__newest = max(self.__newest, created_at)
+
+        horizon = self.horizon
+        while self.__expiry and self.__expiry[0][0] < horizon:
+            _, expired = heapq.heappop(self.__expiry)
+            del self.__ids[expired]
+
+    def unseen(self, listing: Iterable) -> List:
+        """Get the messages not seen yet, oldest first.
+
+        On a listing walked newest first, iteration stops past the first message behind the horizon, so older pages
+        are never fetched. Listings in any other order are scanned in full.
+        """
+        messages = [msg for msg in _not_behind(listing, self.horizon) if not self.is_seen(msg.created_at, msg.id)]
+        return sorted(reversed(messages), key=lambda msg: msg.created_at)
+
+    def __len__(self) -> int:
+        return len(self.__ids)
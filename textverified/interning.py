@@ -0,0 +1,136 @@
+"""Interning of repeated string values in decoded API objects.
+
+Fields that take few distinct values, such as service names, repeat across thousands of decoded objects.
+The generated `from_api` methods pass these fields through the current `InternTable`, so every occurrence
+of a value shares one `str` object. By default a single process-wide table is used.
+
+Numbers, billing cycle ids and sale ids repeat within a listing too, but an account has no bound on how many
+distinct ones it sees over time, so they are only interned into a table the caller opted into: the
+`intern_table` of a client or of a `PaginatedList`, or any table activated with the `interning` context
+manager. Outside of those they are decoded as-is, and never held by the process-wide table.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional
+import sys
+import threading
+
+
+@dataclass(frozen=True)
+class InternStats:
+    """Memory report of an `InternTable`."""
+
+    unique_values: int
+    """Number of distinct values held by the table."""
+
+    references: int
+    """Number of decoded values that went through the table."""
+
+    bytes_saved: int
+    """Approximate bytes not allocated thanks to sharing, i.e. the size of every repeated occurrence."""
+
+
+class InternTable:
+    """Table of shared string values used while decoding API objects.
+
+    Once `max_size` distinct values are held, new values are returned as-is rather than added, so the table
+    stays bounded even if an interned field turns out to have many distinct values.
+    """
+
+    def __init__(self, max_size: int = 65536):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive.")
+
+        self.max_size = max_size
+        # value -> [shared value, number of references]
+        self.__entries: Dict[str, List] = dict()
+        self.__lock = threading.Lock()
+
+    def intern(self, value: Optional[str]) -> Optional[str]:
+        """Return the shared copy of a value, adding it to the table if needed. None is returned unchanged."""
+        if value is None:
+            return None
+
+        entry = self.__entries.get(value, None)
+        if entry is None:
+            with self.__lock:
+                if len(self.__entries) >= self.max_size:
+                    return value
+                entry = self.__entries.setdefault(value, [value, 0])
+        entry[1] += 1
+        return entry[0]
+
+    def stats(self) -> InternStats:
+        """Report how many values the table holds and how much memory sharing them saved.
+
+        Returns:
+            InternStats: Memory report of the table.
+        """
+        entries = list(self.__entries.values())
+        return InternStats(
+            unique_values=len(entries),
+            references=sum(count for _, count in entries),
+            bytes_saved=sum(sys.getsizeof(value) * (count - 1) for value, count in entries if count > 1),
+        )
+
+    def clear(self) -> None:
+        """Drop every value from the table."""
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+
+_process_table = InternTable()
+_current_table: ContextVar[InternTable] = ContextVar("textverified_intern_table", default=_process_table)
+
+
+def process_intern_table() -> InternTable:
+    """Get the process-wide table, used when no other table is active."""
+    return _process_table
+
+
+def current_intern_table() -> InternTable:
+    """Get the table that decoded values are currently interned into."""
+    return _current_table.get()
+
+
+@contextmanager
+def interning(table: InternTable) -> Iterator[InternTable]:
+    """Intern values decoded inside the block into `table` instead of the process-wide table.
+
+    Example:
+        table = InternTable()
+        with interning(table):
+            rentals = list(client.reservations.list_renewable())
+        print(table.stats().bytes_saved)
+    """
+    token = _current_table.set(table)
+    try:
+        yield table
+    finally:
+        _current_table.reset(token)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a value into the current table. Called by generated `from_api` methods."""
+    return _current_table.get().intern(value)
+
+
+def _as_is(value: Optional[str]) -> Optional[str]:
+    return value
+
+
+def _intern_opt_in(value: Optional[str]) -> Optional[str]:
+    """Intern a value of an opt-in field, if a table other than the process-wide one is active."""
+    table = _current_table.get()
+    return value if table is _process_table else table.intern(value)
+
+
+def _opt_in_interner() -> Callable[[Optional[str]], Optional[str]]:
+    """The `_intern_opt_in` of the current table, for a batch of values. Called by generated `from_api_many` methods."""
+    table = _current_table.get()
+    return _as_is if table is _process_table else table.intern
@@ -0,0 +1,77 @@
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+from .action import _Action, _ActionPerformer
+import threading
+import time
+
+
+class PageCache:
+    """Short-lived cache of paginated API responses, shared by every `PaginatedList` of a client.
+
+    Pages are keyed by the method and href of the `_Action` used to fetch them (plus any query params), so a
+    listing created shortly after another one reuses the pages that were already downloaded and only fetches
+    the pages it has not seen. Entries expire after `ttl` seconds; the least recently used pages are evicted
+    once `max_pages` is reached. Safe to share between threads.
+    """
+
+    def __init__(self, ttl: float = 5.0, max_pages: int = 256):
+        if ttl <= 0:
+            raise ValueError("ttl must be positive.")
+        if max_pages <= 0:
+            raise ValueError("max_pages must be positive.")
+
+        self.ttl = ttl
+        self.max_pages = max_pages
+        self.__pages: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def key(action: _Action, params: Optional[Dict[str, Any]] = None) -> Hashable:
+        """Build the cache key of a page request."""
+        return (action.method.upper(), action.href, tuple(sorted((params or {}).items())))
+
+    def get(self, action: _Action, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """Get a cached page response, or None if it is missing or expired."""
+        key = self.key(action, params)
+        with self.__lock:
+            entry = self.__pages.get(key, None)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if time.monotonic() >= expires_at:
+                del self.__pages[key]
+                return None
+            self.__pages.move_to_end(key)
+            return data
+
+    def put(self, action: _Action, data: Any, params: Optional[Dict[str, Any]] = None) -> None:
+        """Store a page response."""
+        key = self.key(action, params)
+        with self.__lock:
+            self.__pages[key] = (time.monotonic() + self.ttl, data)
+            self.__pages.move_to_end(key)
+            while len(self.__pages) > self.max_pages:
+                self.__pages.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached page."""
+        with self.__lock:
+            self.__pages.clear()
+
+    def __len__(self) -> int:
+        return len(self.__pages)
+
+
+def _fetch_page(api_context: _ActionPerformer, action: _Action, cache: bool = True, **kwargs) -> Any:
+    """Fetch a page response, going through the client's page cache when it has one, unless `cache` is False."""
+    page_cache: Optional[PageCache] = getattr(api_context, "page_cache", None) if cache else None
+    cacheable = page_cache is not None and action.method.upper() == "GET" and set(kwargs) <= {"params"}
+    if not cacheable:
+        return api_context._perform_action(action, **kwargs).data
+
+    params = kwargs.get("params", None)
+    data = page_cache.get(action, params)
+    if data is None:
+        data = api_context._perform_action(action, **kwargs).data
+        page_cache.put(action, data, params)
+    return data
@@ -1,27 +1,195 @@
-from typing import Generic, TypeVar, Callable, Iterator, Optional, List, Union
+from dataclasses import dataclass
+from typing import Generic, TypeVar, Callable, Iterator, Optional, List, Union, Dict, Any
 from .action import _Action, _ActionPerformer
+from .page_cache import _fetch_page
+from .interning import InternTable, interning
+from .high_water_mark import _not_behind
+from enum import Enum
+import bisect
+import datetime
 
 T = TypeVar("T")
 
 
+@dataclass(frozen=True)
+class PaginationCursor:
+    """Serializable position within a paginated listing, used to checkpoint and resume long scans.
+    Obtain one from `PaginatedList.cursor` and rebuild the listing with `PaginatedList.from_cursor`.
+    """
+
+    next_page: Optional[_Action]
+    """Link to the page holding the next item, or None if the listing is exhausted."""
+
+    position: int = 0
+    """Index of the next item within the whole listing."""
+
+    skip: int = 0
+    """Number of items on `next_page` that come before `position` and were already consumed."""
+
+    def to_api(self) -> Dict[str, Any]:
+        """
+        Convert the cursor to a JSON-compatible dictionary.
+        :return: Dictionary representation of the cursor.
+        """
+        return {
+            "nextPage": self.next_page.to_api() if self.next_page is not None else None,
+            "position": self.position,
+            "skip": self.skip,
+        }
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "PaginationCursor":
+        """
+        Create a cursor from a dictionary created by `to_api`.
+        :param data: Dictionary containing the cursor data.
+        :return: PaginationCursor instance.
+        """
+        next_page = data.get("nextPage", None)
+        return cls(
+            next_page=_Action.from_api(next_page) if next_page is not None else None,
+            position=int(data.get("position", 0)),
+            skip=int(data.get("skip", 0)),
+        )
+
+
 class PaginatedList(Generic[T], Iterator[T]):
     """Handles paginated API responses, allowing iteration over items and fetching additional pages as needed.
     You should not need to instantiate this class directly; use the API methods that return it instead.
 
     Supports iteration and indexing, allowing you to access items as if it were a regular list.
     To exhaust all items, iterate over it using `list(paginated_list)` or call `paginated_list.get_all_items()`.
+    Set `intern_table` to an `InternTable` to share repeated string values, numbers and ids included, among this
+    list's items only. Defaults to the `intern_table` of the client, if it has one.
     """
 
     # Consider supporting a union of paginated lists (to allow for returning all renewable and non-renewable reservations in one method call)
 
-    def __init__(self, request_json: dict, parse_item: Callable[[dict], T], api_context: _ActionPerformer):
+    def __init__(
+        self,
+        request_json: dict,
+        parse_item: Callable[[dict], T],
+        api_context: _ActionPerformer,
+        cursor: PaginationCursor = None,
+    ):
         self.parse_item = parse_item
         self.api_context = api_context
 
-        self.__items = [self.parse_item(item) for item in request_json.get("data", [])]
+        # Resumed lists start mid-listing; items already consumed on the first page are dropped
+        skip = cursor.skip if cursor is not None else 0
+        self.__position = cursor.position if cursor is not None else 0
+
+        # Items are kept as raw API data until first accessed, then parsed a whole page at a time
+        self.__items = []
+        self.__unparsed = list(request_json.get("data", [])[skip:])
+
+        # Track where each page starts and how to re-fetch it, so cursors can point into a partially consumed page
+        self.__page_starts = [-skip]
+        self.__page_links = [cursor.next_page if cursor is not None else self.__get_link(request_json, "current")]
+
         self.__set_next_page(request_json)
         self.__current_index = 0
 
+        # Set by from_action, used to push filters down to the server
+        self._request = None
+        self._query_filters = dict()
+
+        # Table that repeated string fields of parsed items are shared through; None uses the process-wide table
+        self.intern_table: Optional[InternTable] = None
+
+        # Whether later pages go through the client's page cache
+        self._cache = True
+
+    @classmethod
+    def from_action(
+        cls,
+        action: _Action,
+        parse_item: Callable[[dict], T],
+        api_context: _ActionPerformer,
+        query_filters: Dict[str, str] = None,
+        cache: bool = True,
+        **kwargs,
+    ) -> "PaginatedList[T]":
+        """Create a paginated list starting at the page referenced by `action`.
+
+        Page links carry the keyset cursor (and any filters) of a listing, so passing a previously saved
+        `next_page` resumes that listing where it left off instead of starting over from the first page.
+
+        Args:
+            action (_Action): The page link to start from, usually taken from `PaginatedList.next_page`.
+            parse_item (Callable[[dict], T]): Function used to parse each item of the listing.
+            api_context (_ActionPerformer): The client used to fetch pages.
+            query_filters (Dict[str, str], optional): Item attributes the endpoint can filter on, mapped to their
+                query param. Used by `where` to push filters down to the server. Defaults to None.
+            cache (bool, optional): Serve pages from the client's page cache, if it has one. Set to False for
+                listings polled for new items, which must always reach the server. Defaults to True.
+            **kwargs: Additional arguments forwarded to the first request, such as query params.
+
+        Returns:
+            PaginatedList[T]: A paginated list starting at the given page.
+        """
+        request_json = _fetch_page(api_context, action, cache=cache, **kwargs)
+
+        # Extra request arguments are not part of the link, so the link alone cannot re-fetch this page
+        cursor = PaginationCursor(next_page=action) if not kwargs else None
+        paginated_list = cls(request_json=request_json, parse_item=parse_item, api_context=api_context, cursor=cursor)
+        paginated_list._request = (action, kwargs)
+        paginated_list._query_filters = dict(query_filters or {})
+        paginated_list._cache = cache
+        return paginated_list
+
+    @classmethod
+    def from_cursor(
+        cls, cursor: PaginationCursor, parse_item: Callable[[dict], T], api_context: _ActionPerformer
+    ) -> "PaginatedList[T]":
+        """Rebuild a paginated list from a cursor saved with `PaginatedList.cursor`.
+
+        Iteration resumes with the first item that had not been consumed when the cursor was taken.
+        Indexing is relative to that item, while further cursors keep counting positions from the original listing.
+
+        Args:
+            cursor (PaginationCursor): The saved cursor.
+            parse_item (Callable[[dict], T]): Function used to parse each item of the listing.
+            api_context (_ActionPerformer): The client used to fetch pages.
+
+        Returns:
+            PaginatedList[T]: A paginated list resuming at the cursor.
+        """
+        if cursor.next_page is None:
+            return cls(request_json={}, parse_item=parse_item, api_context=api_context, cursor=cursor)
+
+        request_json = _fetch_page(api_context, cursor.next_page)
+        return cls(request_json=request_json, parse_item=parse_item, api_context=api_context, cursor=cursor)
+
+    @property
+    def cursor(self) -> PaginationCursor:
+        """A serializable cursor pointing at the next item to be yielded by iteration.
+
+        Save `cursor.to_api()` as a checkpoint during long scans and pass `PaginationCursor.from_api(...)` to
+        `PaginatedList.from_cursor` to continue after a crash or restart.
+
+        Raises:
+            ValueError: If the next item is on a page that cannot be re-fetched (the first page, when the API
+                did not return a link to it). Consume the rest of that page before taking a cursor.
+        """
+        index = self.__current_index
+        if index >= self.__loaded_count():
+            return PaginationCursor(next_page=self.__next_page, position=self.__position + self.__loaded_count())
+
+        page = bisect.bisect_right(self.__page_starts, index) - 1
+        if self.__page_links[page] is None:
+            raise ValueError("Cannot create a cursor inside a page without a link to it; consume the page first.")
+
+        return PaginationCursor(
+            next_page=self.__page_links[page],
+            position=self.__position + index,
+            skip=index - self.__page_starts[page],
+        )
+
+    @property
+    def next_page(self) -> Optional[_Action]:
+        """The link to the next page that has not been fetched yet, or None if all pages were fetched."""
+        return self.__next_page
+
     def __iter__(self) -> Iterator[T]:
         """Iterate over items in the paginated list."""
         self.__current_index = 0
@@ -30,8 +198,10 @@ class PaginatedList(Generic[T], Iterator[T]):
     def __next__(self) -> T:
         """Get the next item, fetching the next page if necessary."""
         # If we're at the end of current items and there's a next page, fetch it
-        if self.__current_index >= len(self.__items) and self.__next_page is not None:
-            self._fetch_next_page()
+        if self.__current_index >= len(self.__items):
+            if not self.__unparsed and self.__next_page is not None:
+                self._fetch_next_page()
+            self.__parse_loaded()
 
         # If we still don't have items, we're done
         if self.__current_index >= len(self.__items):
@@ -56,10 +226,11 @@ class PaginatedList(Generic[T], Iterator[T]):
                 self.get_all_items()
             else:
                 # Fetch pages until we have enough items
-                while self.__next_page is not None and (index.stop is None or index.stop > len(self.__items)):
+                while self.__next_page is not None and (index.stop is None or index.stop > self.__loaded_count()):
                     self._fetch_next_page()
 
             # Return the sliced items
+            self.__parse_loaded()
             return self.__items[index]
 
         elif isinstance(index, int):
@@ -68,9 +239,10 @@ class PaginatedList(Generic[T], Iterator[T]):
                 self.get_all_items()
             else:
                 # Fetch needed pages
-                while self.__next_page is not None and index >= len(self.__items):
+                while self.__next_page is not None and index >= self.__loaded_count():
                     self._fetch_next_page()
 
+            self.__parse_loaded()
             if index >= len(self.__items):
                 raise IndexError("list index out of range")
 
@@ -83,13 +255,55 @@ class PaginatedList(Generic[T], Iterator[T]):
         if self.__next_page is None:
             return
 
-        next_page_json = self.api_context._perform_action(self.__next_page).data
+        next_page_json = _fetch_page(self.api_context, self.__next_page, cache=self._cache)
+        self.__page_starts.append(self.__loaded_count())
+        self.__page_links.append(self.__next_page)
 
-        # Parse next items
-        new_items = [self.parse_item(item) for item in next_page_json.get("data", [])]
-        self.__items.extend(new_items)
+        # Keep next items raw, they are parsed on access
+        self.__unparsed.extend(next_page_json.get("data", []))
         self.__set_next_page(next_page_json)
 
+    def _iter_raw_pages(self) -> Iterator[List[dict]]:
+        """Yield every item of the listing as raw API data, one page at a time.
+
+        Items that were already parsed are converted back with `to_api()`. Pages that were not fetched yet are
+        streamed without being parsed or stored, so the list itself is left unchanged.
+        """
+        if self.__items:
+            yield [item.to_api() for item in self.__items]
+        if self.__unparsed:
+            yield list(self.__unparsed)
+
+        next_page = self.__next_page
+        while next_page is not None:
+            page_json = _fetch_page(self.api_context, next_page, cache=self._cache)
+            yield page_json.get("data", [])
+            next_page = self.__get_link(page_json, "next") if page_json.get("hasNext", False) else None
+
+    def __loaded_count(self) -> int:
+        """Number of items fetched so far, parsed or not."""
+        return len(self.__items) + len(self.__unparsed)
+
+    def __parse_loaded(self) -> None:
+        """Parse all fetched items that have not been parsed yet."""
+        if self.__unparsed:
+            self.__items.extend(self.__parse_many(self.__unparsed))
+            self.__unparsed = []
+
+    def __parse_many(self, items: List[dict]) -> List[T]:
+        """Parse a batch of items, with the batch decoder of the item type when `parse_item` is its `from_api`."""
+        table = self.intern_table if self.intern_table is not None else getattr(self.api_context, "intern_table", None)
+        if table is not None:
+            with interning(table):
+                return self.__parse_batch(items)
+        return self.__parse_batch(items)
+
+    def __parse_batch(self, items: List[dict]) -> List[T]:
+        item_type = getattr(self.parse_item, "__self__", None)
+        if hasattr(item_type, "from_api_many") and self.parse_item == item_type.from_api:
+            return item_type.from_api_many(items)
+        return [self.parse_item(item) for item in items]
+
     def __set_next_page(self, current_page: dict) -> None:
         """Set the next page action based on the current page response."""
         if not current_page.get("hasNext", False):
@@ -100,6 +314,108 @@ class PaginatedList(Generic[T], Iterator[T]):
             if not self.__next_page.href or not self.__next_page.method:
                 self.__next_page = None
 
+    @staticmethod
+    def __get_link(current_page: dict, name: str) -> Optional[_Action]:
+        """Get a usable pagination link from a page response, if present."""
+        link = (current_page.get("links", None) or {}).get(name, None)
+        if not link or not link.get("href", None) or not link.get("method", None):
+            return None
+        return _Action.from_api(link)
+
+    def where(self, predicate: Callable[[T], bool] = None, *, ordered: bool = False, **filters: Any) -> Iterator[T]:
+        """Lazily yield the items matching a predicate and/or attribute filters.
+
+        Keyword filters compare item attributes for equality, e.g. `sms.list().where(to_value="+1234567890")`.
+        Filters the endpoint supports as query params (such as `to`, `reservationId`, `reservationType` or
+        `billingCycleId`) are pushed down to the server: the listing is re-requested with those params, so pages
+        of non-matching items are never downloaded. Filters for server-only params (e.g. `reservation_id` on SMS)
+        are accepted as well when the endpoint supports them.
+
+        Args:
+            predicate (Callable[[T], bool], optional): Function returning True for items to keep. Defaults to None.
+            ordered (bool, optional): Set when the listing is sorted on the values the predicate tests, so that
+                matching items form a single contiguous run (e.g. `created_at > since`). Pagination then stops
+                at the first non-matching item after a match. Defaults to False.
+            **filters: Attribute names and the values they must equal.
+
+        Yields:
+            T: The matching items, in listing order.
+        """
+        source = self
+        pushed = {name: value for name, value in filters.items() if name in self._query_filters}
+        if pushed and self._request is not None:
+            action, kwargs = self._request
+            params = dict(kwargs.get("params", None) or {})
+            for name, value in pushed.items():
+                params[self._query_filters[name]] = value.to_api() if isinstance(value, Enum) else value
+            source = PaginatedList.from_action(
+                action,
+                self.parse_item,
+                self.api_context,
+                query_filters=self._query_filters,
+                cache=self._cache,
+                **dict(kwargs, params=params),
+            )
+            source.intern_table = self.intern_table
+            filters = {name: value for name, value in filters.items() if name not in pushed}
+
+        matched = False
+        for item in source:
+            if (predicate is None or predicate(item)) and all(
+                getattr(item, name) == value for name, value in filters.items()
+            ):
+                matched = True
+                yield item
+            elif ordered and matched:
+                return  # Past the contiguous run of matches, stop fetching pages
+
+    def created_since(self, since: datetime.datetime) -> Iterator[T]:
+        """Lazily yield the items created at or after a timestamp.
+
+        On a listing walked newest first, such as `sms.list(direction=REVERSE)`, pages past the first item older
+        than `since` are never fetched, so checking for new messages costs about one page instead of the whole
+        history. The order is verified as items come in rather than assumed, since the server may ignore
+        `direction`: a listing in any other order is filtered in full.
+
+        Args:
+            since (datetime.datetime): The lower bound on the items' `created_at`.
+
+        Yields:
+            T: The items created at or after `since`, in listing order.
+        """
+        return _not_behind(self, since)
+
+    def take_while(self, predicate: Callable[[T], bool]) -> Iterator[T]:
+        """Lazily yield items while a predicate holds, without fetching pages past the first non-matching item.
+
+        Only stops early if the listing is ordered on what the predicate tests; see `created_since` for a lower bound
+        on creation times that does not depend on the order the server returns.
+
+        Args:
+            predicate (Callable[[T], bool]): Function returning True while iteration should continue.
+
+        Yields:
+            T: Items up to, but not including, the first one for which the predicate is False.
+        """
+        for item in self:
+            if not predicate(item):
+                return
+            yield item
+
+    def to_columns(self, columns: List[str] = None) -> "ColumnarTable":
+        """Export the whole listing as per-field arrays, without building an object per row.
+        Requires numpy; see `textverified.columnar.to_columns` for details.
+
+        Args:
+            columns (List[str], optional): Attribute names to export. Defaults to all fields.
+
+        Returns:
+            ColumnarTable: The exported columns, convertible with `to_pandas()` or `to_arrow()`.
+        """
+        from .columnar import to_columns
+
+        return to_columns(self, columns)
+
     def get_all_items(self) -> List[T]:
         """Get all items in the paginated list, fetching all pages if necessary.
 
@@ -108,4 +424,5 @@ class PaginatedList(Generic[T], Iterator[T]):
         """
         while self.__next_page is not None:
             self._fetch_next_page()
+        self.__parse_loaded()
         return self.__items.copy()
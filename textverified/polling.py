@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import random
+
+
+@dataclass(frozen=True)
+class PollingPolicy:
+    """When to poll while waiting for something to happen: an SMS, a call or a wake request.
+
+    The first poll happens after `first_delay` (immediately by default), then every `interval` seconds. Optionally:
+
+    - During `arrival_window`, a `(start, end)` range of seconds since the wait began in which the awaited event
+      is expected, polls happen every `arrival_interval` seconds instead.
+    - Outside that window, each poll that finds nothing multiplies the interval by `backoff`, up to `max_interval`.
+      The interval is reset once a poll finds something.
+    - Each delay is randomly stretched or shrunk by up to `jitter` (a fraction of it), so that many workers
+      started together do not poll in lockstep.
+
+    Example:
+        # Codes usually arrive 5 to 60 seconds in: poll every 0.5s then, and back off to 30s when idle
+        policy = PollingPolicy(interval=2.0, arrival_window=(5.0, 60.0), arrival_interval=0.5,
+                               backoff=2.0, max_interval=30.0, jitter=0.1)
+        for sms in client.sms.incoming(rental, timeout=300, policy=policy):
+            ...
+    """
+
+    interval: float = 1.0
+    first_delay: float = 0.0
+    arrival_window: Optional[Tuple[float, float]] = None
+    arrival_interval: Optional[float] = None
+    backoff: float = 1.0
+    max_interval: Optional[float] = None
+    jitter: float = 0.0
+
+    def __post_init__(self):
+        if self.interval < 0 or self.first_delay < 0:
+            raise ValueError("interval and first_delay must not be negative.")
+        if self.arrival_window is not None and not 0 <= self.arrival_window[0] <= self.arrival_window[1]:
+            raise ValueError("arrival_window must be a (start, end) range of non-negative seconds.")
+        if self.arrival_interval is not None and self.arrival_interval < 0:
+            raise ValueError("arrival_interval must not be negative.")
+        if self.backoff < 1:
+            raise ValueError("backoff must be at least 1.")
+        if self.max_interval is not None and self.max_interval < self.interval:
+            raise ValueError("max_interval must be at least interval.")
+        if not 0 <= self.jitter < 1:
+            raise ValueError("jitter must be in [0, 1).")
+
+    def schedule(self) -> "PollingSchedule":
+        """Start a new wait following this policy."""
+        return PollingSchedule(self)
+
+
+class PollingSchedule:
+    """Delays between the polls of a single wait, following a `PollingPolicy`."""
+
+    def __init__(self, policy: PollingPolicy):
+        self.policy = policy
+        self.polls = 0
+        self.__interval = policy.interval
+
+    def next_delay(self, elapsed: float, found: bool = False) -> float:
+        """Get the delay in seconds before the next poll.
+
+        Args:
+            elapsed (float): Seconds since the wait began.
+            found (bool, optional): Whether the previous poll found something. Defaults to False.
+
+        Returns:
+            float: Seconds to wait before polling.
+        """
+        policy = self.policy
+        self.polls += 1
+        if self.polls == 1:
+            return self.__jittered(policy.first_delay)
+
+        if found:
+            self.__interval = policy.interval
+
+        window = policy.arrival_window
+        if window is not None and window[0] <= elapsed < window[1]:
+            delay = policy.arrival_interval if policy.arrival_interval is not None else self.__interval
+        else:
+            delay = self.__interval
+            self.__interval *= policy.backoff
+            if policy.max_interval is not None:
+                self.__interval = min(self.__interval, policy.max_interval)
+            if window is not None and elapsed < window[0]:
+                # Do not sleep past the start of the arrival window
+                delay = min(delay, window[0] - elapsed)
+
+        return self.__jittered(delay)
+
+    def __jittered(self, delay: float) -> float:
+        if self.policy.jitter:
+            delay *= 1 + random.uniform(-self.policy.jitter, self.policy.jitter)
+        return delay
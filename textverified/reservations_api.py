@@ -1,4 +1,4 @@
-from .action import _ActionPerformer, _Action
+from .action import _ActionPerformer, _Action, _overrides_given, _reuse_request
 from typing import List, Union
 from .paginated_list import PaginatedList
 from .data import (
@@ -73,35 +73,49 @@ class ReservationsAPI:
         Returns:
             ReservationSaleExpanded: The details of the created rental reservation.
         """
-        data = (
-            NewRentalRequest(
-                allow_back_order_reservations=(
-                    allow_back_order_reservations
-                    if allow_back_order_reservations is not None
-                    else data.allow_back_order_reservations
-                ),
-                always_on=always_on if always_on is not None else data.always_on,
-                area_code_select_option=area_code_select_option or data.area_code_select_option,
-                duration=duration or data.duration,
-                is_renewable=is_renewable if is_renewable is not None else data.is_renewable,
-                number_type=number_type or data.number_type,
-                billing_cycle_id_to_assign_to=billing_cycle_id_to_assign_to or data.billing_cycle_id_to_assign_to,
-                service_name=service_name or data.service_name,
-                capability=capability or data.capability,
-            )
-            if data
-            else NewRentalRequest(
-                allow_back_order_reservations=allow_back_order_reservations,
-                always_on=always_on,
-                area_code_select_option=area_code_select_option,
-                duration=duration,
-                is_renewable=is_renewable,
-                number_type=number_type,
-                billing_cycle_id_to_assign_to=billing_cycle_id_to_assign_to,
-                service_name=service_name,
-                capability=capability,
+        # Send the caller's request as-is when no keyword argument overrides it, reusing its cached JSON body
+        if data is None or _overrides_given(
+            allow_back_order_reservations,
+            always_on,
+            area_code_select_option,
+            duration,
+            is_renewable,
+            number_type,
+            billing_cycle_id_to_assign_to,
+            service_name,
+            capability,
+        ):
+            request = (
+                NewRentalRequest(
+                    allow_back_order_reservations=(
+                        allow_back_order_reservations
+                        if allow_back_order_reservations is not None
+                        else data.allow_back_order_reservations
+                    ),
+                    always_on=always_on if always_on is not None else data.always_on,
+                    area_code_select_option=area_code_select_option or data.area_code_select_option,
+                    duration=duration or data.duration,
+                    is_renewable=is_renewable if is_renewable is not None else data.is_renewable,
+                    number_type=number_type or data.number_type,
+                    billing_cycle_id_to_assign_to=billing_cycle_id_to_assign_to or data.billing_cycle_id_to_assign_to,
+                    service_name=service_name or data.service_name,
+                    capability=capability or data.capability,
+                )
+                if data
+                else NewRentalRequest(
+                    allow_back_order_reservations=allow_back_order_reservations,
+                    always_on=always_on,
+                    area_code_select_option=area_code_select_option,
+                    duration=duration,
+                    is_renewable=is_renewable,
+                    number_type=number_type,
+                    billing_cycle_id_to_assign_to=billing_cycle_id_to_assign_to,
+                    service_name=service_name,
+                    capability=capability,
+                )
             )
-        )
+
+            data = _reuse_request(data, request)
 
         if (
             data is None
@@ -118,7 +132,7 @@ class ReservationsAPI:
             )
 
         action = _Action(method="POST", href="/api/pub/v2/reservations/rental")
-        response = self.client._perform_action(action, json=data.to_api())
+        response = self.client._perform_action(action, body=data.to_json())
 
         # Note - response.data is another action to follow to get Sale details
         action = _Action.from_api(response.data)
@@ -179,31 +193,45 @@ class ReservationsAPI:
                 duration=data.duration,
             )
 
-        data = (
-            RentalPriceCheckRequest(
-                service_name=service_name or data.service_name,
-                area_code=area_code if area_code is not None else data.area_code,
-                number_type=number_type or data.number_type,
-                capability=capability or data.capability,
-                always_on=always_on if always_on is not None else data.always_on,
-                call_forwarding=call_forwarding if call_forwarding is not None else data.call_forwarding,
-                billing_cycle_id_to_assign_to=billing_cycle_id_to_assign_to or data.billing_cycle_id_to_assign_to,
-                is_renewable=is_renewable if is_renewable is not None else data.is_renewable,
-                duration=duration or data.duration,
-            )
-            if data
-            else RentalPriceCheckRequest(
-                service_name=service_name,
-                area_code=area_code,
-                number_type=number_type,
-                capability=capability,
-                always_on=always_on,
-                call_forwarding=call_forwarding,
-                billing_cycle_id_to_assign_to=billing_cycle_id_to_assign_to,
-                is_renewable=is_renewable,
-                duration=duration,
+        # Send the caller's request as-is when no keyword argument overrides it, reusing its cached JSON body
+        if data is None or _overrides_given(
+            service_name,
+            area_code,
+            number_type,
+            capability,
+            always_on,
+            call_forwarding,
+            billing_cycle_id_to_assign_to,
+            is_renewable,
+            duration,
+        ):
+            request = (
+                RentalPriceCheckRequest(
+                    service_name=service_name or data.service_name,
+                    area_code=area_code if area_code is not None else data.area_code,
+                    number_type=number_type or data.number_type,
+                    capability=capability or data.capability,
+                    always_on=always_on if always_on is not None else data.always_on,
+                    call_forwarding=call_forwarding if call_forwarding is not None else data.call_forwarding,
+                    billing_cycle_id_to_assign_to=billing_cycle_id_to_assign_to or data.billing_cycle_id_to_assign_to,
+                    is_renewable=is_renewable if is_renewable is not None else data.is_renewable,
+                    duration=duration or data.duration,
+                )
+                if data
+                else RentalPriceCheckRequest(
+                    service_name=service_name,
+                    area_code=area_code,
+                    number_type=number_type,
+                    capability=capability,
+                    always_on=always_on,
+                    call_forwarding=call_forwarding,
+                    billing_cycle_id_to_assign_to=billing_cycle_id_to_assign_to,
+                    is_renewable=is_renewable,
+                    duration=duration,
+                )
             )
-        )
+
+            data = _reuse_request(data, request)
 
         if (
             not data
@@ -220,7 +248,7 @@ class ReservationsAPI:
             )
 
         action = _Action(method="POST", href="/api/pub/v2/pricing/rentals")
-        response = self.client._perform_action(action, json=data)
+        response = self.client._perform_action(action, body=data.to_json())
 
         return PricingSnapshot.from_api(response.data)
 
@@ -312,10 +340,12 @@ class ReservationsAPI:
             PaginatedList[RenewableRentalCompact]: A paginated list of renewable rental reservations.
         """
         action = _Action(method="GET", href="/api/pub/v2/reservations/rental/renewable")
-        response = self.client._perform_action(action)
 
-        return PaginatedList(
-            request_json=response.data, parse_item=RenewableRentalCompact.from_api, api_context=self.client
+        return PaginatedList.from_action(
+            action,
+            parse_item=RenewableRentalCompact.from_api,
+            api_context=self.client,
+            query_filters={"billing_cycle_id": "billingCycleId"},
         )
 
     def list_nonrenewable(self) -> PaginatedList[NonrenewableRentalCompact]:
@@ -325,11 +355,8 @@ class ReservationsAPI:
             PaginatedList[NonrenewableRentalCompact]: A paginated list of non-renewable rental reservations.
         """
         action = _Action(method="GET", href="/api/pub/v2/reservations/rental/nonrenewable")
-        response = self.client._perform_action(action)
 
-        return PaginatedList(
-            request_json=response.data, parse_item=NonrenewableRentalCompact.from_api, api_context=self.client
-        )
+        return PaginatedList.from_action(action, parse_item=NonrenewableRentalCompact.from_api, api_context=self.client)
 
     def renewable_details(
         self, reservation_id: Union[str, RenewableRentalCompact, RenewableRentalExpanded]
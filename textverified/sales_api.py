@@ -19,11 +19,8 @@ class SalesAPI:
             PaginatedList[ReservationSaleCompact]: A paginated list of sales.
         """
         action = _Action(method="GET", href="/api/pub/v2/sales")
-        response = self.client._perform_action(action)
 
-        return PaginatedList(
-            request_json=response.data, parse_item=ReservationSaleCompact.from_api, api_context=self.client
-        )
+        return PaginatedList.from_action(action, parse_item=ReservationSaleCompact.from_api, api_context=self.client)
 
     def get(self, sale_id: Union[str, ReservationSaleCompact, ReservationSaleExpanded]) -> ReservationSaleExpanded:
         """Retrieve details of a specific sale
@@ -1,5 +1,5 @@
-from .action import _ActionPerformer, _Action
-from typing import List, Union, Iterator
+from .action import _Action
+from typing import AsyncIterator, Union, Iterator
 from .data import (
     Sms,
     Reservation,
@@ -10,21 +10,28 @@ from .data import (
     VerificationCompact,
     VerificationExpanded,
     ReservationType,
+    KeysetPaginationDirectionality,
 )
 from .paginated_list import PaginatedList
-import time
+from .feed_api import _FeedAPI, _Poller, _sleep
+from .sms_watcher import SmsWatcher
+from .sms_store import SmsStore
+from .polling import PollingPolicy
+import asyncio
 import datetime
+import threading
 
 
-class SMSApi:
+class SMSApi(_FeedAPI):
     """API endpoints related to SMS
     This includes listing SMS messages for rentals and verifications, as well as handling incoming SMS.
 
     Note that SMS messages are only received by rentals that are awake or always-on.
     """
 
-    def __init__(self, client: _ActionPerformer):
-        self.client = client
+    _name = "sms"
+    _href = "/api/pub/v2/sms"
+    _item = Sms
 
     def list(
         self,
@@ -40,6 +47,9 @@ class SMSApi:
         *,
         to_number: str = None,
         reservation_type: ReservationType = None,
+        direction: KeysetPaginationDirectionality = None,
+        cursor: _Action = None,
+        cache: bool = True,
     ) -> PaginatedList[Sms]:
         """List SMS messages for rentals and verifications associated with this account.
 
@@ -50,62 +60,84 @@ class SMSApi:
             data (Union[Reservation, NonrenewableRentalCompact, NonrenewableRentalExpanded, RenewableRentalCompact, RenewableRentalExpanded, VerificationCompact, VerificationExpanded], optional): A rental or verification object to get SMS messages for. The phone number will be extracted from this object. Defaults to None.
             to_number (str, optional): Filter SMS messages by the destination phone number. Cannot be used together with data parameter. Defaults to None.
             reservation_type (ReservationType, optional): Filter SMS messages by reservation type (renewable, non-renewable, verification). Cannot be used when providing a data object. Defaults to None.
+            direction (KeysetPaginationDirectionality, optional): Order in which pages are walked, REVERSE for the newest messages first. Not part of the documented API, so the server may ignore it; use `PaginatedList.created_since` to stop at a lower bound regardless of the order returned. Defaults to None (server default, forward).
+            cursor (_Action, optional): A page link from a previous listing (`PaginatedList.next_page`) to resume from. The link already encodes the filters and direction of that listing, so it cannot be combined with other arguments. Defaults to None.
+            cache (bool, optional): Serve pages from the client's page cache, if it has one. Polling for new messages always bypasses it. Defaults to True.
 
         Raises:
-            ValueError: If both data and to_number are provided, or if reservation_type is specified when using a rental/verification object.
+            ValueError: If both data and to_number are provided, if reservation_type is specified when using a rental/verification object, or if cursor is combined with other arguments.
 
         Returns:
             PaginatedList[Sms]: A paginated list of SMS messages matching the specified criteria.
         """
 
-        # Extract needed data from provided objects
-        reservation_id = None
-        if data and isinstance(
-            data,
-            (
-                NonrenewableRentalCompact,
-                NonrenewableRentalExpanded,
-                RenewableRentalCompact,
-                RenewableRentalExpanded,
-                VerificationCompact,
-                VerificationExpanded,
-            ),
-        ):
-            if to_number:
-                raise ValueError("Cannot specify both rental/verification data and to_number.")
-            to_number = data.number
+        # Resume from a saved keyset cursor
+        if cursor is not None:
+            if data or to_number or reservation_type is not None or direction is not None:
+                raise ValueError("Cannot specify filters or direction when resuming from a cursor.")
+            return PaginatedList.from_action(cursor, parse_item=Sms.from_api, api_context=self.client, cache=cache)
+
+        return self._list(data, to_number, reservation_type, direction, cache)
+
+    def watcher(
+        self,
+        *,
+        polling_interval: float = 1.0,
+        reservation_type: ReservationType = None,
+        since: datetime.datetime = None,
+        policy: PollingPolicy = None,
+    ) -> SmsWatcher:
+        """Create a watcher delivering the incoming SMS of many numbers, polling the account-wide feed once per tick.
+
+        Prefer this over one `incoming` call per number when watching many rentals at once: `incoming` costs a
+        request (and a blocked thread) per number per poll, the watcher a single request per tick.
+
+        Args:
+            polling_interval (float, optional): Time in seconds between polls of the background thread. Defaults to 1.0.
+            reservation_type (ReservationType, optional): Only watch SMS of this reservation type. Defaults to None (all).
+            since (datetime.datetime, optional): Only deliver messages created after this timestamp. Defaults to the client's checkpoint of the feed, left by an earlier watcher, or datetime.datetime.now() if there is none.
+            policy (PollingPolicy, optional): When the background thread polls. Overrides polling_interval. Defaults to None (poll immediately, then every polling_interval seconds).
+
+        Returns:
+            SmsWatcher: The watcher, not yet started. Use it as a context manager, or call `start`/`stop`.
+        """
+        return SmsWatcher(
+            self.client,
+            polling_interval=polling_interval,
+            reservation_type=reservation_type,
+            since=since,
+            policy=policy,
+        )
+
+    def store(self, path: str = ":memory:") -> SmsStore:
+        """Open a local, indexed sqlite copy of the SMS of this account.
+
+        Call `SmsStore.sync` to fetch the messages that arrived since the last sync, then query the store locally.
+
+        Args:
+            path (str, optional): Path of the sqlite database, created if missing. Defaults to ":memory:".
 
-            if reservation_type is not None:
-                raise ValueError("Cannot specify reservation_type when using a rental or verification object.")
+        Returns:
+            SmsStore: The store.
+        """
+        return SmsStore(self.client, path)
 
-        if isinstance(
+    def __wake(self, data) -> None:
+        """Wake the rental of an incoming SMS wait before polling."""
+        if data and isinstance(
             data,
             (
-                Reservation,
                 NonrenewableRentalCompact,
                 NonrenewableRentalExpanded,
                 RenewableRentalCompact,
                 RenewableRentalExpanded,
             ),
         ):
-            reservation_id = data.id
-
-        # Construct url params
-        params = dict()
-        if to_number:
-            params["to"] = to_number
-
-        if reservation_id:
-            params["reservationId"] = reservation_id
-
-        if isinstance(reservation_type, ReservationType):
-            params["reservationType"] = reservation_type.to_api()
-
-        # Construct and perform the action
-        action = _Action(method="GET", href="/api/pub/v2/sms")
-        response = self.client._perform_action(action, params=params)
-
-        return PaginatedList(request_json=response.data, parse_item=Sms.from_api, api_context=self.client)
+            self.client.wake_requests.wait_for_number_wake(data)  # suspicious in terms of typing
+        elif data and isinstance(data, (VerificationCompact, VerificationExpanded)):
+            raise ValueError("Cannot wake a verification.")
+        else:
+            raise ValueError("Must provide reservation data to auto-wake wake the number.")
 
     def incoming(
         self,
@@ -124,12 +156,17 @@ class SMSApi:
         polling_interval: float = 1.0,
         wake_number: bool = False,
         since: datetime.datetime = None,
+        policy: PollingPolicy = None,
     ) -> Iterator[Sms]:
         """Wait for and yield incoming SMS messages in real-time.
 
         This method polls for new SMS messages and yields them as they arrive. It will wait up to the specified timeout
         for new messages. The polling stops after the first batch of new messages is received or the timeout is reached.
 
+        Each poll walks the listing newest first and stops at the first message it has already seen, so a poll costs
+        requests for new messages only. The position reached is kept per stream on the client, so the next call with
+        the same filters resumes from it and also yields the messages that arrived in between.
+
         Note: Only rentals that are awake or always-on can receive SMS messages. Use wake_number=True to automatically
         wake a rental before polling for messages.
 
@@ -140,7 +177,8 @@ class SMSApi:
             timeout (float, optional): Maximum time in seconds to wait for incoming messages. If negative, no timeout will be applied. Defaults to 10.0.
             polling_interval (float, optional): Time in seconds between polling attempts. Defaults to 1.0.
             wake_number (bool, optional): Whether to automatically wake the rental before polling. Only works with rental objects, not verifications. Defaults to False.
-            since (datetime.datetime, optional): Only yield messages created after this timestamp. Defaults to datetime.datetime.now().
+            since (datetime.datetime, optional): Only yield messages created after this timestamp. Messages already yielded by an earlier call are skipped regardless. Defaults to where the last call on the same stream stopped, or datetime.datetime.now() for a new stream.
+            policy (PollingPolicy, optional): When to poll, for backoff, jitter or faster polls while a message is expected. Overrides polling_interval. Defaults to None (poll immediately, then every polling_interval seconds).
         Raises:
             ValueError: If wake_number is True but no rental data is provided, or if attempting to wake a verification.
 
@@ -149,43 +187,119 @@ class SMSApi:
         """
 
         if wake_number:
-            if data and isinstance(
-                data,
-                (
-                    NonrenewableRentalCompact,
-                    NonrenewableRentalExpanded,
-                    RenewableRentalCompact,
-                    RenewableRentalExpanded,
-                ),
-            ):
-                self.client.wake_requests.wait_for_number_wake(data)  # suspicious in terms of typing
-            elif data and isinstance(data, (VerificationCompact, VerificationExpanded)):
-                raise ValueError("Cannot wake a verification.")
-            else:
-                raise ValueError("Must provide reservation data to auto-wake wake the number.")
-
-        if timeout < 0:
-            timeout = float("inf")
-
-        if since is None:
-            since = datetime.datetime.now(datetime.timezone.utc)
-        if not isinstance(since, datetime.datetime):
-            raise ValueError("since must be a datetime object.")
-
-        earliest_msg = since - datetime.timedelta(seconds=polling_interval)  # allow some leniency
-        start_time = time.monotonic()
-
-        already_seen = set()
+            self.__wake(data)
+
+        policy = policy or PollingPolicy(interval=polling_interval)
+        poller = _Poller([self._feed(data, to_number, reservation_type, since, policy)], policy, timeout)
+
+        # wait up to [timeout] seconds for a NEW message
+        yield from poller.run(_sleep, first_batch=True)
+
+    def stream(
+        self,
+        data: Union[
+            NonrenewableRentalCompact,
+            NonrenewableRentalExpanded,
+            RenewableRentalCompact,
+            RenewableRentalExpanded,
+            VerificationCompact,
+            VerificationExpanded,
+        ] = None,
+        *,
+        to_number: str = None,
+        reservation_type: ReservationType = None,
+        timeout: float = -1,
+        stop: threading.Event = None,
+        polling_interval: float = 1.0,
+        dedup_window: float = 300.0,
+        since: datetime.datetime = None,
+        policy: PollingPolicy = None,
+    ) -> Iterator[Sms]:
+        """Yield incoming SMS messages continuously, until stopped or timed out.
+
+        Unlike `incoming`, which returns after the first batch of new messages, this keeps polling for as long as it
+        is iterated, which suits long-running listeners. Messages are yielded once each, oldest first. Like
+        `incoming`, it resumes from and updates the position kept per stream on the client.
+
+        Messages are deduplicated over a rolling window of `dedup_window` seconds behind the newest message seen, so
+        memory stays flat however long the stream runs, and messages that show up late in the listing are still
+        yielded if no older than the window.
+
+        Args:
+            data (Union[NonrenewableRentalCompact, NonrenewableRentalExpanded, RenewableRentalCompact, RenewableRentalExpanded, VerificationCompact, VerificationExpanded], optional): A rental or verification object to monitor for incoming SMS. Defaults to None.
+            to_number (str, optional): Filter incoming SMS by destination phone number. Cannot be used together with data parameter. Defaults to None.
+            reservation_type (ReservationType, optional): Filter incoming SMS by reservation type. Cannot be used when providing a data object. Defaults to None.
+            timeout (float, optional): Time in seconds after which the stream ends. If negative, no timeout will be applied. Defaults to -1.
+            stop (threading.Event, optional): Ends the stream once set, even while waiting between polls. Defaults to None.
+            polling_interval (float, optional): Time in seconds between polling attempts. Defaults to 1.0.
+            dedup_window (float, optional): Time in seconds behind the newest message during which ids are remembered. Defaults to 300.0.
+            since (datetime.datetime, optional): Only yield messages created after this timestamp. Messages already yielded by an earlier call are skipped regardless. Defaults to where the last call on the same stream stopped, or datetime.datetime.now() for a new stream.
+            policy (PollingPolicy, optional): When to poll, for backoff when idle, jitter or faster polls while messages are expected. Overrides polling_interval. Defaults to None (poll immediately, then every polling_interval seconds).
+
+        Raises:
+            ValueError: If dedup_window is negative.
+
+        Yields:
+            Sms: New SMS messages as they arrive.
+        """
+        if stop is None:
+            stop = threading.Event()
+
+        policy = policy or PollingPolicy(interval=polling_interval)
+        feed = self._feed(data, to_number, reservation_type, since, policy, dedup_window)
+        yield from _Poller([feed], policy, timeout).run(stop.wait)
+
+    async def aincoming(
+        self,
+        data: Union[
+            NonrenewableRentalCompact,
+            NonrenewableRentalExpanded,
+            RenewableRentalCompact,
+            RenewableRentalExpanded,
+            VerificationCompact,
+            VerificationExpanded,
+        ] = None,
+        *,
+        to_number: str = None,
+        reservation_type: ReservationType = None,
+        timeout: float = 10.0,
+        polling_interval: float = 1.0,
+        wake_number: bool = False,
+        since: datetime.datetime = None,
+        policy: PollingPolicy = None,
+    ) -> AsyncIterator[Sms]:
+        """Asynchronously wait for and yield incoming SMS messages, without blocking the event loop.
+
+        Behaves like `incoming`, sharing its deduplication, `since` handling and per-stream position, but waits
+        between polls with `asyncio.sleep` and runs each poll (and the optional wake) on the client's `executor`,
+        since the HTTP client is synchronous. Many waits can therefore share a single event loop; polls that overlap
+        run concurrently up to the client's `async_workers`, each thread with its own HTTP session.
+
+        Example:
+            async for sms in client.sms.aincoming(verification, timeout=120):
+                print(sms.parsed_code)
+
+        Args:
+            data (Union[NonrenewableRentalCompact, NonrenewableRentalExpanded, RenewableRentalCompact, RenewableRentalExpanded, VerificationCompact, VerificationExpanded], optional): A rental or verification object to monitor for incoming SMS. Defaults to None.
+            to_number (str, optional): Filter incoming SMS by destination phone number. Cannot be used together with data parameter. Defaults to None.
+            reservation_type (ReservationType, optional): Filter incoming SMS by reservation type. Cannot be used when providing a data object. Defaults to None.
+            timeout (float, optional): Maximum time in seconds to wait for incoming messages. If negative, no timeout will be applied. Defaults to 10.0.
+            polling_interval (float, optional): Time in seconds between polling attempts. Defaults to 1.0.
+            wake_number (bool, optional): Whether to automatically wake the rental before polling. Only works with rental objects, not verifications. Defaults to False.
+            since (datetime.datetime, optional): Only yield messages created after this timestamp. Messages already yielded by an earlier call are skipped regardless. Defaults to where the last call on the same stream stopped, or datetime.datetime.now() for a new stream.
+            policy (PollingPolicy, optional): When to poll, for backoff, jitter or faster polls while a message is expected. Overrides polling_interval. Defaults to None (poll immediately, then every polling_interval seconds).
+        Raises:
+            ValueError: If wake_number is True but no rental data is provided, or if attempting to wake a verification.
+
+        Yields:
+            Sms: New SMS messages as they arrive.
+        """
+        if wake_number:
+            await asyncio.get_running_loop().run_in_executor(self.client.executor, self.__wake, data)
+
+        policy = policy or PollingPolicy(interval=polling_interval)
+        poller = _Poller([self._feed(data, to_number, reservation_type, since, policy)], policy, timeout)
 
         # wait up to [timeout] seconds for a NEW message
-        while time.monotonic() - start_time < timeout:
-            time.sleep(polling_interval)  # Polling interval
-            all_messages = self.list(data=data, to_number=to_number, reservation_type=reservation_type)
-            unseen_messages = list(
-                filter(lambda msg: msg.id not in already_seen and msg.created_at > earliest_msg, all_messages)
-            )  # TODO: collapsing this iterator costs a few extra api requests, optimize if possible
-            if unseen_messages:
-                for msg in unseen_messages:
-                    already_seen.add(msg.id)
-                    yield msg
-                return  # Exit after first batch of unseen messages
+        async for msg in poller.arun(self.client.executor, first_batch=True):
+            yield msg
@@ -0,0 +1,275 @@
+"""Local copy of the SMS of an account, kept in sync incrementally.
+
+Lookups such as "all SMS for a number since a time" or "latest code of a reservation" are answered from an
+indexed sqlite database instead of listing SMS through the API each time. `SmsStore.sync` fetches only the
+messages newer than those already stored, walking the listing newest first and stopping at the last message
+of the previous sync.
+"""
+
+from .action import _ActionPerformer
+from .data import (
+    Sms,
+    NonrenewableRentalCompact,
+    NonrenewableRentalExpanded,
+    RenewableRentalCompact,
+    RenewableRentalExpanded,
+    VerificationCompact,
+    VerificationExpanded,
+    ReservationType,
+    KeysetPaginationDirectionality,
+)
+from .high_water_mark import HighWaterMark
+from typing import Iterable, List, Optional, Union
+import datetime
+import json
+import sqlite3
+import threading
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sms (
+    id TEXT PRIMARY KEY,
+    to_value TEXT NOT NULL,
+    reservation_id TEXT,
+    created_at TEXT NOT NULL,
+    encrypted INTEGER NOT NULL,
+    from_value TEXT,
+    sms_content TEXT,
+    parsed_code TEXT
+);
+CREATE INDEX IF NOT EXISTS sms_to_value ON sms (to_value, created_at);
+CREATE INDEX IF NOT EXISTS sms_reservation_id ON sms (reservation_id, created_at);
+CREATE INDEX IF NOT EXISTS sms_created_at ON sms (created_at);
+CREATE INDEX IF NOT EXISTS sms_parsed_code ON sms (parsed_code);
+CREATE TABLE IF NOT EXISTS sync_marks (
+    stream TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    ids TEXT NOT NULL
+);
+"""
+
+_COLUMNS = "id, to_value, created_at, encrypted, from_value, sms_content, parsed_code"
+
+_BEGINNING = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _to_column(value: datetime.datetime) -> str:
+    """Timestamps are stored as UTC ISO-8601 strings of fixed width, so they sort chronologically."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value.astimezone(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f+00:00")
+
+
+def _from_row(row: tuple) -> Sms:
+    id, to_value, created_at, encrypted, from_value, sms_content, parsed_code = row
+    return Sms(
+        id=id,
+        to_value=to_value,
+        created_at=datetime.datetime.fromisoformat(created_at),
+        encrypted=bool(encrypted),
+        from_value=from_value,
+        sms_content=sms_content,
+        parsed_code=parsed_code,
+    )
+
+
+class SmsStore:
+    """Indexed sqlite copy of the SMS of an account. Safe to share between threads.
+
+    Messages are indexed by destination number, reservation, creation time and parsed code. The reservation of a
+    message is only known when it was synced through a rental or verification, since SMS listings do not include it.
+
+    Example:
+        store = client.sms.store("sms.db")
+        store.sync()  # first sync downloads the history, later ones only new messages
+        recent = store.messages(to_number="+12223334444", since=one_hour_ago)
+        code = store.latest_code(reservation_id=rental.id)
+    """
+
+    def __init__(self, client: _ActionPerformer, path: str = ":memory:"):
+        """
+        Args:
+            client (_ActionPerformer): The client to sync with.
+            path (str, optional): Path of the sqlite database, created if missing. Defaults to ":memory:".
+        """
+        self.client = client
+        self.path = path
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        self.__lock = threading.Lock()
+        with self.__lock, self.__connection:
+            self.__connection.executescript(_SCHEMA)
+
+    def add(self, messages: Iterable[Sms], reservation_id: str = None) -> None:
+        """Store messages, replacing stored copies with the same id.
+
+        Args:
+            messages (Iterable[Sms]): The messages to store.
+            reservation_id (str, optional): The reservation the messages belong to. Defaults to None (unknown, or kept from a stored copy).
+        """
+        rows = [
+            (
+                msg.id,
+                msg.to_value,
+                reservation_id,
+                _to_column(msg.created_at),
+                int(msg.encrypted),
+                msg.from_value,
+                msg.sms_content,
+                msg.parsed_code,
+            )
+            for msg in messages
+        ]
+        with self.__lock, self.__connection:
+            self.__connection.executemany(
+                "INSERT INTO sms (id, to_value, reservation_id, created_at, encrypted, from_value, sms_content, "
+                "parsed_code) VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (id) DO UPDATE SET "
+                "to_value = excluded.to_value, reservation_id = COALESCE(excluded.reservation_id, reservation_id), "
+                "created_at = excluded.created_at, encrypted = excluded.encrypted, from_value = excluded.from_value, "
+                "sms_content = excluded.sms_content, parsed_code = excluded.parsed_code",
+                rows,
+            )
+
+    def sync(
+        self,
+        data: Union[
+            NonrenewableRentalCompact,
+            NonrenewableRentalExpanded,
+            RenewableRentalCompact,
+            RenewableRentalExpanded,
+            VerificationCompact,
+            VerificationExpanded,
+        ] = None,
+        *,
+        to_number: str = None,
+        reservation_type: ReservationType = None,
+    ) -> int:
+        """Fetch the messages that arrived since the last sync of the same filters, and store them.
+
+        The first sync of a set of filters downloads all matching messages. Messages synced through a rental or
+        verification are recorded as belonging to it.
+
+        Args:
+            data (Union[NonrenewableRentalCompact, NonrenewableRentalExpanded, RenewableRentalCompact, RenewableRentalExpanded, VerificationCompact, VerificationExpanded], optional): A rental or verification to sync the messages of. Defaults to None.
+            to_number (str, optional): Only sync messages sent to this number. Cannot be used together with data parameter. Defaults to None.
+            reservation_type (ReservationType, optional): Only sync messages of this reservation type. Cannot be used when providing a data object. Defaults to None.
+
+        Returns:
+            int: Number of new messages stored.
+        """
+        stream = json.dumps(
+            [
+                data.id if data is not None else None,
+                to_number,
+                reservation_type.to_api() if reservation_type is not None else None,
+            ]
+        )
+        mark = self.__mark(stream)
+        messages = mark.unseen(
+            self.client.sms.list(
+                data=data,
+                to_number=to_number,
+                reservation_type=reservation_type,
+                direction=KeysetPaginationDirectionality.REVERSE,
+                cache=False,
+            )
+        )
+        if not messages:
+            return 0
+
+        for msg in messages:
+            mark = mark.advance(msg.created_at, msg.id)
+        self.add(messages, reservation_id=data.id if data is not None else None)
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO sync_marks (stream, created_at, ids) VALUES (?, ?, ?)",
+                (stream, _to_column(mark.created_at), json.dumps(sorted(mark.ids))),
+            )
+        return len(messages)
+
+    def __mark(self, stream: str) -> HighWaterMark:
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT created_at, ids FROM sync_marks WHERE stream = ?", (stream,)
+            ).fetchone()
+        if row is None:
+            return HighWaterMark(created_at=_BEGINNING)
+        return HighWaterMark(created_at=datetime.datetime.fromisoformat(row[0]), ids=frozenset(json.loads(row[1])))
+
+    def messages(
+        self,
+        *,
+        to_number: str = None,
+        reservation_id: str = None,
+        parsed_code: str = None,
+        since: datetime.datetime = None,
+        until: datetime.datetime = None,
+        limit: int = None,
+    ) -> List[Sms]:
+        """Query stored messages, oldest first.
+
+        Args:
+            to_number (str, optional): Only messages sent to this number. Defaults to None.
+            reservation_id (str, optional): Only messages of this reservation. Defaults to None.
+            parsed_code (str, optional): Only messages with this parsed code. Defaults to None.
+            since (datetime.datetime, optional): Only messages created at or after this timestamp. Defaults to None.
+            until (datetime.datetime, optional): Only messages created before this timestamp. Defaults to None.
+            limit (int, optional): Return at most this many of the newest matching messages. Defaults to None (all).
+
+        Returns:
+            List[Sms]: The matching messages.
+        """
+        conditions, params = self.__conditions(to_number, reservation_id, parsed_code, since, until)
+        query = f"SELECT {_COLUMNS} FROM sms{conditions} ORDER BY created_at DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self.__lock:
+            rows = self.__connection.execute(query, params).fetchall()
+        return [_from_row(row) for row in reversed(rows)]
+
+    def latest_code(self, *, to_number: str = None, reservation_id: str = None) -> Optional[Sms]:
+        """Get the newest stored message with a parsed code.
+
+        Args:
+            to_number (str, optional): Only messages sent to this number. Defaults to None.
+            reservation_id (str, optional): Only messages of this reservation. Defaults to None.
+
+        Returns:
+            Optional[Sms]: The newest message with a code, or None if there is none.
+        """
+        conditions, params = self.__conditions(to_number, reservation_id, None, None, None)
+        conditions += " AND parsed_code IS NOT NULL" if conditions else " WHERE parsed_code IS NOT NULL"
+        with self.__lock:
+            row = self.__connection.execute(
+                f"SELECT {_COLUMNS} FROM sms{conditions} ORDER BY created_at DESC LIMIT 1", params
+            ).fetchone()
+        return _from_row(row) if row is not None else None
+
+    @staticmethod
+    def __conditions(to_number, reservation_id, parsed_code, since, until):
+        clauses, params = [], []
+        for clause, value in (
+            ("to_value = ?", to_number),
+            ("reservation_id = ?", reservation_id),
+            ("parsed_code = ?", parsed_code),
+            ("created_at >= ?", _to_column(since) if since is not None else None),
+            ("created_at < ?", _to_column(until) if until is not None else None),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def close(self) -> None:
+        """Close the database."""
+        with self.__lock:
+            self.__connection.close()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__connection.execute("SELECT COUNT(*) FROM sms").fetchone()[0]
+
+    def __enter__(self) -> "SmsStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
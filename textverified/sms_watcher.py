@@ -0,0 +1,27 @@
+from .data import Sms, KeysetPaginationDirectionality
+from .feed_watcher import _FeedWatcher
+from typing import Iterable
+
+
+class SmsWatcher(_FeedWatcher):
+    """Watches any number of phone numbers with a single polling loop over the account-wide SMS feed.
+
+    Each tick lists the SMS of the account once, newest first and only down to the messages already seen, then
+    hands every new message to the subscribers of its destination number. The number of requests per tick does
+    not depend on how many numbers are watched, and numbers can be added or removed while the watcher runs.
+
+    Call `poll` to run a single tick yourself, or `start` (or use the watcher as a context manager) to poll from
+    a background thread following its `PollingPolicy`.
+
+    Example:
+        with client.sms.watcher() as watcher:
+            messages = watcher.watch(rental)
+            sms = messages.get(timeout=60)
+    """
+
+    _name = "sms"
+
+    def _list(self) -> Iterable[Sms]:
+        return self.client.sms.list(
+            reservation_type=self.reservation_type, direction=KeysetPaginationDirectionality.REVERSE, cache=False
+        )
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from .action import _ActionPerformer, _Action, _ActionResponse
 from .account_api import AccountAPI
 from .billing_cycle_api import BillingCycleAPI
@@ -11,8 +11,13 @@ from .sms_api import SMSApi
 from .verifications_api import VerificationsAPI
 from .wake_api import WakeAPI
 from .call_api import CallAPI
+from .page_cache import PageCache
+from .checkpoints import CheckpointStore
+from .interning import InternTable
+from concurrent.futures import ThreadPoolExecutor
 import requests
 import datetime
+import threading
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import dateutil.parser
@@ -37,12 +42,34 @@ class BearerToken:
 
 @dataclass(frozen=False)
 class TextVerified(_ActionPerformer):
-    """API Context for interacting with the Textverified API."""
+    """API Context for interacting with the Textverified API.
+
+    Set `page_cache_ttl` (in seconds) to share fetched pages between the paginated lists of this client,
+    so listings repeated within that window reuse already downloaded pages.
+
+    Set `checkpoints` to a `FileCheckpointStore` or `SqliteCheckpointStore` to keep the position of SMS and call
+    consumers (`sms.incoming`, `sms.stream`, `sms.watcher()`, `calls.incoming`, `calls.inbound`, `calls.watcher()`)
+    across restarts. By default it is kept in memory.
+
+    Set `intern_table` to an `InternTable` to also share repeated numbers and ids among the items listed by this
+    client. Only service names are interned by default, into a process-wide table.
+
+    Async consumers (`sms.aincoming`) run their blocking requests on a pool of `async_workers` threads dedicated
+    to this client, started on first use, so at most that many of their polls are in flight at once, whatever the
+    size of the event loop's default executor. Each thread sending requests, including watcher threads, gets its
+    own `requests.Session`, since sessions are not thread-safe.
+
+    Call `close`, or use the client as a context manager, to stop the pool and close the sessions.
+    """
 
     api_key: str
     api_username: str
     base_url: str = "https://www.textverified.com"
     user_agent: str = "TextVerified-Python-Client/0.1.0"
+    page_cache_ttl: Optional[float] = None
+    checkpoints: Optional[CheckpointStore] = None
+    async_workers: int = 4
+    intern_table: Optional[InternTable] = None
 
     @property
     def account(self) -> AccountAPI:
@@ -83,19 +110,68 @@ class TextVerified(_ActionPerformer):
     def __post_init__(self):
         self.bearer = None
         self.base_url = self.base_url.rstrip("/")
+        self.page_cache = PageCache(ttl=self.page_cache_ttl) if self.page_cache_ttl else None
+        if self.checkpoints is None:
+            self.checkpoints = CheckpointStore()
+        if self.async_workers < 1:
+            raise ValueError("async_workers must be at least 1.")
 
-        # Mount session with basic retry strategy for 429 and 5xx errors
-        self.session = requests.Session()
+        self.__executor: Optional[ThreadPoolExecutor] = None
+        self.__local = threading.local()
+        self.__sessions: List[requests.Session] = []
+        self.__lock = threading.Lock()
 
-        retry_strategy = Retry(
-            total=3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            backoff_factor=1,  # 1, 2, 4s
-        )
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The pool of `async_workers` threads running the requests of async consumers, started on first use."""
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=self.async_workers, thread_name_prefix="textverified-async"
+                )
+            return self.__executor
+
+    @property
+    def session(self) -> requests.Session:
+        """The HTTP session of the calling thread."""
+        session = getattr(self.__local, "session", None)
+        if session is None:
+            # Mount session with basic retry strategy for 429 and 5xx errors
+            session = requests.Session()
+
+            retry_strategy = Retry(
+                total=3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                backoff_factor=1,  # 1, 2, 4s
+            )
+
+            adapter = HTTPAdapter(max_retries=retry_strategy)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self.__local.session = session
+            with self.__lock:
+                self.__sessions.append(session)
+        return session
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+    def close(self) -> None:
+        """Stop the thread pool of async consumers, waiting for running requests, and close every HTTP session.
+
+        The client stays usable: later requests open new sessions, and async consumers start a new pool.
+        """
+        with self.__lock:
+            executor, self.__executor = self.__executor, None
+            sessions, self.__sessions = self.__sessions, []
+            self.__local = threading.local()
+        if executor is not None:
+            executor.shutdown()
+        for session in sessions:
+            session.close()
+
+    def __enter__(self) -> "TextVerified":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def refresh_bearer(self):
         """Refresh the bearer token, if expired. Called automatically before performing actions."""
@@ -113,12 +189,21 @@ class TextVerified(_ActionPerformer):
             data = response.json()
             self.bearer = BearerToken(token=data["token"], expires_at=dateutil.parser.parse(data["expiresAt"]))
 
-    def _perform_action(self, action: _Action, **kwargs) -> _ActionResponse:
+    def _perform_action(self, action: _Action, body: bytes = None, **kwargs) -> _ActionResponse:
         """
         Perform an API action and return the result.
         :param action: The action to perform
+        :param body: An already encoded JSON request body, such as the cached encoding of a request object
         :return: Dictionary containing the API response
         """
+        # Any write may change listings, drop cached pages rather than serve stale data
+        if self.page_cache is not None and action.method.upper() != "GET":
+            self.page_cache.clear()
+
+        if body is not None:
+            kwargs["data"] = body
+            kwargs["headers"] = {**(kwargs.get("headers", None) or {}), "Content-Type": "application/json"}
+
         if "://" in action.href and not action.href.startswith(self.base_url):
             return self.__perform_action_external(action.method, action.href, **kwargs)
         else:
@@ -127,13 +212,13 @@ class TextVerified(_ActionPerformer):
                 href = f"{self.base_url}{action.href}"
             return self.__perform_action_internal(action.method, href, **kwargs)
 
-    def __perform_action_internal(self, method: str, href: str, **kwargs) -> _ActionResponse:
+    def __perform_action_internal(self, method: str, href: str, headers: dict = None, **kwargs) -> _ActionResponse:
         """Internal action performance with authorization"""
         # Check if bearer token is set and valid
         self.refresh_bearer()
 
         # Prepare and perform the request
-        headers = {"Authorization": f"Bearer {self.bearer.token}", "User-Agent": self.user_agent}
+        headers = {**(headers or {}), "Authorization": f"Bearer {self.bearer.token}", "User-Agent": self.user_agent}
 
         # Allow unverified certificates for localhost
         verify = not href.startswith("http://localhost") and not href.startswith("https://localhost")
@@ -143,13 +228,13 @@ class TextVerified(_ActionPerformer):
         TextVerified.__raise_for_status(method, href, response)
         return _ActionResponse(data=response.json() if response.text else {}, headers=response.headers)
 
-    def __perform_action_external(self, method: str, href: str, **kwargs) -> _ActionResponse:
+    def __perform_action_external(self, method: str, href: str, headers: dict = None, **kwargs) -> _ActionResponse:
         """External action performance without authorization"""
         # Allow unverified certificates for localhost
         verify = not href.startswith("http://localhost") and not href.startswith("https://localhost")
 
         response = self.session.request(
-            method=method, url=href, headers={"User-Agent": self.user_agent}, verify=verify, **kwargs
+            method=method, url=href, headers={**(headers or {}), "User-Agent": self.user_agent}, verify=verify, **kwargs
         )
 
         TextVerified.__raise_for_status(method, href, response)
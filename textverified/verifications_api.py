@@ -1,4 +1,4 @@
-from .action import _ActionPerformer, _Action
+from .action import _ActionPerformer, _Action, _overrides_given, _reuse_request
 from typing import List, Union
 from .paginated_list import PaginatedList
 from .data import (
@@ -51,31 +51,37 @@ class VerificationsAPI:
             VerificationExpanded: The details of the created verification.
         """
 
-        data = (
-            NewVerificationRequest(
-                area_code_select_option=(
-                    area_code_select_option if area_code_select_option is not None else data.area_code_select_option
-                ),
-                carrier_select_option=(
-                    carrier_select_option if carrier_select_option is not None else data.carrier_select_option
-                ),
-                service_name=service_name or data.service_name,
-                capability=capability or data.capability,
-                service_not_listed_name=(
-                    service_not_listed_name if service_not_listed_name is not None else data.service_not_listed_name
-                ),
-                max_price=max_price if max_price is not None else data.max_price,
-            )
-            if data
-            else NewVerificationRequest(
-                area_code_select_option=area_code_select_option,
-                carrier_select_option=carrier_select_option,
-                service_name=service_name,
-                capability=capability,
-                service_not_listed_name=service_not_listed_name,
-                max_price=max_price,
+        # Send the caller's request as-is when no keyword argument overrides it, reusing its cached JSON body
+        if data is None or _overrides_given(
+            area_code_select_option, carrier_select_option, service_name, capability, service_not_listed_name, max_price
+        ):
+            request = (
+                NewVerificationRequest(
+                    area_code_select_option=(
+                        area_code_select_option if area_code_select_option is not None else data.area_code_select_option
+                    ),
+                    carrier_select_option=(
+                        carrier_select_option if carrier_select_option is not None else data.carrier_select_option
+                    ),
+                    service_name=service_name or data.service_name,
+                    capability=capability or data.capability,
+                    service_not_listed_name=(
+                        service_not_listed_name if service_not_listed_name is not None else data.service_not_listed_name
+                    ),
+                    max_price=max_price if max_price is not None else data.max_price,
+                )
+                if data
+                else NewVerificationRequest(
+                    area_code_select_option=area_code_select_option,
+                    carrier_select_option=carrier_select_option,
+                    service_name=service_name,
+                    capability=capability,
+                    service_not_listed_name=service_not_listed_name,
+                    max_price=max_price,
+                )
             )
-        )
+
+            data = _reuse_request(data, request)
 
         if not data or not data.service_name or not data.capability:
             raise ValueError("All required fields must be provided: service_name and capability.")
@@ -86,7 +92,7 @@ class VerificationsAPI:
             )
 
         action = _Action(method="POST", href="/api/pub/v2/verifications")
-        response = self.client._perform_action(action, json=data.to_api())
+        response = self.client._perform_action(action, body=data.to_json())
 
         # Note - response.data is another action to follow to get Verification details
 
@@ -136,23 +142,27 @@ class VerificationsAPI:
                 number_type=NumberType.VOIP if data.capability == ReservationCapability.VOICE else NumberType.MOBILE,
             )
 
-        data = (
-            VerificationPriceCheckRequest(
-                service_name=service_name or data.service_name,
-                area_code=area_code if area_code is not None else data.area_code,
-                carrier=carrier if carrier is not None else data.carrier,
-                number_type=number_type or data.number_type,
-                capability=capability or data.capability,
-            )
-            if data
-            else VerificationPriceCheckRequest(
-                service_name=service_name,
-                area_code=area_code,
-                carrier=carrier,
-                number_type=number_type,
-                capability=capability,
+        # Send the caller's request as-is when no keyword argument overrides it, reusing its cached JSON body
+        if data is None or _overrides_given(service_name, area_code, carrier, number_type, capability):
+            request = (
+                VerificationPriceCheckRequest(
+                    service_name=service_name or data.service_name,
+                    area_code=area_code if area_code is not None else data.area_code,
+                    carrier=carrier if carrier is not None else data.carrier,
+                    number_type=number_type or data.number_type,
+                    capability=capability or data.capability,
+                )
+                if data
+                else VerificationPriceCheckRequest(
+                    service_name=service_name,
+                    area_code=area_code,
+                    carrier=carrier,
+                    number_type=number_type,
+                    capability=capability,
+                )
             )
-        )
+
+            data = _reuse_request(data, request)
 
         if (
             data is None
@@ -167,7 +177,7 @@ class VerificationsAPI:
             )
 
         action = _Action(method="POST", href="/api/pub/v2/pricing/verifications")
-        response = self.client._perform_action(action, json=data.to_api())
+        response = self.client._perform_action(action, body=data.to_json())
 
         return PricingSnapshot.from_api(response.data)
 
@@ -206,11 +216,8 @@ class VerificationsAPI:
         """
 
         action = _Action(method="GET", href="/api/pub/v2/verifications")
-        response = self.client._perform_action(action)
 
-        return PaginatedList(
-            request_json=response.data, parse_item=VerificationCompact.from_api, api_context=self.client
-        )
+        return PaginatedList.from_action(action, parse_item=VerificationCompact.from_api, api_context=self.client)
 
     def cancel(self, verification_id: Union[str, VerificationCompact, VerificationExpanded]) -> bool:
         """Cancel an active verification.
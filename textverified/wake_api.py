@@ -10,6 +10,7 @@ from .data import (
     WakeResponse,
     UsageWindowEstimateRequest,
 )
+from .polling import PollingPolicy
 import time
 import datetime
 
@@ -152,6 +153,7 @@ class WakeAPI:
             str, RenewableRentalCompact, RenewableRentalExpanded, NonrenewableRentalCompact, NonrenewableRentalExpanded
         ],
         poll_frequency: float = 5.0,
+        policy: PollingPolicy = None,
     ) -> WakeResponse:
         """Create a wake request and wait for the number to become active.
 
@@ -161,6 +163,7 @@ class WakeAPI:
         Args:
             reservation_id (Union[str, RenewableRentalCompact, RenewableRentalExpanded, NonrenewableRentalCompact, NonrenewableRentalExpanded]): The ID or instance of the reservation to wake and wait for.
             poll_frequency (float): The frequency (in seconds) to poll for the wake request status. Estimated usage window may change after wake request creation. Default is 5 seconds.
+            policy (PollingPolicy, optional): When to poll for the wake request status, for backoff or jitter. Overrides poll_frequency. Defaults to None (every poll_frequency seconds).
 
         Raises:
             ValueError: If reservation_id is not valid or if the wake request creation fails.
@@ -172,10 +175,10 @@ class WakeAPI:
         if not wake_response:
             raise ValueError("Failed to create wake request.")
 
-        return self.wait_for_wake_request(wake_response, poll_frequency=poll_frequency)
+        return self.wait_for_wake_request(wake_response, poll_frequency=poll_frequency, policy=policy)
 
     def wait_for_wake_request(
-        self, wake_request_id: Union[str, WakeResponse], poll_frequency: float = 5.0
+        self, wake_request_id: Union[str, WakeResponse], poll_frequency: float = 5.0, policy: PollingPolicy = None
     ) -> WakeResponse:
         """Wait for an existing wake request to complete and become active.
 
@@ -186,6 +189,7 @@ class WakeAPI:
         Args:
             wake_request_id (Union[str, WakeResponse]): The ID or instance of the wake request to wait for.
             poll_frequency (float): The frequency (in seconds) to poll for the wake request status. Estimated usage window may change after wake request creation.
+            policy (PollingPolicy, optional): When to poll for the wake request status, for backoff or jitter. Overrides poll_frequency. Defaults to None (every poll_frequency seconds).
 
         Raises:
             ValueError: If wake_request_id is not valid or if the wake request is not properly scheduled.
@@ -207,12 +211,16 @@ class WakeAPI:
         ):
             raise ValueError("Wake request must be scheduled with a valid usage window.")
 
+        # The wake request was just fetched, so the first poll waits a full interval by default
+        schedule = (policy or PollingPolicy(interval=poll_frequency, first_delay=poll_frequency)).schedule()
+        start_time = time.monotonic()
+
         # Wait until the usage window starts
         while datetime.datetime.now(datetime.timezone.utc) < wake_request_id.usage_window_start:
             seconds_till_start = (
                 wake_request_id.usage_window_start - datetime.datetime.now(datetime.timezone.utc)
             ).total_seconds()
-            time.sleep(min(seconds_till_start, poll_frequency))
+            time.sleep(min(seconds_till_start, schedule.next_delay(time.monotonic() - start_time)))
             wake_request_id = self.get(wake_request_id)
 
         return wake_request_id
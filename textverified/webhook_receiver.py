@@ -0,0 +1,344 @@
+"""Embeddable receiver of the webhooks TextVerified sends to your server.
+
+TextVerified POSTs each subscribed event as JSON, signed with HMAC-SHA512 and your webhook secret, and retries
+with exponential backoff until the server answers 200. `WebhookReceiver` verifies the signature, parses the event
+into its dataclass, drops redeliveries of events it already accepted, and hands the rest to handlers on a bounded
+pool of worker threads. When the pool is saturated it answers 503, so TextVerified retries the delivery later
+instead of the server queueing without limit.
+
+The receiver is a WSGI application, `WebhookReceiver.asgi` is the same receiver as an ASGI application, and
+`WebhookReceiver.listen` serves it standalone from a threaded HTTP server.
+
+Example:
+    receiver = WebhookReceiver(secret="whsec_...")
+
+    @receiver.on(SMS_RECEIVED)
+    def on_sms(event):
+        print(event.data.to_value, event.data.parsed_code)
+
+    with receiver:
+        receiver.listen(port=8080)
+        ...
+"""
+
+from . import data
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import queue
+import threading
+
+SMS_RECEIVED = "v2.sms.received"
+RESERVATION_CREATED = "v2.reservation.created"
+BACKORDER_FULFILLED = "v2.rental.backorder.fulfilled"
+BILLING_CYCLE_RENEWED = "v2.rental.billingcycle.renewed"
+BILLING_CYCLE_EXPIRED = "v2.rental.billingcycle.expired"
+
+# Event name to the name of its dataclass, resolved on first use so the webhook dataclasses load lazily
+EVENT_TYPES = {
+    SMS_RECEIVED: "WebhookEventSmsWebhookEvent",
+    RESERVATION_CREATED: "WebhookEventReservationCreatedWebhookEvent",
+    BACKORDER_FULFILLED: "WebhookEventBackOrderReservationWebhookEvent",
+    BILLING_CYCLE_RENEWED: "WebhookEventBillingCycleWebhookEvent",
+    BILLING_CYCLE_EXPIRED: "WebhookEventBillingCycleWebhookEvent",
+}
+
+SIGNATURE_HEADER = "X-Webhook-Signature"
+_SIGNATURE_PREFIX = "HMAC-SHA512="
+
+_STATUS_TEXT = {
+    200: "200 OK",
+    400: "400 Bad Request",
+    401: "401 Unauthorized",
+    405: "405 Method Not Allowed",
+    413: "413 Payload Too Large",
+    503: "503 Service Unavailable",
+}
+
+_STOP = object()
+
+
+class WebhookReceiver:
+    """Verifies, parses, deduplicates and dispatches webhook events. Safe to share between threads.
+
+    Handlers run on the receiver's worker threads after the delivery was answered, so a failing handler does
+    not make TextVerified retry; its exception is kept in `last_error`. Events are deduplicated by id over the
+    last `dedup_size` accepted events.
+    """
+
+    def __init__(
+        self,
+        secret: str = None,
+        *,
+        allow_unsigned: bool = False,
+        workers: int = 4,
+        max_pending: int = 100,
+        submit_timeout: float = 1.0,
+        dedup_size: int = 10_000,
+        max_body_size: int = 1 << 20,
+    ):
+        """
+        Args:
+            secret (str, optional): Webhook secret (whsec_...) to verify signatures with. Required unless allow_unsigned is set. Defaults to None.
+            allow_unsigned (bool, optional): Accept deliveries without verifying their signature when no secret is given. Anyone who can reach the receiver can then forge events, so only use it behind a proxy that verifies them. Defaults to False.
+            workers (int, optional): Number of worker threads running handlers. Defaults to 4.
+            max_pending (int, optional): Number of accepted events waiting for a worker before deliveries are refused with 503. Defaults to 100.
+            submit_timeout (float, optional): Time in seconds a WSGI or standalone delivery waits for room in the queue before being refused. ASGI deliveries never wait. Defaults to 1.0.
+            dedup_size (int, optional): Number of recent event ids remembered to drop redeliveries. Defaults to 10_000.
+            max_body_size (int, optional): Largest accepted request body, in bytes. Defaults to 1 MiB.
+        """
+        if secret is None and not allow_unsigned:
+            raise ValueError("A webhook secret is required, unless unsigned deliveries are allowed explicitly.")
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1.")
+        if submit_timeout < 0:
+            raise ValueError("submit_timeout must not be negative.")
+        if dedup_size < 1:
+            raise ValueError("dedup_size must be at least 1.")
+
+        self.secret = secret
+        self.workers = workers
+        self.submit_timeout = submit_timeout
+        self.dedup_size = dedup_size
+        self.max_body_size = max_body_size
+        self.last_error: Optional[Exception] = None
+        """Last exception raised by a handler."""
+
+        self.__handlers: Dict[str, List[Callable[[Any], None]]] = dict()
+        self.__seen: "OrderedDict[str, None]" = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self.__threads: List[threading.Thread] = []
+        self.__server: Optional[ThreadingHTTPServer] = None
+
+    def on(self, event: str = "*", handler: Callable[[Any], None] = None):
+        """Register a handler of an event, or of every event with "*". Usable as a decorator.
+
+        Args:
+            event (str, optional): Name of the event, such as SMS_RECEIVED. Defaults to "*" (every event).
+            handler (Callable[[Any], None], optional): Called with the parsed event, such as a WebhookEventSmsWebhookEvent. Defaults to None, returning a decorator.
+        """
+        if event != "*" and event not in EVENT_TYPES:
+            raise ValueError(f"Unknown webhook event: {event!r}")
+
+        def register(handler: Callable[[Any], None]) -> Callable[[Any], None]:
+            with self.__lock:
+                self.__handlers.setdefault(event, []).append(handler)
+            return handler
+
+        return register(handler) if handler is not None else register
+
+    def verify(self, body: bytes, signature: Optional[str]) -> bool:
+        """Check the X-Webhook-Signature header of a delivery against its raw body. Always true if unsigned deliveries are allowed."""
+        if self.secret is None:
+            return True
+        if not signature or not signature.startswith(_SIGNATURE_PREFIX):
+            return False
+        digest = hmac.new(self.secret.encode(), body, hashlib.sha512).digest()
+        expected = base64.b64encode(digest).decode()
+        return hmac.compare_digest(signature[len(_SIGNATURE_PREFIX) :].strip(), expected)
+
+    @staticmethod
+    def parse(body: bytes) -> Any:
+        """Parse a delivery into the dataclass of its event, or None for an event unknown to this version.
+
+        Raises:
+            ValueError: If the body is not a webhook event.
+        """
+        try:
+            payload = json.loads(body)
+            type_name = EVENT_TYPES.get(payload["event"], None)
+            if type_name is None:
+                return None
+            return getattr(data, type_name).from_api(payload)
+        except (KeyError, TypeError, AttributeError, ValueError) as e:
+            raise ValueError(f"Malformed webhook event: {e}") from e
+
+    def receive(self, body: bytes, signature: Optional[str], timeout: float = None) -> int:
+        """Handle one delivery: verify, parse, deduplicate and queue it for the handlers.
+
+        Args:
+            body (bytes): The raw request body.
+            signature (Optional[str]): The X-Webhook-Signature header.
+            timeout (float, optional): Time in seconds to wait for room in the queue. Defaults to None (submit_timeout).
+
+        Returns:
+            int: HTTP status to answer with. 200 when accepted, already accepted or of an unknown event, 401 for a bad signature, 400 for a malformed event, 503 when the workers are saturated.
+        """
+        if not self.verify(body, signature):
+            return 401
+        try:
+            event = self.parse(body)
+        except ValueError:
+            return 400
+        if event is None:
+            # Acknowledge events of newer API versions, so they are not retried until webhooks get disabled
+            return 200
+
+        # Claim the id before queueing, so concurrent redeliveries of one event are not both accepted
+        with self.__lock:
+            if event.id in self.__seen:
+                self.__seen.move_to_end(event.id)
+                return 200
+            self.__seen[event.id] = None
+            if len(self.__seen) > self.dedup_size:
+                self.__seen.popitem(last=False)
+        self.start()
+        try:
+            self.__queue.put(event, timeout=self.submit_timeout if timeout is None else timeout)
+        except queue.Full:
+            # Forget the id, so the retry of this delivery is accepted
+            with self.__lock:
+                self.__seen.pop(event.id, None)
+            return 503
+        return 200
+
+    def __call__(self, environ: dict, start_response: Callable) -> List[bytes]:
+        """WSGI application."""
+        if environ.get("REQUEST_METHOD") != "POST":
+            status = 405
+        else:
+            try:
+                length = int(environ.get("CONTENT_LENGTH") or 0)
+            except ValueError:
+                length = -1
+            if length < 0 or length > self.max_body_size:
+                status = 413
+            else:
+                body = environ["wsgi.input"].read(length)
+                status = self.receive(body, environ.get("HTTP_X_WEBHOOK_SIGNATURE"))
+        start_response(_STATUS_TEXT[status], [("Content-Type", "text/plain"), ("Content-Length", "0")])
+        return []
+
+    async def asgi(self, scope: dict, receive: Callable, send: Callable) -> None:
+        """ASGI application."""
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    self.start()
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    # Stopping joins the worker threads, which must not block the event loop
+                    await asyncio.get_running_loop().run_in_executor(None, self.stop)
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        status = 405 if scope.get("method") != "POST" else None
+        chunks, size = [], 0
+        while status is None:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_size:
+                status = 413
+                break
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                signature = None
+                for name, value in scope.get("headers", ()):
+                    if name.lower() == SIGNATURE_HEADER.lower().encode():
+                        signature = value.decode("latin-1")
+                # Never block the event loop: a full queue is refused immediately
+                status = self.receive(b"".join(chunks), signature, timeout=0)
+        await send({"type": "http.response.start", "status": status, "headers": [(b"content-length", b"0")]})
+        await send({"type": "http.response.body", "body": b""})
+
+    def listen(self, host: str = "127.0.0.1", port: int = 8080) -> Tuple[str, int]:
+        """Serve the receiver from a threaded HTTP server on a background thread, until `stop`.
+
+        Args:
+            host (str, optional): Interface to bind. Defaults to "127.0.0.1".
+            port (int, optional): Port to bind, 0 for any free port. Defaults to 8080.
+
+        Returns:
+            Tuple[str, int]: The address the server is bound to.
+        """
+        if self.__server is not None:
+            raise RuntimeError("The receiver is already listening.")
+        self.start()
+        self.__server = ThreadingHTTPServer((host, port), _request_handler(self))
+        self.__server.daemon_threads = True
+        threading.Thread(target=self.__server.serve_forever, name="textverified-webhook-server", daemon=True).start()
+        return self.__server.server_address[:2]
+
+    def start(self) -> "WebhookReceiver":
+        """Start the worker threads. Does nothing if already started; deliveries start them on demand."""
+        with self.__lock:
+            if not self.__threads:
+                for i in range(self.workers):
+                    thread = threading.Thread(target=self.__work, name=f"textverified-webhook-{i}", daemon=True)
+                    thread.start()
+                    self.__threads.append(thread)
+        return self
+
+    def join(self) -> None:
+        """Wait until every accepted event has been handled."""
+        self.__queue.join()
+
+    def stop(self, timeout: float = None) -> None:
+        """Stop the standalone server, then the workers once they handled the accepted events."""
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
+        with self.__lock:
+            threads, self.__threads = self.__threads, []
+        for _ in threads:
+            self.__queue.put(_STOP)
+        for thread in threads:
+            thread.join(timeout)
+
+    def __work(self) -> None:
+        while True:
+            event = self.__queue.get()
+            try:
+                if event is _STOP:
+                    return
+                with self.__lock:
+                    handlers = self.__handlers.get(event.event, []) + self.__handlers.get("*", [])
+                for handler in handlers:
+                    try:
+                        handler(event)
+                    except Exception as e:
+                        self.last_error = e
+            finally:
+                self.__queue.task_done()
+
+    def __enter__(self) -> "WebhookReceiver":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def _request_handler(receiver: WebhookReceiver) -> type:
+    class _RequestHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+            except ValueError:
+                length = -1
+            if length < 0 or length > receiver.max_body_size:
+                status = 413
+            else:
+                status = receiver.receive(self.rfile.read(length), self.headers.get(SIGNATURE_HEADER))
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    return _RequestHandler